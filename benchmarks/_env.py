@@ -0,0 +1,50 @@
+# benchmarks/_env.py
+"""
+Common setup for the ad-hoc benchmarks (run from the repo root):
+    python -m benchmarks.bench_conversation
+
+- puts the repo root on sys.path
+- core.speech_engine / core.voice_effects need pygame / edge-tts and an
+  audio device; when they cannot be imported silent stand-ins are used
+  (benchmarks never talk or play sounds)
+- sandbox() points the memory and nlp history files at a scratch folder,
+  so benchmark runs never touch config/
+"""
+
+import os
+import sys
+import tempfile
+import types
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+try:
+    import core.speech_engine  # noqa: F401
+except Exception:
+    _speech = types.ModuleType("core.speech_engine")
+    _speech.speak = lambda *a, **k: None
+    _speech.jarvis_fx = None
+    sys.modules["core.speech_engine"] = _speech
+
+try:
+    import core.voice_effects  # noqa: F401
+except Exception:
+    _fx = types.ModuleType("core.voice_effects")
+    _fx.jarvis_fx = None
+    _fx.attach_overlay = lambda overlay: None
+    sys.modules["core.voice_effects"] = _fx
+
+
+def sandbox() -> str:
+    """Redirect memory.json / nlp history writes to a temp folder."""
+    folder = tempfile.mkdtemp(prefix="jarvis_bench_")
+    from core import memory_engine
+    import core.nlp_engine as nlp
+    memory_engine.memory.flush()
+    memory_engine.memory.file_path = os.path.join(folder, "memory.json")
+    nlp.flush()
+    nlp.HISTORY_PATH = os.path.join(folder, "nlp_history.txt")
+    nlp.SNAPSHOT_PATH = os.path.join(folder, "nlp_model.json")
+    return folder
@@ -0,0 +1,82 @@
+# benchmarks/bench_conversation.py
+"""
+JarvisConversation throughput on a generated utterance corpus:
+sentiment + topic analysis against the old per-word regex scorer, and
+full respond() calls.      python -m benchmarks.bench_conversation
+"""
+
+import random
+import re
+import time
+
+from benchmarks import _env
+
+_env.sandbox()
+
+from core.conversation_core import JarvisConversation  # noqa: E402
+from core.text_analysis import SENTIMENT_WORDS, TOPIC_ALIASES  # noqa: E402
+
+TEMPLATES = [
+    "i feel {mood} today",
+    "i don't feel {mood} about {topic}",
+    "can you explain {topic} to me",
+    "what is {topic} and why does it matter",
+    "tell me more about {topic}",
+    "open notepad and search {topic}",
+    "honestly i'm {mood} and {mood2}",
+    "my {topic} project is going {mood}",
+]
+
+
+def corpus(n=600, seed=7):
+    rng = random.Random(seed)
+    moods = [w for words in SENTIMENT_WORDS.values() for w in words] + ["fine", "okay", "tired"]
+    topics = [a for _, aliases in TOPIC_ALIASES for a in aliases] + ["weather", "cricket", "exams"]
+    return [
+        rng.choice(TEMPLATES).format(mood=rng.choice(moods), mood2=rng.choice(moods), topic=rng.choice(topics))
+        for _ in range(n)
+    ]
+
+
+# the pre-change scorer: one re.search per word per call
+def _legacy_search(words, text):
+    return any(re.search(rf"\b{re.escape(w)}\b", text, flags=re.IGNORECASE) for w in words)
+
+
+def legacy_analysis(t):
+    s = SENTIMENT_WORDS
+    score = 0
+    score -= 2 * _legacy_search(s["sad"], t) + 3 * _legacy_search(s["angry"], t)
+    score -= 2 * _legacy_search(s["anxious"], t) + _legacy_search(s["bored"], t)
+    score += 3 * _legacy_search(s["happy"], t)
+    for key, aliases in TOPIC_ALIASES:
+        if _legacy_search(aliases, t):
+            return score, key
+    return score, None
+
+
+def rate(fn, texts, rounds=5):
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for t in texts:
+            fn(t)
+        best = min(best, time.perf_counter() - started)
+    return len(texts) / best
+
+
+def main():
+    texts = corpus()
+    conv = JarvisConversation()
+    legacy = rate(legacy_analysis, texts)
+    current = rate(lambda t: (conv._estimate_sentiment(t), conv._detect_topic(t)), texts)
+    # respond() also queues nlp learning and memory mutations → fewer rounds
+    responses = rate(conv.respond, texts, rounds=2)
+    print(f"utterances: {len(texts)}")
+    print(f"sentiment+topic (old per-word regex): {legacy:,.0f} utterances/s")
+    print(f"sentiment+topic (current):            {current:,.0f} utterances/s")
+    print(f"respond():                            {responses:,.0f} utterances/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/bench_imports.py
+"""
+Startup import cost of the skill modules that command_handler and
+sleep_manager now load through lazy_import.
+    python -m benchmarks.bench_imports
+
+Each module is imported in a fresh `python -X importtime` process, which
+is what the old try/except imports paid while command_handler loaded
+(also when the import then failed). The lazy path pays only for
+core.lazy_import plus creating the proxies.
+"""
+
+import os
+import subprocess
+import sys
+
+from benchmarks import _env
+
+DEFERRED = [
+    ("core.document_reader", "document_reader"),
+    ("core.video_reader", "video_reader"),
+    ("core.music_stream", "music_stream"),
+    ("core.face_emotion", "FaceEmotionAnalyzer"),
+]
+
+
+def importtime(code: str, module: str):
+    """(cumulative seconds for `module`, error line or None) in a fresh interpreter."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=_env.ROOT, capture_output=True, text=True,
+                          env=dict(os.environ, PYTHONPATH=_env.ROOT))
+    cumulative, other = None, []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            other.append(line)
+        elif line.rstrip().endswith("| " + module):
+            cumulative = int(line.split("|")[1]) / 1e6
+    error = other[-1] if proc.returncode != 0 and other else None
+    return cumulative, error
+
+
+def main():
+    eager_total = 0.0
+    print("eager (old try/except at import)")
+    for module, _ in DEFERRED:
+        seconds, error = importtime(f"import {module}", module)
+        eager_total += seconds or 0.0
+        status = "ok" if error is None else f"failed: {error}"
+        print(f"  {module:22s} {seconds or 0.0:7.3f} s   {status}")
+    print(f"  {'total':22s} {eager_total:7.3f} s")
+
+    proxies = "; ".join(f"lazy_import({m!r}, {a!r})" for m, a in DEFERRED)
+    lazy, error = importtime(f"from core.lazy_import import lazy_import; {proxies}", "core.lazy_import")
+    print("\nlazy (proxies only)")
+    print(f"  {'core.lazy_import':22s} {lazy or 0.0:7.3f} s   {'ok' if error is None else error}")
+
+
+if __name__ == "__main__":
+    main()
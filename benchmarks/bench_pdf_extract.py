@@ -0,0 +1,78 @@
+# benchmarks/bench_pdf_extract.py
+"""
+PDF text extraction: pages per second against worker (core) count, on a
+generated text-heavy PDF.      python -m benchmarks.bench_pdf_extract [pages]
+
+workers=1 is the serial path; the others shard page ranges over
+core.pdf_extract's process pool (pool start-up included, as for a real
+document, since the pool shuts down after each extraction).
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks import _env  # noqa: F401
+
+from core import pdf_extract  # noqa: E402
+
+LINES_PER_PAGE = 45
+WORDS = ("jarvis reads every page of the document while the listener waits "
+         "for the next command and the summary cache keeps results").split()
+
+
+def write_pdf(path, pages):
+    """Text-heavy PDF: LINES_PER_PAGE Helvetica lines per page."""
+    objs = [b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [%s] /Count %d >>"
+            % (b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(pages)), pages),
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    for p in range(pages):
+        lines = []
+        for ln in range(LINES_PER_PAGE):
+            words = [WORDS[(p * 7 + ln * 3 + k) % len(WORDS)] for k in range(12)]
+            lines.append(b"(%s) Tj 0 -15 Td" % " ".join(words).encode("latin-1"))
+        stream = b"BT /F1 10 Tf 50 760 Td " + b" ".join(lines) + b" ET"
+        objs.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                    b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * p))
+        objs.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objs, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objs) + 1)
+    out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objs) + 1, xref)
+    with open(path, "wb") as f:
+        f.write(bytes(out))
+
+
+def rate(path, workers, pages, rounds=3):
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        out = pdf_extract.extract_pages(path, workers=workers)
+        best = min(best, time.perf_counter() - started)
+        assert len(out) == pages
+    return pages / best
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    path = os.path.join(tempfile.mkdtemp(prefix="jarvis_bench_"), "doc.pdf")
+    write_pdf(path, pages)
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, cores})      # >cores shows oversubscription
+    print(f"pages: {pages}  ({os.path.getsize(path) // 1024} KiB, {cores} cores)")
+    serial = None
+    for w in counts:
+        r = rate(path, w, pages)
+        serial = serial or r
+        print(f"workers={w:<2} {r:8,.0f} pages/s   x{r / serial:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# benchmarks/bench_sleep.py
+"""
+Sleep manager / state store latency and idle wakeups.
+    python -m benchmarks.bench_sleep
+
+- wake latency: time from a state.MODE write to a thread blocked in
+  state.wait_for() (and to a subscriber) seeing it, against a 50 ms
+  polling loop
+- sleep entry: how late after LAST_INTERACTION + SLEEP_TIMEOUT the
+  manager switches to "sleep", against the old 1 s polling loop
+- idle wakeups and process CPU time while a countdown runs
+"""
+
+import statistics
+import threading
+import time
+
+from benchmarks import _env
+
+_env.sandbox()
+
+import core.state as state  # noqa: E402
+import core.sleep_manager as sleep_manager  # noqa: E402
+
+TIMEOUT = 0.3          # scaled-down SLEEP_TIMEOUT
+
+
+def _ms(values):
+    values = sorted(values)
+    p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+    return f"median {statistics.median(values) * 1000:7.2f} ms   p95 {p95 * 1000:7.2f} ms"
+
+
+# ---------------- wake latency ----------------
+def wake_wait_for(trials=200):
+    out = []
+    for _ in range(trials):
+        state.MODE = "sleep"
+        seen = []
+        t = threading.Thread(target=lambda: seen.append(
+            (state.wait_for("MODE", lambda m: m == "active", 2.0), time.perf_counter())))
+        t.start()
+        time.sleep(0.002)
+        started = time.perf_counter()
+        state.MODE = "active"
+        t.join()
+        out.append(seen[0][1] - started)
+    return out
+
+
+def wake_subscriber(trials=200):
+    out = []
+    mark = {}
+    unsubscribe = state.subscribe("MODE", lambda n, o, new, v: mark.setdefault(new, time.perf_counter()))
+    try:
+        for _ in range(trials):
+            state.MODE = "sleep"
+            mark.clear()
+            started = time.perf_counter()
+            state.MODE = "active"
+            out.append(mark["active"] - started)
+    finally:
+        unsubscribe()
+    return out
+
+
+def wake_polling(trials=40, interval=0.05):
+    out = []
+    for _ in range(trials):
+        state.MODE = "sleep"
+        seen = []
+
+        def _poll():
+            while state.MODE != "active":
+                time.sleep(interval)
+            seen.append(time.perf_counter())
+
+        t = threading.Thread(target=_poll)
+        t.start()
+        time.sleep(interval * 0.37)     # land somewhere inside a poll interval
+        started = time.perf_counter()
+        state.MODE = "active"
+        t.join()
+        out.append(seen[0] - started)
+    return out
+
+
+# ---------------- sleep entry ----------------
+def _legacy_loop(stop):
+    # the pre-change SleepManager._loop
+    while not stop.is_set():
+        last = state.LAST_INTERACTION
+        if last is not None and state.MODE != "sleep" and time.time() - last >= TIMEOUT:
+            state.MODE = "sleep"
+        time.sleep(1)
+
+
+def sleep_entry(legacy=False, trials=6):
+    out = []
+    entered = {}
+    unsubscribe = state.subscribe("MODE", lambda n, o, new, v: new == "sleep" and entered.setdefault("t", time.time()))
+    stop = threading.Event()
+    if legacy:
+        threading.Thread(target=_legacy_loop, args=(stop,), daemon=True).start()
+    try:
+        for _ in range(trials):
+            entered.clear()
+            state.MODE = "active"
+            sleep_manager.touch()
+            deadline = state.LAST_INTERACTION + TIMEOUT
+            while "t" not in entered and time.time() < deadline + 2.0:
+                time.sleep(0.01)
+            out.append(entered.get("t", deadline + 2.0) - deadline)
+    finally:
+        stop.set()
+        unsubscribe()
+    return out
+
+
+# ---------------- idle wakeups ----------------
+def idle_countdown(seconds=3.0, touch_every=0.05):
+    """Interactions keep arriving; count manager loop iterations and CPU."""
+    state.MODE = "active"
+    before = sleep_manager.manager.wakeups
+    cpu = time.process_time()
+    end = time.time() + seconds
+    while time.time() < end:
+        sleep_manager.touch()
+        time.sleep(touch_every)
+    return sleep_manager.manager.wakeups - before, time.process_time() - cpu
+
+
+def main():
+    print("wake latency (MODE write → reacting thread)")
+    print("  state.wait_for       ", _ms(wake_wait_for()))
+    print("  subscriber callback  ", _ms(wake_subscriber()))
+    print("  50 ms polling loop   ", _ms(wake_polling()))
+
+    sleep_manager.SLEEP_TIMEOUT = TIMEOUT
+    print(f"\nsleep entry after the {TIMEOUT:.1f} s deadline")
+    print("  1 s polling loop     ", _ms(sleep_entry(legacy=True)))
+    sleep_manager.manager.start()
+    print("  deadline loop        ", _ms(sleep_entry()))
+
+    sleep_manager.SLEEP_TIMEOUT = 120
+    state.MODE = "active"
+    sleep_manager.touch()
+    time.sleep(0.1)
+    wakeups, cpu = idle_countdown()
+    print("\nidle countdown, 3 s with an interaction every 50 ms")
+    print(f"  manager loop wakeups  {wakeups}   (old loop: 3, one per second)")
+    print(f"  process CPU           {cpu * 1000:.1f} ms")
+    sleep_manager.manager.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# benchmarks/bench_state.py
+"""
+State store under contention.      python -m benchmarks.bench_state [threads]
+
+- set(): every thread writes the same field / its own field
+- compare_and_set(): threads race to increment one counter with a CAS
+  retry loop (the final count must equal the increments; retries show
+  how often a thread lost the race)
+- get(): lock-free reads while the writers run
+- baseline: the same writes to a dict behind a plain threading.Lock
+"""
+
+import sys
+import threading
+import time
+
+from benchmarks import _env  # noqa: F401
+
+from core.state import StateStore  # noqa: E402
+
+OPS = 50_000
+
+
+def _fields(threads):
+    fields = {"COUNTER": (int, 0), "MODE": (str, "active")}
+    fields.update({f"F{i}": (int, 0) for i in range(threads)})
+    return fields
+
+
+def run_threads(threads, target):
+    """Start `threads` workers together; returns wall-clock seconds."""
+    barrier = threading.Barrier(threads + 1)
+
+    def _worker(tid):
+        barrier.wait()
+        target(tid)
+
+    workers = [threading.Thread(target=_worker, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - started
+
+
+def bench_set(threads, same_field, subscribers=0):
+    store = StateStore(_fields(threads))
+    for _ in range(subscribers):
+        store.subscribe("*", lambda *a: None)
+
+    def _writes(tid):
+        name = "COUNTER" if same_field else f"F{tid}"
+        for i in range(1, OPS + 1):
+            store.set(name, i * threads + tid)    # always a change
+    return threads * OPS / run_threads(threads, _writes)
+
+
+def bench_lock_baseline(threads):
+    values, lock = {"COUNTER": 0}, threading.Lock()
+
+    def _writes(tid):
+        for i in range(1, OPS + 1):
+            with lock:
+                values["COUNTER"] = i * threads + tid
+    return threads * OPS / run_threads(threads, _writes)
+
+
+def bench_cas(threads):
+    store = StateStore(_fields(threads))
+    retries = [0] * threads
+
+    def _increments(tid):
+        for _ in range(OPS):
+            while True:
+                cur = store.get("COUNTER")
+                if store.compare_and_set("COUNTER", cur, cur + 1):
+                    break
+                retries[tid] += 1
+    seconds = run_threads(threads, _increments)
+    assert store.get("COUNTER") == threads * OPS, "lost CAS increment"
+    assert store.version == threads * OPS
+    return threads * OPS / seconds, sum(retries)
+
+
+def bench_reads_under_writes(threads):
+    store = StateStore(_fields(threads))
+    stop = threading.Event()
+    reads = [0] * threads
+
+    def _writer():
+        i = 0
+        while not stop.is_set():
+            i += 1
+            store.set("MODE", "sleep" if i % 2 else "active")
+
+    def _reads(tid):
+        n = 0
+        for _ in range(OPS):
+            store.get("MODE")
+            n += 1
+        reads[tid] = n
+
+    writer = threading.Thread(target=_writer)
+    writer.start()
+    try:
+        seconds = run_threads(threads, _reads)
+    finally:
+        stop.set()
+        writer.join()
+    return sum(reads) / seconds
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    print(f"threads: {threads}, {OPS:,} ops each")
+    rows = [
+        ("set(), 1 thread", bench_set(1, True), "ops/s"),
+        ("set(), same field", bench_set(threads, True), "ops/s"),
+        ("set(), own field", bench_set(threads, False), "ops/s"),
+        ("set(), same field, 2 subscribers", bench_set(threads, True, subscribers=2), "ops/s"),
+        ("dict + Lock baseline", bench_lock_baseline(threads), "ops/s"),
+    ]
+    rate, retries = bench_cas(threads)
+    rows.append(("compare_and_set increments", rate, f"ops/s ({retries:,} retries, none lost)"))
+    rows.append(("get() during writes", bench_reads_under_writes(threads), "reads/s"))
+    for label, value, unit in rows:
+        print(f"{label:<34}{value:12,.0f} {unit}")
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ AI Chat Brain for Jarvis
 - Uses Ollama (llama3.1 / any local model)
 - Falls back to conversation_core
 - Injects memory + mood + last topic
+- Pulls only the most relevant past exchanges from core.vector_memory
 - Responds like a friend + assistant
 """
 
@@ -51,6 +52,14 @@ except:
 
 import core.state as state
 
+# -------------------------------------------
+# Long-term exchange memory (vector store)
+# -------------------------------------------
+try:
+    from core.vector_memory import vector_memory
+except:
+    vector_memory = None
+
 
 # ============================================================
 #   OLLAMA CLIENT (HTTP + PYTHON PACKAGE)
@@ -142,7 +151,7 @@ class AIChatBrain:
     # ---------------------------------------------------------
     # Build the personality + memory injected prompt
     # ---------------------------------------------------------
-    def _build_system_prompt(self):
+    def _build_system_prompt(self, prompt=None):
         mood = ""
         last_topic = ""
 
@@ -164,6 +173,16 @@ class AIChatBrain:
 
         mem_text = "\n".join([f"- {m}" for m in mem_list]) if mem_list else "No saved memory."
 
+        # Relevant past exchanges (top-k by similarity to this prompt)
+        try:
+            recalled = vector_memory.search(prompt, k=4) if (vector_memory and prompt) else []
+        except:
+            recalled = []
+
+        recall_text = "\n".join(
+            [f"- Yash: {r['user']} | Jarvis: {r['jarvis'][:160]}" for r in recalled]
+        ) if recalled else "Nothing relevant."
+
         return f"""
 You are Jarvis — Yash's personal AI partner.
 Tone:
@@ -181,6 +200,9 @@ Context:
 Long-term Memory:
 {mem_text}
 
+Relevant Past Conversations:
+{recall_text}
+
 Rules:
 1. Talk like a human friend + assistant.
 2. If Yash is emotional, respond empathetically.
@@ -196,7 +218,7 @@ Rules:
         if not prompt:
             return "Bolo Yash, I’m listening 😊"
 
-        system_prompt = self._build_system_prompt()
+        system_prompt = self._build_system_prompt(prompt)
 
         # Try Ollama
         if self.ollama.available():
@@ -0,0 +1,261 @@
+# core/audio_vad.py
+"""
+Streaming voice-activity segmentation for Jarvis' media readers.
+
+- Audio is consumed in fixed frames (30 ms) from any source: a WAV file
+  read block by block, or raw PCM chunks from a pipe — memory stays
+  constant whatever the length.
+- Frames are classified by webrtcvad when installed (16-bit mono at
+  8/16/32/48 kHz), otherwise by a NumPy energy detector that tracks an
+  adaptive noise floor.
+- Speech runs shorter than `min_speech_ms` are dropped, gaps up to
+  `merge_gap_ms` are merged, and every range is padded by `padding_ms`
+  so words are not clipped. Ranges are emitted as soon as they are final
+  and never exceed `max_segment_ms` (whisper's 30 s window); continuous
+  speech is cut into back-to-back ranges, padded only on the outer edges.
+- Any container ffmpeg can read is decoded to 16 kHz mono PCM through a
+  pipe (iter_media) — no temporary WAV; iter_speech keeps only the audio a
+  still-open range may need, so memory is bounded by the segment length.
+Kept free of Jarvis imports so pool workers can import it cheaply.
+"""
+
+import shutil
+import subprocess
+import wave
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import webrtcvad
+    _WEBRTC = True
+except Exception:
+    webrtcvad = None
+    _WEBRTC = False
+
+_WEBRTC_RATES = (8000, 16000, 32000, 48000)
+
+
+def to_mono_int16(raw: bytes, channels: int) -> np.ndarray:
+    pcm = np.frombuffer(raw, dtype="<i2")
+    if channels > 1:
+        usable = len(pcm) - len(pcm) % channels
+        pcm = pcm[:usable].reshape(-1, channels).mean(axis=1).astype(np.int16)
+    return pcm
+
+
+class VadSegmenter:
+    """Incremental speech-range detector: feed(pcm) → finished (start_ms, end_ms)."""
+
+    FRAME_MS = 30
+
+    def __init__(self, sample_rate: int, aggressiveness: int = 2, padding_ms: int = 300,
+                 merge_gap_ms: int = 500, min_speech_ms: int = 250, max_segment_ms: int = 30000,
+                 use_webrtc: Optional[bool] = None):
+        self.sample_rate = int(sample_rate)
+        self.frame_len = self.sample_rate * self.FRAME_MS // 1000
+        self.padding_ms = padding_ms
+        self.merge_gap_ms = merge_gap_ms
+        self.min_speech_ms = min_speech_ms
+        self.max_segment_ms = max_segment_ms
+
+        if use_webrtc is None:
+            use_webrtc = _WEBRTC
+        self._vad = None
+        if use_webrtc and _WEBRTC and self.sample_rate in _WEBRTC_RATES:
+            self._vad = webrtcvad.Vad(int(aggressiveness))
+
+        self._carry = np.zeros(0, dtype=np.int16)
+        self._frames = 0                 # frames consumed so far
+        self._noise = None               # energy fallback: adaptive noise floor
+        self._run = None                 # current raw speech run [start, end] ms
+        self._cut = False                # current run continues a forced cut
+        self._pending = None             # last padded range, may still merge
+
+    # ---------------- frame classification ----------------
+    def _is_speech(self, frame: np.ndarray) -> bool:
+        if self._vad is not None:
+            return self._vad.is_speech(frame.tobytes(), self.sample_rate)
+        energy = float(np.sqrt(np.mean(frame.astype(np.float32) ** 2)))
+        if self._noise is None:
+            self._noise = max(energy, 30.0)
+        speech = energy > max(self._noise * 3.0, 120.0)
+        # noise floor falls quickly, rises slowly (speech does not drag it up)
+        rate = 0.2 if energy < self._noise else 0.002
+        self._noise += rate * (energy - self._noise)
+        return speech
+
+    # ---------------- range bookkeeping ----------------
+    def _close_run(self, pad_end: bool = True) -> Iterator[Tuple[int, int]]:
+        start, end = self._run
+        self._run = None
+        cut, self._cut = self._cut, False
+        # a piece of a forced cut is kept whatever its length
+        if end - start < self.min_speech_ms and not cut:
+            return
+        # the inner edges of a forced cut stay unpadded, so pieces don't overlap
+        padded = (start if cut else max(0, start - self.padding_ms),
+                  end + self.padding_ms if pad_end else end)
+        if (self._pending is not None and padded[0] <= self._pending[1]
+                and padded[1] - self._pending[0] <= self.max_segment_ms):
+            self._pending = (self._pending[0], padded[1])
+            return
+        if self._pending is not None:
+            yield self._pending
+        self._pending = padded
+
+    def feed(self, pcm: np.ndarray) -> Iterator[Tuple[int, int]]:
+        """Consume mono int16 samples; yield ranges that can no longer change."""
+        if self._carry.size:
+            pcm = np.concatenate([self._carry, pcm])
+        n = len(pcm) // self.frame_len
+        for i in range(n):
+            frame = pcm[i * self.frame_len:(i + 1) * self.frame_len]
+            t = self._frames * self.FRAME_MS
+            self._frames += 1
+            if self._is_speech(frame):
+                if self._run is None:
+                    self._run = [t, t + self.FRAME_MS]
+                elif t - self._run[0] >= self.max_segment_ms - 2 * self.padding_ms:
+                    # continuous speech: cut here so no segment outgrows the window;
+                    # the piece before the cut is final
+                    yield from self._close_run(pad_end=False)
+                    if self._pending is not None:
+                        yield self._pending
+                        self._pending = None
+                    self._run = [t, t + self.FRAME_MS]
+                    self._cut = True
+                elif t - self._run[1] <= self.merge_gap_ms:
+                    self._run[1] = t + self.FRAME_MS
+                else:
+                    yield from self._close_run()
+                    self._run = [t, t + self.FRAME_MS]
+            elif self._run is not None and t - self._run[1] > self.merge_gap_ms:
+                yield from self._close_run()
+            # the pending range is final once no new run can reach it
+            if (self._pending is not None and self._run is None
+                    and t - self._pending[1] > self.padding_ms):
+                yield self._pending
+                self._pending = None
+        self._carry = pcm[n * self.frame_len:].copy()
+
+    def finish(self) -> Iterator[Tuple[int, int]]:
+        duration = self.duration_ms()
+        if self._run is not None:
+            yield from self._close_run()
+        if self._pending is not None:
+            yield (self._pending[0], min(self._pending[1], duration))
+            self._pending = None
+
+    def duration_ms(self) -> int:
+        return (self._frames * self.frame_len + len(self._carry)) * 1000 // self.sample_rate
+
+    def open_from_ms(self) -> int:
+        """Earliest time a range that is not emitted yet can still start."""
+        if self._pending is not None:
+            return self._pending[0]
+        if self._run is not None:
+            return self._run[0] if self._cut else max(0, self._run[0] - self.padding_ms)
+        return max(0, self._frames * self.FRAME_MS - self.padding_ms)
+
+
+def segment_stream(chunks: Iterable[np.ndarray], sample_rate: int, **kwargs) -> Iterator[Tuple[int, int]]:
+    """Speech ranges (ms) over a stream of mono int16 chunks."""
+    seg = VadSegmenter(sample_rate, **kwargs)
+    for pcm in chunks:
+        yield from seg.feed(pcm)
+    yield from seg.finish()
+
+
+def iter_speech(chunks: Iterable[np.ndarray], sample_rate: int,
+                **kwargs) -> Iterator[Tuple[int, int, np.ndarray]]:
+    """
+    (start_ms, end_ms, pcm) for every speech range of a mono int16 stream.
+    Audio older than the earliest still-open range is dropped as it goes.
+    """
+    seg = VadSegmenter(sample_rate, **kwargs)
+    blocks: List[np.ndarray] = []
+    base = 0                        # sample index of blocks[0][0]
+
+    def _slice(start_ms: int, end_ms: int) -> np.ndarray:
+        first = start_ms * sample_rate // 1000 - base
+        last = end_ms * sample_rate // 1000 - base
+        out, pos = [], 0
+        for b in blocks:
+            lo, hi = max(first - pos, 0), min(last - pos, len(b))
+            if lo < hi:
+                out.append(b[lo:hi])
+            pos += len(b)
+        return np.concatenate(out) if out else np.zeros(0, dtype=np.int16)
+
+    for pcm in chunks:
+        blocks.append(pcm)
+        for start_ms, end_ms in seg.feed(pcm):
+            yield start_ms, end_ms, _slice(start_ms, end_ms)
+        keep = seg.open_from_ms() * sample_rate // 1000
+        while blocks and base + len(blocks[0]) <= keep:
+            base += len(blocks.pop(0))
+    for start_ms, end_ms in seg.finish():
+        yield start_ms, end_ms, _slice(start_ms, end_ms)
+
+
+def ffmpeg_exe() -> Optional[str]:
+    """ffmpeg on PATH, else the binary bundled with imageio-ffmpeg (moviepy)."""
+    exe = shutil.which("ffmpeg")
+    if exe:
+        return exe
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return None
+
+
+def iter_media(path: str, sample_rate: int = 16000, block_ms: int = 1000,
+               exe: Optional[str] = None) -> Tuple[int, Iterator[np.ndarray]]:
+    """(sample_rate, generator of mono int16 blocks) decoded by an ffmpeg pipe."""
+    exe = exe or ffmpeg_exe()
+    if not exe:
+        raise RuntimeError("ffmpeg not found")
+    cmd = [exe, "-nostdin", "-v", "error", "-i", path, "-vn", "-ac", "1",
+           "-ar", str(sample_rate), "-f", "s16le", "-acodec", "pcm_s16le", "-"]
+    block_bytes = 2 * max(1, sample_rate * block_ms // 1000)
+
+    def _blocks():
+        # ffmpeg starts on first pull and is killed if the consumer stops early
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=block_bytes)
+        try:
+            while True:
+                raw = proc.stdout.read(block_bytes)
+                if not raw:
+                    break
+                yield np.frombuffer(raw[:len(raw) - len(raw) % 2], dtype="<i2")
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+
+    return sample_rate, _blocks()
+
+
+def iter_wav(path: str, block_ms: int = 1000) -> Tuple[int, Iterator[np.ndarray]]:
+    """(sample_rate, generator of mono int16 blocks) for a 16-bit WAV file."""
+    wf = wave.open(path, "rb")
+    if wf.getsampwidth() != 2:
+        wf.close()
+        raise ValueError("only 16-bit PCM WAV is supported")
+    rate, channels = wf.getframerate(), wf.getnchannels()
+    block = max(1, rate * block_ms // 1000)
+
+    def _blocks():
+        try:
+            while True:
+                raw = wf.readframes(block)
+                if not raw:
+                    break
+                yield to_mono_int16(raw, channels)
+        finally:
+            wf.close()
+
+    return rate, _blocks()
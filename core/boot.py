@@ -0,0 +1,161 @@
+# core/boot.py
+"""
+Boot orchestrator for Jarvis (dependency graph + startup timeline).
+
+- Subsystems are registered as named steps with dependencies.
+- run() starts every eager step in its own thread; a step waits only for
+  its own dependencies, so independent work (imports, mixer init, camera,
+  listener) overlaps instead of running back-to-back.
+- lazy=True steps are skipped by run(); get(name) initializes them (and
+  their dependencies) on first use, exactly once.
+- mark(label) records milestones; timeline() prints when every step
+  started / finished relative to boot start.
+Failures are printed and the step's result is None — boot continues,
+like the rest of Jarvis' best-effort startup.
+"""
+
+import threading
+import time
+
+
+class BootStep:
+    __slots__ = ("name", "fn", "deps", "lazy", "thread", "done",
+                 "result", "error", "started", "finished")
+
+    def __init__(self, name, fn, deps=(), lazy=False):
+        self.name = name
+        self.fn = fn
+        self.deps = tuple(deps)
+        self.lazy = lazy
+        self.thread = None
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.started = None
+        self.finished = None
+
+
+class BootOrchestrator:
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self._steps = {}
+        self._marks = []
+        self._lock = threading.Lock()
+        self._checked = False
+
+    def _now(self):
+        return time.perf_counter() - self.t0
+
+    # ---------------- registration ----------------
+    def step(self, name, deps=(), lazy=False):
+        """Decorator: register fn() as step `name`."""
+        def _register(fn):
+            self.add(name, fn, deps=deps, lazy=lazy)
+            return fn
+        return _register
+
+    def add(self, name, fn, deps=(), lazy=False):
+        if name in self._steps:
+            raise ValueError(f"duplicate boot step: {name}")
+        self._steps[name] = BootStep(name, fn, deps, lazy)
+        self._checked = False
+
+    # ---------------- execution ----------------
+    def _check_graph(self):
+        """
+        Reject unknown dependencies and cycles up front: a step waiting on
+        its own descendant would block in get() forever.
+        """
+        if self._checked:
+            return
+        for name in self._steps:
+            for dep in self._steps[name].deps:
+                if dep not in self._steps:
+                    raise ValueError(f"boot step {name} depends on unknown step {dep}")
+
+        done = set()
+        path = []           # current DFS chain
+        on_path = set()
+
+        def _visit(name):
+            if name in on_path:
+                cycle = path[path.index(name):] + [name]
+                raise ValueError("boot steps form a cycle: " + " → ".join(cycle))
+            if name in done:
+                return
+            path.append(name)
+            on_path.add(name)
+            for dep in self._steps[name].deps:
+                _visit(dep)
+            path.pop()
+            on_path.discard(name)
+            done.add(name)
+
+        for name in self._steps:
+            _visit(name)
+        self._checked = True
+
+    def run(self, wait=True):
+        """Start all eager steps; optionally block until they finish."""
+        self._check_graph()
+        eager = [s for s in self._steps.values() if not s.lazy]
+        for s in eager:
+            self._start(s)
+        if wait:
+            for s in eager:
+                s.done.wait()
+        return self
+
+    def get(self, name, timeout=None):
+        """Result of step `name` — starts it now if lazy and not started yet."""
+        s = self._steps[name]
+        self._check_graph()
+        self._start(s)
+        s.done.wait(timeout)
+        return s.result
+
+    def _start(self, s):
+        with self._lock:
+            if s.thread is not None:
+                return
+            s.thread = threading.Thread(
+                target=self._execute, args=(s,), daemon=True, name=f"JarvisBoot-{s.name}"
+            )
+        s.thread.start()
+
+    def _execute(self, s):
+        try:
+            for dep in s.deps:
+                self.get(dep)
+            s.started = self._now()
+            s.result = s.fn()
+        except Exception as e:
+            s.error = e
+            print(f"⚠️ boot step '{s.name}' failed:", e)
+        finally:
+            if s.started is None:
+                s.started = self._now()
+            s.finished = self._now()
+            s.done.set()
+
+    # ---------------- profiling ----------------
+    def mark(self, label):
+        with self._lock:
+            self._marks.append((self._now(), label))
+
+    def timeline(self):
+        """Print the startup timeline (seconds since boot start)."""
+        rows = [
+            (s.started, s.finished, s.name, "FAILED" if s.error else "")
+            for s in self._steps.values() if s.finished is not None
+        ]
+        rows.sort()
+        print("\n⏱ Startup timeline:")
+        for start, end, name, note in rows:
+            print(f"   {start:6.2f}s → {end:6.2f}s  {name:<16} {end - start:5.2f}s {note}")
+        for t, label in sorted(self._marks):
+            print(f"   {t:6.2f}s  ★ {label}")
+        pending = [s.name for s in self._steps.values() if s.lazy and s.thread is None]
+        if pending:
+            print("   deferred (not loaded yet): " + ", ".join(pending))
+        print()
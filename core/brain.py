@@ -10,6 +10,7 @@ from core.memory_engine import JarvisMemory
 from core.emotion_reflection import JarvisEmotionReflection
 import core.nlp_engine as nlp
 import core.state as state
+import core.text_analysis as text_analysis
 
 # Optional LLM (local/Ollama/OpenAI)
 try:
@@ -35,20 +36,8 @@ class Brain:
         if not text:
             return "neutral"
 
-        t = text.lower()
-
-        groups = {
-            "serious": ["sad", "hurt", "empty", "broken", "lonely", "upset", "low"],
-            "alert": ["angry", "pissed", "furious", "scared", "fear", "panic", "worried", "stress"],
-            "happy": ["happy", "great", "awesome", "nice", "amazing"],
-            "neutral": ["bored", "meh", "okay", "fine"]
-        }
-
-        for mood, words in groups.items():
-            if any(w in t for w in words):
-                return mood
-
-        return "neutral"
+        # whole-word match over the shared EMOTION_GROUPS table
+        return text_analysis.emotion(text)
 
     # -----------------------------------------
     # EMOTION FUSION
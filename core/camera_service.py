@@ -0,0 +1,156 @@
+# core/camera_service.py
+"""
+Shared camera frame service for the face subsystems (FaceAuth, face
+emotion on wake).
+
+- One warm cv2.VideoCapture owned by a background thread; consumers never
+  open the device themselves.
+- The capture opens on demand (first get_frame() / open()), discards the
+  first frames while exposure settles, then keeps a small ring buffer of
+  the latest frames. open() reports success only once the device has
+  delivered a frame; open(wait=False) just starts warming it.
+- get_frame() returns the newest frame immediately when the camera is warm
+  (or waits for the next one when the caller needs a fresh frame).
+- The device is released after `idle_timeout` seconds without a request,
+  so the camera LED is not on while Jarvis just listens.
+"""
+
+import threading
+import time
+from collections import deque
+
+try:
+    import cv2
+    _CV2 = True
+except Exception:
+    cv2 = None
+    _CV2 = False
+
+
+class CameraService:
+    def __init__(self, index: int = 0, buffer_size: int = 4, idle_timeout: float = 20.0,
+                 warmup_s: float = 0.4):
+        self.index = index
+        self.idle_timeout = float(idle_timeout)
+        self.warmup_s = float(warmup_s)
+        self.opens = 0
+        self.frames_read = 0
+
+        self._frames = deque(maxlen=max(1, buffer_size))   # (timestamp, frame)
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+        self._failed = False
+        self._delivering = False         # the device has returned a frame
+        self._last_request = 0.0
+
+    # ---------------- lifecycle ----------------
+    def open(self, wait: bool = True, timeout: float = 2.0) -> bool:
+        """
+        Start (or keep) the warm capture. With `wait`, block until the
+        device delivers its first frame: False if there is no camera or
+        nothing arrives within `timeout` seconds.
+        """
+        if not _CV2:
+            return False
+        with self._cond:
+            self._last_request = time.time()
+            running = self._running
+            old = self._thread
+        if not running:
+            # an idle-closed capture may still be releasing the device
+            if old is not None and old is not threading.current_thread():
+                old.join(timeout=2.0)
+            with self._cond:
+                if not self._running:
+                    self._running = True
+                    self._failed = False
+                    self._delivering = False
+                    self._frames.clear()
+                    self._thread = threading.Thread(target=self._capture_loop, daemon=True, name="JarvisCamera")
+                    self._thread.start()
+        if not wait:
+            return True
+        with self._cond:
+            self._cond.wait_for(lambda: self._delivering or self._failed or not self._running, timeout)
+            return self._delivering
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        t = self._thread
+        if t is not None and t is not threading.current_thread():
+            t.join(timeout=2.0)
+
+    def is_open(self) -> bool:
+        return self._running
+
+    def _capture_loop(self):
+        cap = cv2.VideoCapture(self.index)
+        if not cap.isOpened():
+            print("⚠️ Camera not accessible (index %s)" % self.index)
+            with self._cond:
+                self._running = False
+                self._failed = True
+                self._cond.notify_all()
+            return
+        self.opens += 1
+        started = time.time()
+        try:
+            while True:
+                ok, frame = cap.read()
+                now = time.time()
+                with self._cond:
+                    if not self._running:
+                        break
+                    if now - self._last_request > self.idle_timeout:
+                        self._running = False
+                        break
+                    if not ok:
+                        continue
+                    self.frames_read += 1
+                    if not self._delivering:
+                        self._delivering = True
+                        self._cond.notify_all()
+                    # early frames are dark / mis-exposed while the sensor settles
+                    if now - started < self.warmup_s:
+                        continue
+                    self._frames.append((now, frame))
+                    self._cond.notify_all()
+                if not ok:
+                    time.sleep(0.05)
+        finally:
+            cap.release()
+            with self._cond:
+                self._delivering = False
+                self._frames.clear()
+                self._cond.notify_all()
+            print("📷 Camera released")
+
+    # ---------------- frames ----------------
+    def get_frame(self, max_age: float = 0.5, timeout: float = 3.0):
+        """
+        Latest frame (BGR ndarray) no older than `max_age` seconds, or None
+        if the camera is unavailable. Opens the camera if needed.
+        """
+        if not self.open(wait=False):
+            return None
+        deadline = time.time() + timeout
+        with self._cond:
+            while True:
+                self._last_request = time.time()
+                if self._frames:
+                    ts, frame = self._frames[-1]
+                    if time.time() - ts <= max_age:
+                        return frame
+                if self._failed or not self._running:
+                    return None
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+
+# singleton
+camera = CameraService()
@@ -23,26 +23,19 @@ from core.memory_engine import JarvisMemory
 from core.emotion_reflection import JarvisEmotionReflection
 
 # NEW: Phase-2 skill modules
-try:
-    from core.document_reader import document_reader
-except Exception:
-    document_reader = None
+# Heavy ones (PyPDF2/docx/transformers, moviepy/whisper/cv2/tesseract,
+# yt_dlp) load on first use of the skill, not at import.
+from core.lazy_import import lazy_import
 
-try:
-    from core.video_reader import video_reader
-except Exception:
-    video_reader = None
+document_reader = lazy_import("core.document_reader", "document_reader")
+video_reader = lazy_import("core.video_reader", "video_reader")
+music_stream = lazy_import("core.music_stream", "music_stream")
 
 try:
     from core.music_player import music_player
 except Exception:
     music_player = None
 
-try:
-    from core.music_stream import music_stream
-except Exception:
-    music_stream = None
-
 # NEW IMPORTS (Brain + State + AI)
 import core.brain as brain_module
 import core.state as state
@@ -51,6 +44,12 @@ import core.state as state
 memory = JarvisMemory()
 reflection = JarvisEmotionReflection()
 
+# Long-term exchange memory (optional)
+try:
+    from core.vector_memory import vector_memory
+except Exception:
+    vector_memory = None
+
 # Attempt to import AI chat backend (ollama wrapper or other). If unavailable we'll fallback.
 try:
     from core.ai_chat import ai_chat_brain
@@ -155,10 +154,11 @@ class JarvisCommandHandler:
         # --------------------------------------------------------------
         # Document Reading
         try:
-            if document_reader and (
+            # keyword test first: the truth test imports the module
+            if (
                 "read" in command or
                 ("summarize" in command and any(ext in command for ext in [".pdf", ".docx", ".txt", ".md"]))
-            ):
+            ) and document_reader:
                 tokens = command.split()
                 path_candidate = None
                 for tok in tokens:
@@ -188,9 +188,31 @@ class JarvisCommandHandler:
         except:
             pass
 
+        # Live "follow along" transcription + rolling summaries
+        try:
+            if ("stop following" in command or "stop follow along" in command) and video_reader:
+                video_reader.stop_follow()
+                speak("Stopped following along.", mood="neutral")
+                return
+            if "follow along" in command and video_reader:
+                media_exts = [".mp4", ".mkv", ".mov", ".mp3", ".wav", ".m4a"]
+                path_candidate = None
+                for tok in command.split():
+                    if any(tok.endswith(ext) for ext in media_exts):
+                        path_candidate = tok
+                        break
+                if not path_candidate:
+                    files = [f for f in os.listdir('.') if any(f.lower().endswith(ext) for ext in media_exts)]
+                    path_candidate = files[-1] if files else None
+                if path_candidate and os.path.exists(path_candidate):
+                    video_reader.follow_along_async(os.path.abspath(path_candidate))
+                    return
+        except:
+            pass
+
         # Video Summarization
         try:
-            if video_reader and ("summarize video" in command or "summarize" in command):
+            if ("summarize video" in command or "summarize" in command) and video_reader:
                 tokens = command.split()
                 path_candidate = None
                 for tok in tokens:
@@ -531,9 +553,9 @@ class JarvisCommandHandler:
 
         if command.startswith("what is"):
             key = command.replace("what is", "").strip()
-            value = memory.recall_fact(key)
-            if value:
-                speak(f"You told me {key} is {value}.")
+            match = memory.find_fact(key)
+            if match:
+                speak(f"You told me {match[0]} is {match[1]}.")
             else:
                 speak(f"I don’t remember anything about {key}.")
             return
@@ -627,7 +649,14 @@ class JarvisCommandHandler:
                 except:
                     ai_response = "I didn’t get that — say it differently?"
 
-            # 4) Mood reflection & store
+            # 4) Long-term recall store (feeds AIChatBrain's prompt)
+            try:
+                if vector_memory:
+                    vector_memory.add_exchange(raw_command, ai_response)
+            except:
+                pass
+
+            # 5) Mood reflection & store
             try:
                 inferred = brain_module.brain.detect_text_emotion(ai_response)
                 if inferred:
@@ -635,7 +664,7 @@ class JarvisCommandHandler:
             except:
                 pass
 
-            # 5) Enhance with cinematic Jarvis styling
+            # 6) Enhance with cinematic Jarvis styling
             try:
                 enhanced = brain_module.brain.enhance_response(
                     ai_response,
@@ -645,13 +674,13 @@ class JarvisCommandHandler:
             except:
                 enhanced = ai_response
 
-            # 6) Keep system alive
+            # 7) Keep system alive
             try:
                 state.LAST_INTERACTION = time.time()
             except:
                 pass
 
-            # 7) Speak AI response
+            # 8) Speak AI response
             speak(enhanced)
 
         except Exception as e:
@@ -20,27 +20,23 @@ from core.memory_engine import JarvisMemory
 from core.emotion_reflection import JarvisEmotionReflection
 import core.state as state
 import core.nlp_engine as nlp
+import core.text_analysis as text_analysis
 
 # Singletons (re-instantiating memory is safe since it's file-backed)
 memory = JarvisMemory()
 reflection = JarvisEmotionReflection()
 
 
-def _word_bound_search(word_list, text):
-    """Return True if any word from word_list appears as a whole word in text."""
-    for w in word_list:
-        # word boundary, case-insensitive
-        if re.search(rf'\b{re.escape(w)}\b', text, flags=re.IGNORECASE):
-            return True
-    return False
-
-
 class JarvisConversation:
     """
     Hybrid conversation core: natural + consistent personality,
     mood-aware, memory-aware, topic-aware.
     """
 
+    _SAD_TRIGGER_RE = re.compile(r"\b(i am|i'm|i feel|feeling)\b.*\b(sad|low|hurt|empty|depressed|lonely)\b")
+    _HAPPY_TRIGGER_RE = re.compile(r"\b(i am|i'm|i feel|feeling)\b.*\b(happy|great|good|awesome|excited)\b")
+    _QUESTION_RE = re.compile(r"\b(what|why|how|explain|help|define)\b")
+
     def __init__(self):
         print("🧩 Conversational Core Online (Hybrid Mode)")
         self.last_topic = None
@@ -54,79 +50,14 @@ class JarvisConversation:
     # Lightweight sentiment → mood detection (scoring-based)
     # -------------------------------------------------------
     def _estimate_sentiment(self, text: Optional[str]) -> str:
-        if not text:
-            return "neutral"
-        t = text.lower()
-
-        # keyword lists (expanded slightly)
-        sad = ["sad", "low", "down", "hurt", "upset", "empty", "broken", "depressed", "lonely", "tear"]
-        happy = ["happy", "great", "awesome", "nice", "good", "fantastic", "amazing", "glad", "yay", "excited"]
-        angry = ["angry", "mad", "pissed", "furious", "hate", "annoyed"]
-        anxious = ["scared", "worried", "anxious", "panic", "stressed", "stress", "overthinking", "nervous"]
-        bored = ["bored", "meh", "boring", "idle"]
-
-        score = 0
-        # each match adjusts score
-        if _word_bound_search(sad, t):
-            score -= 2
-        if _word_bound_search(angry, t):
-            score -= 3
-        if _word_bound_search(anxious, t):
-            score -= 2
-        if _word_bound_search(happy, t):
-            score += 3
-        if _word_bound_search(bored, t):
-            score -= 1
-
-        # negation handling (simple)
-        if re.search(r"\b(no|not|n't|never)\b", t):
-            # flip some effect if there are strong emotion words
-            if _word_bound_search(happy, t):
-                score -= 2
-            if _word_bound_search(sad, t):
-                score += 1
-
-        # map score to mood labels used across project
-        if score >= 2:
-            return "happy"
-        if score <= -2:
-            # disambiguate angry vs serious
-            if _word_bound_search(angry, t):
-                return "alert"
-            return "serious"
-        return "neutral"
+        # shared scorer: same tables and tokenization as the batch analyzer
+        return text_analysis.sentiment(text)[1]
 
     # -------------------------------------------------------
     # Topic detection (keywords + heuristics)
     # -------------------------------------------------------
     def _detect_topic(self, text: Optional[str]) -> Optional[str]:
-        if not text:
-            return None
-        t = text.lower()
-
-        # domain-specific keywords mapping (multi-word keys allowed)
-        topic_map = {
-            "ai": ["ai", "artificial intelligence", "machine learning", "deep learning"],
-            "java": ["java", "jvm", "spring"],
-            "daa": ["daa", "dynamic programming", "algorithms", "graphs"],
-            "python": ["python", "py"],
-            "graphics": ["graphics", "opengl", "projection", "3d"],
-            "dbms": ["dbms", "database", "sql", "mysql", "postgres", "oracle"],
-            "blockchain": ["blockchain", "ethereum", "smart contract"],
-            "gesture": ["gesture", "hand gesture", "gesture recognition"],
-            "emotion": ["emotion", "mood", "feeling"],
-            "life": ["life", "future", "career"],
-            "love": ["love", "relationship", "gf", "bf", "crush"],
-        }
-
-        for key, aliases in topic_map.items():
-            for alias in aliases:
-                if re.search(rf"\b{re.escape(alias)}\b", t):
-                    return key
-
-        # fallback: try to extract a reasonable noun-like token
-        m = re.search(r"\b([a-zA-Z]{3,20})\b", t)
-        return m.group(1) if m else None
+        return text_analysis.topic(text)
 
     # -------------------------------------------------------
     # Continue topic helper
@@ -197,10 +128,10 @@ class JarvisConversation:
         # Emotional triggers (direct "I am ..." lines)
         try:
             # if user says "i am sad" or "i feel low", pick it up
-            if re.search(r"\b(i am|i'm|i feel|feeling)\b.*\b(sad|low|hurt|empty|depressed|lonely)\b", t):
+            if self._SAD_TRIGGER_RE.search(t):
                 reply = brain.generate_emotional_support("sad", mood)
                 return brain.enhance_response(reply, mood=mood, last_topic="mood")
-            if re.search(r"\b(i am|i'm|i feel|feeling)\b.*\b(happy|great|good|awesome|excited)\b", t):
+            if self._HAPPY_TRIGGER_RE.search(t):
                 reply = brain.generate_emotional_support("happy", mood)
                 return brain.enhance_response(reply, mood=mood, last_topic="mood")
         except Exception:
@@ -211,7 +142,7 @@ class JarvisConversation:
             return self._continue_topic()
 
         # Question / explain requests -> attempt knowledgeful answer
-        if re.search(r"\b(what|why|how|explain|help|define)\b", t):
+        if self._QUESTION_RE.search(t):
             topic = self._detect_topic(t)
             self.last_topic = topic
             try:
@@ -5,18 +5,36 @@ High-tech Document Reader + Summarizer for Jarvis.
 Features:
 - Reads PDF / DOCX / TXT / MD.
 - Splits long documents into chunks (safe chunk-size).
+- Streams reading: pages/paragraphs are extracted lazily and chunked on the
+  fly, while a bounded queue feeds TTS — speaking starts after the first
+  page and memory stays flat for very long documents.
+- Whole-text extraction of big PDFs runs in a process pool (core.pdf_extract).
+- Transformers summaries run in length-sorted batches; very long texts get
+  a map-reduce pass (the chunk summaries are summarized again).
+- The transformers summarizer is loaded once and shared through
+  core.model_registry (idle unload, memory ceiling).
+- Extracted text and summaries are cached on the file's content hash
+  (core.summary_cache), so repeat summaries return immediately.
 - Optional improved summarization:
     - If OpenAI API key present -> uses OpenAI (chat/completions).
-    - Else if local transformers summarization pipeline available -> uses it.
-    - Else falls back to an in-process TextRank summarizer.
+    - Else if local transformers summarization model (distilbart) available -> uses it.
+    - Else if a local Ollama server is up -> uses it.
+    - Chat-model chunks are summarized concurrently (bounded, in order).
+    - Else falls back to an in-process TextRank summarizer (sparse TF-IDF
+      cosine graph + power iteration in NumPy; frequency scoring without it).
 - Reads aloud using core.speech_engine.speak and can return textual summary.
 - Non-blocking API: heavy ops run in background thread if used via `read_async` / `summarize_async`.
 """
 
+import functools
 import os
+import queue
+import re
 import threading
+import time
 import math
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, List, Tuple
 
 # file readers
 try:
@@ -29,9 +47,17 @@ try:
 except Exception:
     docx = None
 
+try:
+    import numpy as np
+    _NUMPY = True
+except Exception:
+    np = None
+    _NUMPY = False
+
 # optional advanced libs
 try:
-    from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
     _TRANSFORMERS_AVAILABLE = True
 except Exception:
     _TRANSFORMERS_AVAILABLE = False
@@ -44,11 +70,48 @@ except Exception:
     _OPENAI_AVAILABLE = False
 
 from core.speech_engine import speak
+from core import pdf_extract
+from core.summary_cache import summary_cache
+from core.model_registry import model_registry
 import core.nlp_engine as nlp
 from core.memory_engine import JarvisMemory
 
 memory = JarvisMemory()
 
+class _Seq2SeqSummarizer:
+    """
+    Tokenizer + seq2seq model, called like the old summarization pipeline:
+    summarizer(texts, max_length=..., ...) -> [{"summary_text": str}].
+    transformers 5 removed the "summarization" pipeline task, so the
+    model is driven directly (same calls on 4.x).
+    """
+
+    def __init__(self, model_name: str):
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name).eval()
+        # truncate to what the encoder can take, even if the tokenizer has no limit set
+        self.max_input = min(self.tokenizer.model_max_length,
+                             getattr(self.model.config, "max_position_embeddings", None) or 1024)
+
+    def __call__(self, texts: List[str], max_length: int = 130, min_length: int = 30,
+                 do_sample: bool = False, truncation: bool = True, batch_size: Optional[int] = None):
+        # callers batch already; one generate() call per list
+        enc = self.tokenizer(texts, return_tensors="pt", padding=True, truncation=truncation,
+                             max_length=self.max_input)
+        with torch.inference_mode():
+            out = self.model.generate(**enc, max_length=max_length, min_length=min_length, do_sample=do_sample)
+        return [{"summary_text": t.strip()} for t in self.tokenizer.batch_decode(out, skip_special_tokens=True)]
+
+
+# summarizer weights load once (on first use) and are shared via the registry
+_SUMMARIZER_MODEL = "sshleifer/distilbart-cnn-12-6"
+if _TRANSFORMERS_AVAILABLE:
+    model_registry.register(
+        "summarizer",
+        lambda: _Seq2SeqSummarizer(_SUMMARIZER_MODEL),
+        size_mb=1200,
+    )
+
 
 # -------------------------
 # Utility: chunk text
@@ -66,92 +129,302 @@ def _chunk_text(text: str, max_words: int = 350) -> List[str]:
     return chunks
 
 
+def _iter_chunks(blocks: Iterable[str], max_words: int = 350) -> Iterator[str]:
+    """Streaming _chunk_text: re-chunks a stream of pages/paragraphs."""
+    buf: List[str] = []
+    for block in blocks:
+        buf.extend((block or "").split())
+        while len(buf) >= max_words:
+            yield " ".join(buf[:max_words])
+            del buf[:max_words]
+    if buf:
+        yield " ".join(buf)
+
+
 # -------------------------
-# Simple TextRank fallback summarizer
+# TextRank fallback summarizer (offline, numpy only)
 # -------------------------
+_SENT_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"\w+")
+_TR_STOPWORDS = frozenset(
+    "a an the and or but if of to in on at by for with from as is are was were be been "
+    "it its this that these those there their they he she we you i not no so than then "
+    "can will would should could do does did has have had which who what when where how".split()
+)
+
+
+def _frequency_summarize(sentences: List[str], max_sentences: int) -> str:
+    # numpy-free fallback: average word frequency per sentence
+    freq = {}
+    tokens = [_WORD_RE.findall(s.lower()) for s in sentences]
+    for words in tokens:
+        for w in words:
+            freq[w] = freq.get(w, 0) + 1
+    scores = [sum(freq[w] for w in words) / len(words) if words else 0 for words in tokens]
+    top = sorted(range(len(sentences)), key=lambda i: -scores[i])[:max_sentences]
+    return " ".join(sentences[i].strip() for i in sorted(top))
+
+
+def _textrank_scores(sentences: List[str], damping: float = 0.85,
+                     max_iter: int = 100, tol: float = 1e-6):
+    """
+    TextRank over TF-IDF cosine similarity, without ever building the
+    N x N matrix: with X the (sparse, L2-normalized) sentence x term
+    matrix, S = X X^T - I, so every power-iteration step is two sparse
+    mat-vecs (np.bincount over the non-zeros) — memory and time grow
+    with the number of words, not with sentences squared.
+    """
+    n = len(sentences)
+    if not n:
+        return np.zeros(0)
+    # intern tokens once; stopwords are dropped per vocabulary entry
+    per_sentence = [_WORD_RE.findall(s.lower()) for s in sentences]
+    vocab = {}
+    term_of = np.fromiter(
+        (vocab.setdefault(w, len(vocab)) for words in per_sentence for w in words),
+        dtype=np.int64,
+    )
+    sent_of = np.repeat(np.arange(n, dtype=np.int64), [len(words) for words in per_sentence])
+    content = np.fromiter((w not in _TR_STOPWORDS and not w.isdigit() for w in vocab), dtype=bool, count=len(vocab))
+    if not term_of.size:
+        return np.zeros(n)
+    keep = content[term_of]
+    term_of, sent_of = term_of[keep], sent_of[keep]
+    if not term_of.size:
+        return np.zeros(n)
+    v = len(vocab)
+
+    # sparse COO: unique (sentence, term) pairs with counts
+    pair_ids, counts = np.unique(sent_of * v + term_of, return_counts=True)
+    rows = pair_ids // v
+    cols = pair_ids % v
+    df = np.bincount(cols, minlength=v)
+    vals = (1.0 + np.log(counts)) * (np.log((1.0 + n) / (1.0 + df[cols])) + 1.0)
+    norms = np.sqrt(np.bincount(rows, weights=vals * vals, minlength=n))
+    vals = vals / np.where(norms > 0, norms, 1.0)[rows]
+    self_sim = (norms > 0).astype(float)       # diag(X X^T) after normalization
+
+    def sim_dot(vec):                           # (X X^T - I) @ vec
+        xt = np.bincount(cols, weights=vals * vec[rows], minlength=v)
+        return np.bincount(rows, weights=vals * xt[cols], minlength=n) - self_sim * vec
+
+    degree = sim_dot(np.ones(n))
+    inv_degree = np.where(degree > 1e-12, 1.0 / np.maximum(degree, 1e-12), 0.0)
+    r = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        nxt = (1.0 - damping) / n + damping * sim_dot(r * inv_degree)
+        if np.abs(nxt - r).sum() < tol:
+            r = nxt
+            break
+        r = nxt
+    return r
+
+
 def _textrank_summarize(text: str, max_sentences: int = 5) -> str:
-    # naive frequency-based sentence scorer (safe, no external deps)
-    import re
-    sentences = re.split(r'(?<=[.!?]) +', text)
+    sentences = [s for s in _SENT_BOUNDARY_RE.split(text) if s.strip()]
     if len(sentences) <= max_sentences:
         return text
-    # word freq
-    words = re.findall(r"\w+", text.lower())
-    freq = {}
-    for w in words:
-        freq[w] = freq.get(w, 0) + 1
-    # score sentences
-    sscore = []
-    for s in sentences:
-        s_words = re.findall(r"\w+", s.lower())
-        if not s_words:
-            sscore.append((0, s))
-            continue
-        score = sum(freq.get(w, 0) for w in s_words) / len(s_words)
-        sscore.append((score, s))
-    sscore.sort(reverse=True, key=lambda x: x[0])
-    selected = [s for _, s in sscore[:max_sentences]]
+    if not _NUMPY:
+        return _frequency_summarize(sentences, max_sentences)
+    scores = _textrank_scores(sentences)
+    top = np.argsort(-scores, kind="stable")[:max_sentences]
     # keep original order
-    selected_sorted = [s for s in sentences if s in selected]
-    return " ".join(selected_sorted)
+    return " ".join(sentences[i].strip() for i in sorted(top.tolist()))
 
 
 # -------------------------
 # Summarizer orchestrator
 # -------------------------
-def _summarize_text(text: str, max_words_chunk=350, prefer="auto") -> str:
+SUMMARY_BATCH_SIZE = 8        # chunks per transformers forward pass
+LLM_MAX_IN_FLIGHT = 4         # concurrent chat-model requests per document
+_REDUCE_MAX_WORDS = 600       # longer map output gets summarized again
+_REDUCE_MAX_LEVELS = 2
+
+def _summary_backend(prefer: str = "auto") -> str:
+    """
+    Backend _summarize_text tries first. Cache lookups use it; results are
+    stored under the backend that actually produced them (see _summarize),
+    so a fallback summary never answers for the preferred backend.
+    """
+    if prefer in ("openai", "auto") and _OPENAI_AVAILABLE:
+        return "openai"
+    if prefer in ("transformers", "auto") and _TRANSFORMERS_AVAILABLE:
+        return "transformers"
+    if prefer in ("ollama", "auto") and _ollama_available():
+        return "ollama"
+    return "textrank"
+
+
+def _file_digest(path: str) -> Optional[str]:
+    try:
+        return summary_cache.file_digest(path)
+    except Exception:
+        return None
+
+
+def _summarize_batched(summarizer, chunks: List[str], batch_size: int = SUMMARY_BATCH_SIZE) -> List[str]:
+    """
+    Run the summarizer over chunks in batches (results in input order).
+    Chunks are grouped by length so each batch pads only to its own
+    longest member (padding is per batch).
+    """
+    order = sorted(range(len(chunks)), key=lambda i: len(chunks[i]))
+    outs: List[str] = [""] * len(chunks)
+    step = max(1, int(batch_size))
+    for b in range(0, len(order), step):
+        idx = order[b:b + step]
+        res = summarizer(
+            [chunks[i] for i in idx],
+            max_length=130, min_length=30, do_sample=False,
+            truncation=True, batch_size=len(idx),
+        )
+        for i, r in zip(idx, res):
+            outs[i] = r["summary_text"]
+    return outs
+
+
+# ---- chat-model backends (prompt -> text) ----
+_LLM_PROMPT = (
+    "Summarize the following text into 4-6 concise bullet points. "
+    "Be precise and keep technical terms if present:\n\n"
+)
+_OLLAMA_CHECK_TTL = 60.0
+_ollama_state = {"checked": 0.0, "client": None}
+_ollama_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_model() -> str:
+    """Model discovery, once per process (not once per chunk)."""
+    try:
+        ids = {m["id"] if isinstance(m, dict) else getattr(m, "id", "") for m in openai.Model.list()["data"]}
+        return "gpt-4o-mini" if "gpt-4o-mini" in ids else "gpt-4"
+    except Exception:
+        return "gpt-4"
+
+
+def _openai_complete(prompt: str) -> str:
+    # Use ChatCompletion if available
+    try:
+        resp = openai.ChatCompletion.create(
+            model=_openai_model(),
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.0,
+            max_tokens=450
+        )
+        return resp.choices[0].message.content.strip()
+    except Exception:
+        # fallback to completion
+        resp = openai.Completion.create(
+            engine="text-davinci-003",
+            prompt=prompt,
+            max_tokens=450,
+            temperature=0.0
+        )
+        return resp.choices[0].text.strip()
+
+
+def _ollama_available() -> bool:
+    """Is the local Ollama server up? (result cached for a minute)"""
+    with _ollama_lock:
+        if time.time() - _ollama_state["checked"] < _OLLAMA_CHECK_TTL:
+            return _ollama_state["client"] is not None
+        _ollama_state["checked"] = time.time()
+        _ollama_state["client"] = None
+        try:
+            from core.ai_chat import OllamaClient
+            client = OllamaClient()
+            if client.available():
+                _ollama_state["client"] = client
+        except Exception:
+            pass
+        return _ollama_state["client"] is not None
+
+
+def _ollama_complete(prompt: str) -> str:
+    client = _ollama_state["client"]
+    out = client.ask("You summarize documents accurately.", prompt) if client else None
+    if not out:
+        raise RuntimeError("ollama returned no summary")
+    return out
+
+
+def _summarize_with_llm(chunks: List[str], complete: Callable[[str], str],
+                        max_in_flight: int = LLM_MAX_IN_FLIGHT) -> str:
+    """
+    Map every chunk through `complete` concurrently. At most
+    `max_in_flight` requests run at once; results keep chunk order.
+    """
+    prompts = [_LLM_PROMPT + ch for ch in chunks]
+    if len(prompts) == 1 or max_in_flight <= 1:
+        return "\n\n".join(complete(p) for p in prompts)
+    with ThreadPoolExecutor(max_workers=min(max_in_flight, len(prompts)),
+                            thread_name_prefix="JarvisSummarize") as pool:
+        return "\n\n".join(pool.map(complete, prompts))
+
+
+def _summarize(text: str, max_words_chunk=350, prefer="auto",
+               batch_size: int = SUMMARY_BATCH_SIZE, hierarchical: bool = True,
+               llm: Optional[Callable[[str], str]] = None,
+               max_in_flight: int = LLM_MAX_IN_FLIGHT) -> Tuple[str, str]:
     """
-    prefer: "openai", "transformers", "textrank", or "auto"
+    (summary, backend that produced it).
+    prefer: "openai", "transformers", "ollama", "textrank", or "auto"
+    batch_size / hierarchical apply to the transformers backend.
+    llm: optional prompt -> text callable used instead of the built-in
+    backends ("llm"); LLM chunks run with up to max_in_flight concurrent requests.
     """
+    # Caller-supplied chat backend (any prompt -> text callable)
+    if llm is not None:
+        try:
+            return _summarize_with_llm(_chunk_text(text, max_words=max_words_chunk), llm, max_in_flight), "llm"
+        except Exception:
+            pass
+
     # Try OpenAI first if requested / available
     if prefer in ("openai", "auto") and _OPENAI_AVAILABLE:
         try:
-            # chunk and prompt
             chunks = _chunk_text(text, max_words=max_words_chunk)
-            summaries = []
-            for ch in chunks:
-                prompt = (
-                    "Summarize the following text into 4-6 concise bullet points. "
-                    "Be precise and keep technical terms if present:\n\n" + ch
-                )
-                # Use ChatCompletion if available
-                try:
-                    resp = openai.ChatCompletion.create(
-                        model="gpt-4o-mini" if "gpt-4o-mini" in openai.Model.list() else "gpt-4",
-                        messages=[{"role": "user", "content": prompt}],
-                        temperature=0.0,
-                        max_tokens=450
-                    )
-                    summary = resp.choices[0].message.content.strip()
-                except Exception:
-                    # fallback to completion
-                    resp = openai.Completion.create(
-                        engine="text-davinci-003",
-                        prompt=prompt,
-                        max_tokens=450,
-                        temperature=0.0
-                    )
-                    summary = resp.choices[0].text.strip()
-                summaries.append(summary)
-            return "\n\n".join(summaries)
+            return _summarize_with_llm(chunks, _openai_complete, max_in_flight), "openai"
         except Exception:
             pass
 
     # Try transformers summarizer if available
     if prefer in ("transformers", "auto") and _TRANSFORMERS_AVAILABLE:
         try:
-            summarizer = pipeline("summarization", model="sshleifer/distilbart-cnn-12-6")
             chunks = _chunk_text(text, max_words=max_words_chunk)
-            outs = []
-            for ch in chunks:
-                out = summarizer(ch, max_length=130, min_length=30, do_sample=False)
-                outs.append(out[0]["summary_text"])
-            return "\n\n".join(outs)
+            with model_registry.use("summarizer") as summarizer:
+                # map: every chunk, batched
+                outs = _summarize_batched(summarizer, chunks, batch_size)
+                # reduce: very long texts → summarize the summaries again
+                levels = 0
+                while (
+                    hierarchical and len(outs) > 1 and levels < _REDUCE_MAX_LEVELS
+                    and sum(len(o.split()) for o in outs) > _REDUCE_MAX_WORDS
+                ):
+                    outs = _summarize_batched(
+                        summarizer, _chunk_text(" ".join(outs), max_words=max_words_chunk), batch_size
+                    )
+                    levels += 1
+            return "\n\n".join(outs), "transformers"
+        except Exception:
+            pass
+
+    # Local Ollama model (same client as the chat brain)
+    if prefer in ("ollama", "auto") and _ollama_available():
+        try:
+            chunks = _chunk_text(text, max_words=max_words_chunk)
+            return _summarize_with_llm(chunks, _ollama_complete, max_in_flight), "ollama"
         except Exception:
             pass
 
     # Final fallback - textrank
-    return _textrank_summarize(text, max_sentences=6)
+    return _textrank_summarize(text, max_sentences=6), "textrank"
+
+
+def _summarize_text(text: str, **kwargs) -> str:
+    """Summary only; same arguments as _summarize."""
+    return _summarize(text, **kwargs)[0]
 
 
 # -------------------------
@@ -161,27 +434,74 @@ class DocumentReader:
     def __init__(self):
         self._thread = None
 
-    def _extract_text_pdf(self, path: str) -> str:
+    # ---------------- streaming extraction ----------------
+    def _iter_pages_pdf(self, path: str) -> Iterator[str]:
+        """Yield page texts one at a time (pages are parsed on access)."""
         if not PyPDF2:
             raise RuntimeError("PyPDF2 not installed")
         try:
             reader = PyPDF2.PdfReader(path)
-            pages = []
             for p in reader.pages:
-                t = p.extract_text() or ""
-                pages.append(t)
-            return "\n\n".join(pages)
+                try:
+                    yield p.extract_text() or ""
+                except Exception:
+                    yield ""
         except Exception:
-            return ""
+            return
 
-    def _extract_text_docx(self, path: str) -> str:
+    def _iter_paragraphs_docx(self, path: str) -> Iterator[str]:
         if not docx:
             raise RuntimeError("python-docx not installed")
         try:
             doc = docx.Document(path)
-            return "\n".join([p.text for p in doc.paragraphs if p.text.strip()])
         except Exception:
-            return ""
+            return
+        for p in doc.paragraphs:
+            if p.text.strip():
+                yield p.text
+
+    def _iter_paragraphs_plain(self, path: str, max_chars: int = 8192) -> Iterator[str]:
+        """Yield blank-line separated paragraphs (capped, for huge single blocks)."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                para: List[str] = []
+                size = 0
+                for line in f:
+                    if line.strip():
+                        para.append(line)
+                        size += len(line)
+                        if size < max_chars:
+                            continue
+                    if para:
+                        yield "".join(para)
+                        para, size = [], 0
+                if para:
+                    yield "".join(para)
+        except Exception:
+            return
+
+    def iter_text(self, path: str) -> Iterator[str]:
+        """Stream a document as pages (PDF) or paragraphs (DOCX / text)."""
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".pdf":
+            return self._iter_pages_pdf(path)
+        if ext in (".docx", ".doc"):
+            return self._iter_paragraphs_docx(path)
+        return self._iter_paragraphs_plain(path)
+
+    # ---------------- whole-text extraction (summaries) ----------------
+    def _extract_text_pdf(self, path: str) -> str:
+        # big PDFs: page ranges extracted in a process pool
+        if not PyPDF2:
+            raise RuntimeError("PyPDF2 not installed")
+        try:
+            # the shared pool shuts down when its last extraction finishes
+            return "\n\n".join(pdf_extract.extract_pages(path))
+        except Exception:
+            return "\n\n".join(self._iter_pages_pdf(path))
+
+    def _extract_text_docx(self, path: str) -> str:
+        return "\n".join(self._iter_paragraphs_docx(path))
 
     def _extract_text_plain(self, path: str) -> str:
         try:
@@ -190,10 +510,57 @@ class DocumentReader:
         except Exception:
             return ""
 
-    def _read_chunks_aloud(self, chunks: List[str]):
-        for ch in chunks:
-            if ch.strip():
-                speak(ch.strip(), mood="neutral")
+    def extract_text(self, path: str) -> str:
+        ext = os.path.splitext(path)[1].lower()
+        try:
+            if ext == ".pdf":
+                return self._extract_text_pdf(path)
+            if ext in (".docx", ".doc"):
+                return self._extract_text_docx(path)
+            return self._extract_text_plain(path)
+        except Exception:
+            return ""
+
+    def _read_chunks_aloud(self, chunks: Iterable[str], prefetch: int = 4) -> int:
+        """
+        Speak chunks while the next ones are extracted in a producer thread.
+        The queue bound keeps at most `prefetch` chunks in memory.
+        Returns the number of chunks spoken.
+        """
+        q: "queue.Queue" = queue.Queue(maxsize=max(1, prefetch))
+        done = object()
+        stop = threading.Event()
+
+        def _produce():
+            try:
+                for ch in chunks:
+                    if stop.is_set():
+                        break
+                    if ch.strip():
+                        q.put(ch.strip())
+            except Exception as e:
+                print("⚠️ document extraction error:", e)
+            finally:
+                q.put(done)
+
+        threading.Thread(target=_produce, daemon=True, name="JarvisDocExtract").start()
+        spoken = 0
+        try:
+            while True:
+                ch = q.get()
+                if ch is done:
+                    break
+                speak(ch, mood="neutral")
+                spoken += 1
+        finally:
+            # unblock the producer if speaking failed midway
+            stop.set()
+            while True:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    break
+        return spoken
 
     def read(self, path: str, summarize_first: bool = False, prefer_summarizer: str = "auto") -> Optional[str]:
         """
@@ -204,36 +571,42 @@ class DocumentReader:
             speak("I couldn't find that file.", mood="alert")
             return None
 
-        ext = os.path.splitext(path)[1].lower()
-        text = ""
-        try:
-            if ext == ".pdf":
-                text = self._extract_text_pdf(path)
-            elif ext in (".docx", ".doc"):
-                text = self._extract_text_docx(path)
-            else:
-                text = self._extract_text_plain(path)
-        except Exception:
-            text = ""
-
-        if not text.strip():
-            speak("The document is empty or unreadable.", mood="alert")
+        # Normal read: stream pages → chunks → speech
+        if not summarize_first:
+            try:
+                spoken = self._read_chunks_aloud(_iter_chunks(self.iter_text(path), max_words=300))
+            except Exception:
+                spoken = 0
+            if not spoken:
+                speak("The document is empty or unreadable.", mood="alert")
             return None
 
-        # If summary requested, do summarization first and speak summary then offer to read details
-        if summarize_first:
+        # Summary requested: reuse a cached one for identical content
+        digest = _file_digest(path)
+        params = {"backend": _summary_backend(prefer_summarizer), "max_words_chunk": 350,
+                  "reduce_max_words": _REDUCE_MAX_WORDS}
+        summary = summary_cache.get("summary", digest, params) if digest else None
+
+        if summary is None:
+            # summarizers need the whole text
+            text = summary_cache.get("text", digest) if digest else None
+            if text is None:
+                text = self.extract_text(path)
+                if digest and text.strip():
+                    summary_cache.put("text", digest, None, text)
+            if not text.strip():
+                speak("The document is empty or unreadable.", mood="alert")
+                return None
+
             speak("Creating a concise summary of this document...", mood="neutral")
-            summary = _summarize_text(text, prefer=prefer_summarizer)
-            # speak summary
-            speak("Here is a short summary:", mood="happy")
-            speak(summary, mood="neutral")
-            # offer to read full text
-            return summary
-
-        # Normal read: chunk and speak
-        chunks = _chunk_text(text, max_words=300)
-        self._read_chunks_aloud(chunks)
-        return None
+            summary, used = _summarize(text, prefer=prefer_summarizer)
+            if digest:
+                summary_cache.put("summary", digest, dict(params, backend=used), summary)
+        # speak summary
+        speak("Here is a short summary:", mood="happy")
+        speak(summary, mood="neutral")
+        # offer to read full text
+        return summary
 
     def read_async(self, path: str, summarize_first: bool = False, prefer_summarizer: str = "auto"):
         t = threading.Thread(target=self.read, args=(path, summarize_first, prefer_summarizer), daemon=True)
@@ -24,8 +24,10 @@ class JarvisEmotionReflection:
     def __init__(self):
         # ensure shared emotional history exists only once
         if "emotion_history" not in shared_memory.memory:
-            shared_memory.memory["emotion_history"] = []
-            shared_memory._save_memory()
+            def _init(d):
+                d.setdefault("emotion_history", [])
+
+            shared_memory.mutate(_init)
         print("🧠 Emotion Reflection Engine Ready")
 
     # ----------------------------------------------------------
@@ -39,12 +41,14 @@ class JarvisEmotionReflection:
             "time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
 
-        hist = shared_memory.memory.get("emotion_history", [])
-        hist.append(entry)
+        def _append(d):
+            hist = list(d.get("emotion_history", []))
+            hist.append(entry)
+
+            # keep only last 12 moods
+            d["emotion_history"] = hist[-12:]
 
-        # keep only last 12 moods
-        shared_memory.memory["emotion_history"] = hist[-12:]
-        shared_memory._save_memory()
+        shared_memory.mutate(_append)
 
     # ----------------------------------------------------------
     def reflect(self, last_topic=None):
@@ -11,9 +11,9 @@ Fully compatible with:
 """
 
 import cv2
-import time
 
-from core.memory_engine import shared_memory
+from core.camera_service import camera
+from core.memory_engine import memory as shared_memory
 from core.speech_engine import speak
 from core.voice_effects import JarvisEffects
 
@@ -39,16 +39,9 @@ class FaceEmotionAnalyzer:
     
     # ---------------------------------------------------------
     def capture_emotion(self):
-        """Capture one frame and analyze emotion in safe mode."""
-        cap = cv2.VideoCapture(0)
-        if not cap.isOpened():
-            return None
-
-        time.sleep(0.4)
-        ret, frame = cap.read()
-        cap.release()
-
-        if not ret:
+        """Grab the latest camera frame and analyze emotion in safe mode."""
+        frame = camera.get_frame()
+        if frame is None:
             return None
 
         # ----------------------------------------------------
@@ -6,6 +6,7 @@ import threading
 import numpy as np
 import sounddevice as sd
 from PyQt5 import QtCore, QtGui, QtWidgets
+import core.state as state
 
 # Keep the same class name and public API (run, stop, set_status, set_mood, react_to_audio)
 
@@ -67,6 +68,11 @@ class InterfaceOverlay(QtWidgets.QWidget):
         self._cached_font = QtGui.QFont("Segoe UI", 9, QtGui.QFont.Bold)
         self._cached_pen = QtGui.QPen(QtCore.Qt.NoPen)
 
+        # Follow Jarvis' mood from shared state (brain / conversation writers)
+        self._unsubscribe_mood = state.subscribe(
+            "JARVIS_MOOD", lambda _n, _old, mood, _v: self.set_mood(mood)
+        )
+
         # Ensure a clean initial opacity
         self.setWindowOpacity(0.0)
 
@@ -265,6 +271,7 @@ class InterfaceOverlay(QtWidgets.QWidget):
         # Gracefully stop everything
         print("🛑 Siri-style Overlay stopping...")
         self.running = False
+        self._unsubscribe_mood()
 
         # stop timers & animations on Qt thread
         try:
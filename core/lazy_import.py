@@ -0,0 +1,76 @@
+# core/lazy_import.py
+"""
+Lazy stand-ins for heavy optional modules.
+
+    document_reader = lazy_import("core.document_reader", "document_reader")
+
+behaves like `from core.document_reader import document_reader`, except
+the import runs on first real use (attribute access or call), not when
+the importing module loads. A truth test (`if document_reader:`) is a use
+too: it attempts the real import once and caches the result, so it is
+False exactly when the old try/except-None import would have left None.
+Put cheap checks before it (`if "read" in command and document_reader:`).
+"""
+
+import importlib
+import threading
+import time
+
+_MISSING = object()
+
+
+class LazyImport:
+    def __init__(self, module: str, attr: str = None):
+        object.__setattr__(self, "_module", module)
+        object.__setattr__(self, "_attr", attr)
+        object.__setattr__(self, "_target", _MISSING)
+        object.__setattr__(self, "_error", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _load(self):
+        target = self._target
+        if target is not _MISSING:
+            return target
+        with self._lock:
+            if self._target is _MISSING:
+                if self._error is not None:
+                    raise ImportError(f"{self._module} unavailable: {self._error}")
+                try:
+                    started = time.perf_counter()
+                    mod = importlib.import_module(self._module)
+                    target = getattr(mod, self._attr) if self._attr else mod
+                    print(f"📦 Loaded {self._module} on first use ({time.perf_counter() - started:.2f}s)")
+                except Exception as e:
+                    object.__setattr__(self, "_error", e)
+                    print(f"⚠️ {self._module} unavailable:", e)
+                    raise ImportError(f"{self._module} unavailable: {e}") from e
+                object.__setattr__(self, "_target", target)
+            return self._target
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not _MISSING
+
+    def __bool__(self):
+        try:
+            return bool(self._load())
+        except ImportError:
+            return False
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else ("failed" if self._error else "deferred")
+        name = f"{self._module}.{self._attr}" if self._attr else self._module
+        return f"<lazy {name} ({state})>"
+
+
+def lazy_import(module: str, attr: str = None) -> LazyImport:
+    return LazyImport(module, attr)
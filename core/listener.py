@@ -32,10 +32,7 @@ try:
 except Exception:
     sleep_manager = None
 
-try:
-    import core.state as state
-except Exception:
-    state = type("S", (), {})()  # dummy object to avoid crashes
+import core.state as state
 
 try:
     import core.voice_effects as voice_effects
@@ -135,6 +132,8 @@ class JarvisListener:
         self.listening = False
         self.active_inactivity_timeout = int(active_inactivity_timeout)
         self._last_active_command_ts = 0.0
+        self._active_exit = threading.Event()   # set when active mode ends
+        self._active_exit.set()
 
         # speaking flag to avoid TTS self-pickup
         self._is_speaking = False
@@ -154,11 +153,9 @@ class JarvisListener:
         self._consumer_thread = threading.Thread(target=self._audio_consumer_loop, daemon=True, name="JarvisAudioConsumer")
         self._consumer_thread.start()
 
-        # ensure state.SYSTEM_SPEAKING exists
-        try:
-            setattr(state, "SYSTEM_SPEAKING", bool(getattr(state, "SYSTEM_SPEAKING", False)))
-        except Exception:
-            pass
+        # react to state changes pushed by other modules (TTS, sleep manager)
+        state.subscribe("SYSTEM_SPEAKING", self._on_speaking_changed)
+        state.subscribe("MODE", self._on_mode_changed)
 
         print("✅ Microphone ready — starting background listener and waiting for wake word.")
 
@@ -206,10 +203,11 @@ class JarvisListener:
             except Exception:
                 pass
 
-            # one-time ambient calibration
+            # one-time ambient calibration (short — the dynamic energy
+            # threshold keeps adapting afterwards)
             try:
                 with sr.Microphone() as src:
-                    self.recognizer.adjust_for_ambient_noise(src, duration=1)
+                    self.recognizer.adjust_for_ambient_noise(src, duration=0.5)
             except Exception:
                 pass
 
@@ -234,8 +232,13 @@ class JarvisListener:
         - Routes text to wake or active mode
         """
         while self.running:
+            # block until audio arrives; in active mode only until the
+            # inactivity deadline (no periodic polling while idle)
+            timeout = None
+            if self.active_mode:
+                timeout = max(0.05, self._last_active_command_ts + self.active_inactivity_timeout - time.time())
             try:
-                audio = self._audio_queue.get(timeout=0.4)
+                audio = self._audio_queue.get(timeout=timeout)
             except Empty:
                 # check inactivity → exit active mode
                 if (
@@ -245,6 +248,10 @@ class JarvisListener:
                     self._exit_active_mode()
                 continue
 
+            # None = wake-up token (mode change / stop) → re-evaluate timeout
+            if audio is None:
+                continue
+
             # Avoid pickup of TTS output
             if getattr(state, "SYSTEM_SPEAKING", False) or self._is_speaking:
                 continue
@@ -327,6 +334,10 @@ class JarvisListener:
             self.active_mode = True
             self.listening = True
             self._last_active_command_ts = time.time()
+            self._active_exit.clear()
+
+        # let the consumer switch to the inactivity deadline
+        self._poke_consumer()
 
         # prevent sleep reset
         try:
@@ -361,9 +372,8 @@ class JarvisListener:
             except Exception:
                 pass
 
-        # Loop until inactivity triggers exit (handled by consumer thread)
-        while self.active_mode and self.running:
-            time.sleep(0.3)
+        # Wait until inactivity triggers exit (handled by consumer thread)
+        self._active_exit.wait()
 
         # exiting active mode
         with self._active_mode_lock:
@@ -385,6 +395,14 @@ class JarvisListener:
                 state.LAST_INTERACTION = time.time()
             except:
                 pass
+            self._active_exit.set()
+
+    def _poke_consumer(self):
+        """Wake the consumer thread without audio (it re-reads its timeout)."""
+        try:
+            self._audio_queue.put_nowait(None)
+        except Exception:
+            pass  # queue full — consumer is awake anyway
 
 # END OF PART 2/4
 # PART 3/4 — core/listener.py (continue below Part 2)
@@ -743,7 +761,10 @@ class JarvisListener:
                 pass
 
             state.MODE = "active"
-            state.LAST_INTERACTION = time.time()
+            if sleep_manager and hasattr(sleep_manager, "touch"):
+                sleep_manager.touch()
+            else:
+                state.LAST_INTERACTION = time.time()
 
         except Exception as e:
             print("⚠️ Wake error:", e)
@@ -759,9 +780,21 @@ class JarvisListener:
     # -------------------------------------------------------
     # SET SPEAKING STATE
     def set_speaking(self, speaking: bool):
+        state.SYSTEM_SPEAKING = bool(speaking)
+        self._apply_speaking(bool(speaking))
+
+    def _on_speaking_changed(self, _name, _old, speaking, _version):
+        self._apply_speaking(bool(speaking))
+
+    def _on_mode_changed(self, _name, _old, mode, _version):
+        # sleep manager put Jarvis to sleep → leave active mode right away
+        if mode == "sleep" and self.active_mode:
+            self._exit_active_mode()
+            self._poke_consumer()
+
+    def _apply_speaking(self, speaking: bool):
         try:
             self._is_speaking = speaking
-            state.SYSTEM_SPEAKING = speaking
 
             base = int(_DEFAULTS["energy_threshold"])
             if speaking:
@@ -776,6 +809,8 @@ class JarvisListener:
     def stop(self):
         print("🛑 Listener stopping...")
         self.running = False
+        self._active_exit.set()
+        self._poke_consumer()
 
         try:
             if self._bg_stop_fn:
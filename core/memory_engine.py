@@ -1,20 +1,165 @@
 # core/memory_engine.py
 import json
 import os
+import queue
+import re
 import tempfile
+import threading
+import types
 import random
 from core.speech_engine import speak
+import core.text_analysis as text_analysis
+
+# optional fuzzy matching for fact recall
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+    _FUZZY = True
+except Exception:
+    _FUZZY = False
 
 # Module-level singleton holder
 _INSTANCE = None
 
 
+def _default_memory():
+    return {
+        "facts": {},
+        "mood": "neutral",
+        "last_topic": None,
+        "emotion_history": []
+    }
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+_RECALL_STOPWORDS = frozenset([
+    "a", "an", "the", "is", "are", "was", "what", "whats", "what's",
+    "of", "my", "me", "your", "about", "tell", "do", "you", "know",
+])
+
+
+def _tokens(text):
+    return _TOKEN_RE.findall(str(text).lower())
+
+
+class _FactIndex:
+    """
+    Inverted token index over fact keys + values, with a rapidfuzz typo
+    fallback. Updated incrementally from the memory writer thread; lookups
+    only touch the query's tokens, so recall stays fast with 10k+ facts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key_postings = {}     # token -> set(fact keys)
+        self._value_postings = {}   # token -> set(fact keys)
+        self._entries = {}          # fact key -> (key tokens, value tokens)
+        self._vocab = {}            # first letter -> set(tokens), for fuzzy search
+
+    def rebuild(self, facts):
+        with self._lock:
+            self._key_postings = {}
+            self._value_postings = {}
+            self._entries = {}
+            self._vocab = {}
+            for k, v in facts.items():
+                self._add_locked(k, v)
+
+    def add(self, key, value):
+        with self._lock:
+            self._remove_locked(key)
+            self._add_locked(key, value)
+
+    def remove(self, key):
+        with self._lock:
+            self._remove_locked(key)
+
+    def _add_locked(self, key, value):
+        ktoks = set(_tokens(key))
+        vtoks = set(_tokens(value))
+        for postings, toks in ((self._key_postings, ktoks), (self._value_postings, vtoks)):
+            for t in toks:
+                postings.setdefault(t, set()).add(key)
+                self._vocab.setdefault(t[0], set()).add(t)
+        self._entries[key] = (ktoks, vtoks)
+
+    def _remove_locked(self, key):
+        entry = self._entries.pop(key, None)
+        if not entry:
+            return
+        for postings, toks in ((self._key_postings, entry[0]), (self._value_postings, entry[1])):
+            for t in toks:
+                keys = postings.get(t)
+                if keys:
+                    keys.discard(key)
+                    if not keys:
+                        del postings[t]
+                if t not in self._key_postings and t not in self._value_postings:
+                    self._vocab.get(t[0], set()).discard(t)
+
+    def search(self, query, fuzzy_cutoff=80):
+        """Return the best-matching fact key for `query`, or None."""
+        toks = _tokens(query)
+        content = [t for t in toks if t not in _RECALL_STOPWORDS] or toks
+        if not content:
+            return None
+
+        with self._lock:
+            best = self._score_locked(content)
+            if best is not None or not _FUZZY:
+                return best
+
+            # typo fallback: snap unknown tokens onto the indexed vocabulary,
+            # bucketed by first letter so only a small slice is compared
+            corrected = []
+            for t in content:
+                if t in self._key_postings or t in self._value_postings:
+                    corrected.append(t)
+                    continue
+                hit = fuzz_process.extractOne(
+                    t, self._vocab.get(t[0], ()),
+                    scorer=fuzz.ratio, score_cutoff=fuzzy_cutoff
+                )
+                if not hit:
+                    # a token nothing resembles can't be dropped: "mom phone"
+                    # must not answer with the "phone" fact
+                    return None
+                corrected.append(hit[0])
+            if corrected == content:
+                return None
+            return self._score_locked(corrected)
+
+    def _score_locked(self, content):
+        content = set(content)
+        # token hits rank candidates: a key match counts double a value match
+        scores = {}
+        matched = {}    # fact key -> content tokens found in its key or value
+        for t in content:
+            for postings, weight in ((self._key_postings, 2), (self._value_postings, 1)):
+                for k in postings.get(t, ()):
+                    scores[k] = scores.get(k, 0) + weight
+                    matched.setdefault(k, set()).add(t)
+
+        # accept only facts where every content token was found somewhere
+        covering = [k for k in scores if len(matched[k]) == len(content)]
+        if not covering:
+            return None
+        return max(covering, key=lambda k: (scores[k], -len(k)))
+
+
 class JarvisMemory:
     """Stores Jarvis’s emotional context, facts, and conversational memory.
 
     This class uses a singleton pattern (via __new__) so repeated calls to
     JarvisMemory() across modules return the same shared instance. This
     prevents repeated initialization prints and duplicated loads.
+
+    Concurrency model (copy-on-write):
+    - Readers use `memory` / `snapshot()` — the last published dict, read
+      without any lock. A published snapshot is never modified again.
+    - Writers go through `mutate(fn)`: `fn` receives a shallow copy of the
+      current snapshot and is applied by a single writer thread, in queue
+      order, so concurrent updates are never lost. Nested containers must
+      be replaced (e.g. `d["facts"] = {**d["facts"], k: v}`), not mutated.
     """
 
     def __new__(cls, *args, **kwargs):
@@ -34,16 +179,17 @@ class JarvisMemory:
         os.makedirs(cfg_dir, exist_ok=True)
         self.file_path = os.path.join(cfg_dir, "memory.json")
 
-        # Default structure
-        self.memory = {
-            "facts": {},
-            "mood": "neutral",
-            "last_topic": None,
-            "emotion_history": []
-        }
+        # Published snapshot + single-writer mutation queue
+        self._snapshot = _default_memory()
+        self._mutations = queue.Queue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+
+        self._facts_index = _FactIndex()
 
         self._load_memory()
         self._validate_structure()
+        self._facts_index.rebuild(self._snapshot.get("facts", {}))
 
         # mark initialized (prevents repeated prints)
         self._initialized = True
@@ -54,56 +200,106 @@ class JarvisMemory:
         """
         Ensures required keys always exist and caps history length.
         """
-        changed = False
+        def _fix(d):
+            for key, default in _default_memory().items():
+                if key not in d:
+                    d[key] = default
 
-        if "facts" not in self.memory:
-            self.memory["facts"] = {}
-            changed = True
+            # limit emotion history to a sensible size to avoid huge files
+            if isinstance(d.get("emotion_history"), list):
+                d["emotion_history"] = d["emotion_history"][-200:]  # keep last 200
 
-        if "mood" not in self.memory:
-            self.memory["mood"] = "neutral"
-            changed = True
+        self.mutate(_fix)
 
-        if "last_topic" not in self.memory:
-            self.memory["last_topic"] = None
-            changed = True
+    # -------------------- SNAPSHOT / MUTATION --------------------
+    @property
+    def memory(self):
+        """Read-only view of the latest snapshot (lock-free)."""
+        return types.MappingProxyType(self._snapshot)
 
-        if "emotion_history" not in self.memory:
-            self.memory["emotion_history"] = []
-            changed = True
+    def snapshot(self):
+        """Return the latest published snapshot as a read-only mapping."""
+        return types.MappingProxyType(self._snapshot)
 
-        # limit emotion history to a sensible size to avoid huge files
-        if isinstance(self.memory.get("emotion_history"), list):
-            self.memory["emotion_history"] = self.memory["emotion_history"][-200:]  # keep last 200
-            changed = True
+    def mutate(self, fn, wait=True):
+        """
+        Queue `fn(draft)` for the writer thread and (by default) block until
+        it is applied and saved. Returns fn's result; re-raises its error.
+        """
+        # a mutation queuing another one would wait on itself forever
+        if threading.current_thread() is self._writer:
+            raise RuntimeError("mutate() called from inside a mutation")
+
+        self._ensure_writer()
+        slot = {"done": threading.Event()}
+        self._mutations.put((fn, slot))
+        if not wait:
+            return None
+
+        slot["done"].wait()
+        if "error" in slot:
+            raise slot["error"]
+        return slot.get("result")
+
+    def flush(self):
+        """Wait until every queued mutation has been applied and saved."""
+        self.mutate(lambda d: None)
+
+    def _ensure_writer(self):
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                t = threading.Thread(target=self._writer_loop, daemon=True, name="JarvisMemoryWriter")
+                self._writer = t
+                t.start()
+
+    def _writer_loop(self):
+        while True:
+            # drain everything queued so one save covers the whole batch
+            batch = [self._mutations.get()]
+            while True:
+                try:
+                    batch.append(self._mutations.get_nowait())
+                except queue.Empty:
+                    break
+
+            for fn, slot in batch:
+                draft = dict(self._snapshot)
+                try:
+                    slot["result"] = fn(draft)
+                    # publish (single reference swap — readers never block)
+                    self._snapshot = draft
+                except Exception as e:
+                    slot["error"] = e
 
-        if changed:
             self._save_memory()
 
+            for _, slot in batch:
+                slot["done"].set()
+
     # -------------------- LOAD / SAVE --------------------
     def _load_memory(self):
         try:
             if os.path.exists(self.file_path):
                 with open(self.file_path, "r", encoding="utf-8") as f:
-                    self.memory = json.load(f)
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._snapshot = data
         except Exception:
             # on any error, reset to defaults (but do not raise)
-            self.memory = {
-                "facts": {},
-                "mood": "neutral",
-                "last_topic": None,
-                "emotion_history": []
-            }
+            self._snapshot = _default_memory()
 
     def _save_memory(self):
         """Atomic save to avoid corrupting the file if interrupted."""
         try:
+            data = self._snapshot
             dirpath = os.path.dirname(self.file_path)
             os.makedirs(dirpath, exist_ok=True)
             fd, tmp = tempfile.mkstemp(dir=dirpath, suffix=".tmp")
             try:
                 with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(self.memory, f, indent=2, ensure_ascii=False)
+                    json.dump(data, f, indent=2, ensure_ascii=False)
                 # atomic replace
                 os.replace(tmp, self.file_path)
             finally:
@@ -123,16 +319,37 @@ class JarvisMemory:
             speak("I need a key to remember that.", mood="alert")
             return
         try:
-            self.memory.setdefault("facts", {})[key.lower()] = value
-            self._save_memory()
+            k = key.lower()
+
+            def _put(d):
+                d["facts"] = {**d.get("facts", {}), k: value}
+                self._facts_index.add(k, value)
+
+            self.mutate(_put)
             speak(f"Got it, Yash. I'll remember that {key} is {value}.", mood="happy")
         except Exception:
             speak("Couldn't save that right now.", mood="alert")
 
     def recall_fact(self, key):
-        if not key:
+        match = self.find_fact(key)
+        return match[1] if match else None
+
+    def find_fact(self, query):
+        """
+        Best-effort lookup: exact key, then token index over keys/values,
+        then fuzzy key match. Returns (key, value) or None.
+        """
+        if not query:
             return None
-        return self.memory.get("facts", {}).get(key.lower())
+        facts = self._snapshot.get("facts", {})
+        q = query.lower().strip(" ?.!")
+        if q in facts:
+            return q, facts[q]
+
+        k = self._facts_index.search(q)
+        if k is not None and k in facts:
+            return k, facts[k]
+        return None
 
     def forget_fact(self, key):
         if not key:
@@ -141,8 +358,13 @@ class JarvisMemory:
         k = key.lower()
         if k in self.memory.get("facts", {}):
             try:
-                del self.memory["facts"][k]
-                self._save_memory()
+                def _drop(d):
+                    facts = dict(d.get("facts", {}))
+                    facts.pop(k, None)
+                    d["facts"] = facts
+                    self._facts_index.remove(k)
+
+                self.mutate(_drop)
                 speak(f"Alright, I’ll forget about {key}.", mood="serious")
             except Exception:
                 speak("Couldn't forget that right now.", mood="alert")
@@ -155,8 +377,11 @@ class JarvisMemory:
         try:
             if not mood:
                 mood = "neutral"
-            self.memory["mood"] = mood
-            self._save_memory()
+
+            def _set(d):
+                d["mood"] = mood
+
+            self.mutate(_set)
         except Exception:
             pass
 
@@ -207,11 +432,14 @@ class JarvisMemory:
                 "mood": mood,
                 "time": __import__("datetime").datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
-            hist = self.memory.get("emotion_history", [])
-            hist.append(entry)
-            # keep last 100 entries
-            self.memory["emotion_history"] = hist[-100:]
-            self._save_memory()
+
+            def _append(d):
+                hist = list(d.get("emotion_history", []))
+                hist.append(entry)
+                # keep last 100 entries
+                d["emotion_history"] = hist[-100:]
+
+            self.mutate(_append)
         except Exception:
             pass
 
@@ -219,8 +447,10 @@ class JarvisMemory:
     def update_topic(self, topic):
         """Remember last topic user talked about (used for context)."""
         try:
-            self.memory["last_topic"] = topic
-            self._save_memory()
+            def _set(d):
+                d["last_topic"] = topic
+
+            self.mutate(_set)
         except Exception:
             pass
 
@@ -236,20 +466,10 @@ class JarvisMemory:
         try:
             if not text:
                 return
-            t = text.lower()
-            if any(w in t for w in ["sad", "low", "depressed", "hurt", "broken"]):
-                self.set_mood("serious")
-                self.add_emotion_history("serious")
-            elif any(w in t for w in ["happy", "great", "awesome", "good", "nice"]):
-                self.set_mood("happy")
-                self.add_emotion_history("happy")
-            elif any(w in t for w in ["angry", "mad", "hate", "furious"]):
-                self.set_mood("alert")
-                self.add_emotion_history("alert")
-            else:
-                # keep neutral for weak signals
-                self.set_mood("neutral")
-                self.add_emotion_history("neutral")
+            # shared MOOD_WORDS table; neutral for weak signals
+            mood = text_analysis.memory_mood(text)
+            self.set_mood(mood)
+            self.add_emotion_history(mood)
         except Exception:
             pass
 
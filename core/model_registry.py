@@ -0,0 +1,228 @@
+# core/model_registry.py
+"""
+Process-wide registry for heavy ML models (summarizer, whisper, ...).
+
+- register(name, loader, size_mb) only records how to build a model;
+  nothing loads until the first acquire()/use().
+- Models are reference counted while a job uses them and stay cached
+  between jobs, so repeated summaries/transcriptions reuse the weights.
+- Unused models are unloaded after `idle_timeout` seconds by a
+  deadline-driven reaper thread.
+- A memory ceiling (max_mb) evicts idle models, least recently used
+  first, before a new one is loaded.
+- A failed load is remembered for `retry_after` seconds: jobs in that
+  window fail fast (callers fall back) instead of retrying a download
+  that just failed.
+- stats() reports loads, load time and job latency per model.
+"""
+
+import gc
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+
+class _Entry:
+    __slots__ = ("name", "loader", "size_mb", "model", "refs", "last_used",
+                 "loads", "load_seconds", "jobs", "job_seconds", "loading",
+                 "failed_at", "error")
+
+    def __init__(self, name, loader, size_mb):
+        self.name = name
+        self.loader = loader
+        self.size_mb = float(size_mb)
+        self.model = None
+        self.refs = 0
+        self.last_used = 0.0
+        self.loads = 0
+        self.load_seconds = 0.0
+        self.jobs = 0
+        self.job_seconds = 0.0
+        self.loading = False
+        self.failed_at = 0.0
+        self.error = None
+
+
+def _measure_mb(model) -> Optional[float]:
+    """Best-effort parameter size of torch models / HF pipelines."""
+    try:
+        module = getattr(model, "model", model)
+        total = sum(p.numel() * p.element_size() for p in module.parameters())
+        return total / (1024 * 1024)
+    except Exception:
+        return None
+
+
+class ModelRegistry:
+    def __init__(self, max_mb: float = 3072, idle_timeout: float = 300.0, retry_after: float = 300.0):
+        self.max_mb = float(max_mb)
+        self.idle_timeout = float(idle_timeout)
+        self.retry_after = float(retry_after)
+        self._entries: Dict[str, _Entry] = {}
+        self._cond = threading.Condition()
+        self._reaper = None
+
+    # ---------------- registration ----------------
+    def register(self, name: str, loader: Callable, size_mb: float = 500):
+        """Record how to build `name`; re-registering keeps a loaded model."""
+        with self._cond:
+            entry = self._entries.get(name)
+            if entry is None:
+                self._entries[name] = _Entry(name, loader, size_mb)
+            else:
+                entry.loader = loader
+                entry.failed_at = 0.0     # a new loader gets a fresh attempt
+
+    # ---------------- acquire / release ----------------
+    def acquire(self, name: str):
+        with self._cond:
+            entry = self._entries[name]
+            # another thread is loading it → wait instead of loading twice
+            while entry.loading:
+                self._cond.wait()
+            if entry.model is None and entry.failed_at and time.time() - entry.failed_at < self.retry_after:
+                raise RuntimeError(f"model '{name}' failed to load recently: {entry.error}")
+            entry.refs += 1
+            entry.last_used = time.time()
+            if entry.model is not None:
+                return entry.model
+            entry.loading = True
+            self._make_room_locked(entry.size_mb)
+
+        started = time.perf_counter()
+        try:
+            model = entry.loader()
+        except Exception as e:
+            with self._cond:
+                entry.refs -= 1
+                entry.loading = False
+                entry.failed_at = time.time()
+                entry.error = e
+                self._cond.notify_all()
+            print(f"⚠️ Could not load model '{name}' (no retry for {self.retry_after:.0f}s):", e)
+            raise
+        elapsed = time.perf_counter() - started
+
+        with self._cond:
+            entry.model = model
+            entry.loading = False
+            entry.failed_at = 0.0
+            entry.loads += 1
+            entry.load_seconds += elapsed
+            measured = _measure_mb(model)
+            if measured:
+                entry.size_mb = measured
+            self._ensure_reaper_locked()
+            self._cond.notify_all()
+        print(f"🧩 Loaded model '{name}' in {elapsed:.2f}s (load #{entry.loads}, ~{entry.size_mb:.0f} MB)")
+        return model
+
+    def release(self, name: str, job_seconds: Optional[float] = None):
+        with self._cond:
+            entry = self._entries[name]
+            entry.refs = max(0, entry.refs - 1)
+            entry.last_used = time.time()
+            if job_seconds is not None:
+                entry.jobs += 1
+                entry.job_seconds += job_seconds
+            self._cond.notify_all()
+
+    @contextmanager
+    def use(self, name: str):
+        """with registry.use("summarizer") as model: ... (logs job latency)"""
+        started = time.perf_counter()
+        model = self.acquire(name)
+        try:
+            yield model
+        finally:
+            elapsed = time.perf_counter() - started
+            self.release(name, job_seconds=elapsed)
+            print(f"🧩 {name} job {elapsed:.2f}s (loads so far: {self._entries[name].loads})")
+
+    # ---------------- eviction ----------------
+    def loaded_mb(self) -> float:
+        return sum(e.size_mb for e in self._entries.values() if e.model is not None)
+
+    def _unload_locked(self, entry: _Entry):
+        entry.model = None
+        print(f"🧩 Unloaded model '{entry.name}'")
+
+    def _make_room_locked(self, needed_mb: float):
+        used = self.loaded_mb()
+        if used + needed_mb <= self.max_mb:
+            return
+        idle = sorted(
+            (e for e in self._entries.values() if e.model is not None and e.refs == 0),
+            key=lambda e: e.last_used,
+        )
+        for e in idle:
+            self._unload_locked(e)
+            used -= e.size_mb
+            if used + needed_mb <= self.max_mb:
+                break
+        gc.collect()
+        if used + needed_mb > self.max_mb:
+            print(f"⚠️ model memory ceiling exceeded ({used + needed_mb:.0f} / {self.max_mb:.0f} MB) — models in use")
+
+    def unload_idle(self, older_than: Optional[float] = None) -> int:
+        """Unload unused models idle for `older_than` seconds (default idle_timeout)."""
+        limit = self.idle_timeout if older_than is None else older_than
+        now = time.time()
+        with self._cond:
+            victims = [
+                e for e in self._entries.values()
+                if e.model is not None and e.refs == 0 and now - e.last_used >= limit
+            ]
+            for e in victims:
+                self._unload_locked(e)
+        if victims:
+            gc.collect()
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+            except Exception:
+                pass
+        return len(victims)
+
+    def _ensure_reaper_locked(self):
+        if self._reaper is None:
+            self._reaper = threading.Thread(target=self._reap_loop, daemon=True, name="JarvisModelReaper")
+            self._reaper.start()
+
+    def _next_expiry_locked(self) -> Optional[float]:
+        times = [
+            e.last_used + self.idle_timeout
+            for e in self._entries.values() if e.model is not None and e.refs == 0
+        ]
+        return min(times) if times else None
+
+    def _reap_loop(self):
+        while True:
+            with self._cond:
+                expiry = self._next_expiry_locked()
+                # sleep until the next model goes idle-expired (or a change)
+                self._cond.wait(None if expiry is None else max(0.05, expiry - time.time()))
+            self.unload_idle()
+
+    # ---------------- diagnostics ----------------
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                e.name: {
+                    "loaded": e.model is not None,
+                    "failed": bool(e.failed_at),
+                    "refs": e.refs,
+                    "size_mb": round(e.size_mb, 1),
+                    "loads": e.loads,
+                    "load_seconds": round(e.load_seconds, 3),
+                    "jobs": e.jobs,
+                    "avg_job_seconds": round(e.job_seconds / e.jobs, 3) if e.jobs else 0.0,
+                }
+                for e in self._entries.values()
+            }
+
+
+# singleton
+model_registry = ModelRegistry()
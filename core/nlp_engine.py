@@ -8,74 +8,302 @@ This version is fully backward-compatible with all your existing files.
 ✓ Higher-quality wake/ack lines
 """
 
+import atexit
+import json
 import os
+import queue
 import random
+import tempfile
 import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_right
 
 # ------------------------------------------------------------
-# HISTORY LOAD
+# PATHS + LIMITS
 # ------------------------------------------------------------
 HISTORY_PATH = os.path.join("config", "nlp_history.txt")
+SNAPSHOT_PATH = os.path.join("config", "nlp_model.json")
 os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
 
-try:
-    with open(HISTORY_PATH, "r", encoding="utf-8") as f:
-        _HISTORY = [line.strip() for line in f.readlines() if line.strip()]
-except:
-    _HISTORY = []
+HISTORY_MAX_BYTES = 2 * 1024 * 1024   # compact history beyond this size
+_SNAPSHOT_INTERVAL = 60.0             # min seconds between model snapshots
+_BATCH_MAX = 256                      # lines per append batch
 
 # ------------------------------------------------------------
-# BUILD MARKOV (safer version)
+# MARKOV MODEL (interned vocabulary + weighted transitions)
 # ------------------------------------------------------------
-def _build_markov(history):
-    M = {}
-    for line in history:
+class _MarkovModel:
+    """
+    Count-weighted bigram table.
+    - words are interned once (word <-> int id)
+    - each state keeps {next_id: count} instead of one list entry per
+      occurrence, so memory grows with distinct pairs, not history size
+    - sampling uses a cached (ids, cumulative weights) array pair and a
+      bisect, rebuilt only for states that changed since the last draw
+    - `_starts` caches every state with successors for O(1) seed picks
+    """
+
+    def __init__(self):
+        self.vocab = {}       # word -> id
+        self.words = []       # id -> word
+        self.counts = []      # id -> {next_id: count}
+        self._tables = {}     # id -> (ids array, cumulative weights array)
+        self._starts = []     # ids that have at least one successor
+
+    def __bool__(self):
+        return bool(self._starts)
+
+    def __contains__(self, word):
+        i = self.vocab.get(word)
+        return i is not None and bool(self.counts[i])
+
+    def _intern(self, word):
+        i = self.vocab.get(word)
+        if i is None:
+            i = len(self.words)
+            self.vocab[word] = i
+            self.words.append(word)
+            self.counts.append({})
+        return i
+
+    def add_pair(self, a, b):
+        ai = self._intern(a)
+        bi = self._intern(b)
+        row = self.counts[ai]
+        if not row:
+            self._starts.append(ai)
+        row[bi] = row.get(bi, 0) + 1
+        self._tables.pop(ai, None)
+
+    def add_line(self, line):
         words = line.split()
-        if len(words) < 2:
-            continue
         for i in range(len(words) - 1):
             a = words[i].lower()
             b = words[i + 1].lower()
             if a.isalpha() and b.isalpha():
-                M.setdefault(a, []).append(b)
+                self.add_pair(a, b)
+
+    def random_word(self):
+        return self.words[random.choice(self._starts)]
+
+    def next_word(self, word):
+        i = self.vocab.get(word)
+        if i is None or not self.counts[i]:
+            return None
+        table = self._tables.get(i)
+        if table is None:
+            row = self.counts[i]
+            ids = array("I", row.keys())
+            cum = array("Q")
+            total = 0
+            for c in row.values():
+                total += c
+                cum.append(total)
+            table = self._tables[i] = (ids, cum)
+        ids, cum = table
+        return self.words[ids[bisect_right(cum, random.random() * cum[-1])]]
+
+
+    # ---- snapshot (de)serialization ----
+    def to_state(self):
+        rows = []
+        for row in self.counts:
+            flat = []
+            for k, c in row.items():
+                flat.append(k)
+                flat.append(c)
+            rows.append(flat)
+        return {"words": self.words, "rows": rows}
+
+    @classmethod
+    def from_state(cls, data):
+        M = cls()
+        M.words = list(data["words"])
+        M.vocab = {w: i for i, w in enumerate(M.words)}
+        M.counts = [dict(zip(flat[::2], flat[1::2])) for flat in data["rows"]]
+        M._starts = [i for i, row in enumerate(M.counts) if row]
+        return M
+
+
+def _build_markov(history):
+    M = _MarkovModel()
+    for line in history:
+        M.add_line(line)
+    return M
+
+
+# ------------------------------------------------------------
+# MODEL SNAPSHOT (startup avoids re-tokenizing the whole history)
+# ------------------------------------------------------------
+_HEAD_BYTES = 256
+
+
+def _history_fingerprint(head_bytes=_HEAD_BYTES):
+    """(size, crc of the first head_bytes) — detects rotation/edits of the file."""
+    try:
+        with open(HISTORY_PATH, "rb") as f:
+            head = f.read(head_bytes)
+        return os.path.getsize(HISTORY_PATH), zlib.crc32(head)
+    except Exception:
+        return 0, 0
+
+
+def _save_snapshot(model):
+    try:
+        size, head = _history_fingerprint()
+        with _LOCK:
+            data = model.to_state()
+        data.update({"version": 1, "history_bytes": size, "history_head": head})
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(SNAPSHOT_PATH), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, SNAPSHOT_PATH)
+    except Exception as e:
+        print("⚠️ nlp snapshot save failed:", e)
+
+
+def _load_model():
+    size, _ = _history_fingerprint()
+    try:
+        with open(SNAPSHOT_PATH, "r", encoding="utf-8") as f:
+            snap = json.load(f)
+        covered = int(snap["history_bytes"])
+        # the snapshot hashed at most `covered` bytes: a file that was still
+        # short then has grown since, so compare the same prefix only
+        if snap.get("version") == 1 and covered <= size and (
+            covered == 0 or snap["history_head"] == _history_fingerprint(min(covered, _HEAD_BYTES))[1]
+        ):
+            M = _MarkovModel.from_state(snap)
+            # replay only lines appended after the snapshot was taken
+            if covered < size:
+                with open(HISTORY_PATH, "rb") as f:
+                    f.seek(covered)
+                    tail = f.read().decode("utf-8", "ignore")
+                for line in tail.splitlines():
+                    if line.strip():
+                        M.add_line(line.strip())
+            return M
+    except Exception:
+        pass
+
+    # no / stale snapshot → one full rebuild, then persist it
+    try:
+        with open(HISTORY_PATH, "r", encoding="utf-8") as f:
+            M = _build_markov(line.strip() for line in f if line.strip())
+    except Exception:
+        M = _MarkovModel()
+    _save_snapshot(M)
     return M
 
-_MARKOV = _build_markov(_HISTORY)
+
 _LOCK = threading.Lock()
+_MARKOV = _load_model()
 
 # ------------------------------------------------------------
-# LEARN (safe, fast)
+# LEARN (single background writer, batched appends)
 # ------------------------------------------------------------
+_QUEUE = queue.Queue()
+_IO_LOCK = threading.Lock()      # held for append + model update + compaction
+_WRITER = None
+_WRITER_LOCK = threading.Lock()
+
+
 def learn(phrase: str):
-    """Safely append phrase & update Markov chain."""
+    """Queue phrase for the history writer (returns immediately)."""
     if not phrase or not phrase.strip():
         return
+    _ensure_writer()
+    _QUEUE.put(phrase.strip())
 
-    phrase = phrase.strip()
+# async wrapper (kept for callers; learn itself no longer blocks)
+def learn_async(phrase):
+    learn(phrase)
+
+
+def flush():
+    """Block until every queued phrase is written and learned."""
+    if _WRITER is not None:
+        _QUEUE.join()
+
+
+# the writer is a daemon thread: drain the last batch on normal exit
+atexit.register(flush)
+
+
+def _ensure_writer():
+    global _WRITER
+    if _WRITER is not None:
+        return
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = threading.Thread(target=_writer_loop, daemon=True, name="JarvisNLPWriter")
+            _WRITER.start()
+
+
+def _writer_loop():
+    unsaved = 0
+    last_save = time.time()
+    while True:
+        batch = [_QUEUE.get()]
+        while len(batch) < _BATCH_MAX:
+            try:
+                batch.append(_QUEUE.get_nowait())
+            except queue.Empty:
+                break
 
-    with _LOCK:
         try:
-            # Write safely to history file
-            with open(HISTORY_PATH, "a", encoding="utf-8") as f:
-                f.write(phrase + "\n")
+            with _IO_LOCK:
+                # one open/append for the whole batch
+                with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+                    f.write("\n".join(batch) + "\n")
 
-            _HISTORY.append(phrase)
+                # bulk Markov update
+                with _LOCK:
+                    for line in batch:
+                        _MARKOV.add_line(line)
+                unsaved += len(batch)
 
-            # Update Markov quickly
-            words = phrase.split()
-            if len(words) > 1:
-                for i in range(len(words) - 1):
-                    a = words[i].lower()
-                    b = words[i + 1].lower()
-                    if a.isalpha() and b.isalpha():
-                        _MARKOV.setdefault(a, []).append(b)
+                # lines not yet in a snapshot are replayed at startup,
+                # so snapshots can stay infrequent
+                compacted = os.path.getsize(HISTORY_PATH) > HISTORY_MAX_BYTES
+                if compacted:
+                    _compact_history()
 
+                if compacted or (unsaved and time.time() - last_save >= _SNAPSHOT_INTERVAL):
+                    _save_snapshot(_MARKOV)
+                    unsaved = 0
+                    last_save = time.time()
         except Exception:
             pass
+        finally:
+            for _ in batch:
+                _QUEUE.task_done()
 
-# async wrapper
-def learn_async(phrase):
-    threading.Thread(target=learn, args=(phrase,), daemon=True).start()
+
+def _compact_history():
+    """
+    Keep only the newest lines (about half the size limit). The Markov
+    model keeps every count, so nothing learned is lost.
+    """
+    try:
+        with open(HISTORY_PATH, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        keep = []
+        budget = HISTORY_MAX_BYTES // 2
+        for line in reversed(lines):
+            budget -= len(line.encode("utf-8"))
+            if budget < 0:
+                break
+            keep.append(line)
+        keep.reverse()
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(HISTORY_PATH), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.writelines(keep)
+        os.replace(tmp, HISTORY_PATH)
+    except Exception as e:
+        print("⚠️ nlp history compaction failed:", e)
 
 
 # ------------------------------------------------------------
@@ -86,21 +314,21 @@ def _markov_generate(seed_word=None, length=8):
     if not _MARKOV:
         return None
 
-    # Seed selection
-    seed = seed_word.lower() if seed_word else random.choice(list(_MARKOV.keys()))
+    # Seed selection (O(1) pick from the cached start-state array)
+    seed = seed_word.lower() if seed_word else _MARKOV.random_word()
     if seed not in _MARKOV:
-        seed = random.choice(list(_MARKOV.keys()))
+        seed = _MARKOV.random_word()
 
     out = [seed.capitalize()]
     cur = seed
 
-    for _ in range(length - 1):
-        options = _MARKOV.get(cur)
-        if not options:
-            break
-        nxt = random.choice(options)
-        out.append(nxt)
-        cur = nxt
+    with _LOCK:
+        for _ in range(length - 1):
+            nxt = _MARKOV.next_word(cur)
+            if not nxt:
+                break
+            out.append(nxt)
+            cur = nxt
 
     sentence = " ".join(out)
     # Make it cleaner (avoid trailing bad tokens)
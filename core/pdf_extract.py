@@ -0,0 +1,122 @@
+# core/pdf_extract.py
+"""
+Multi-process PDF text extraction.
+
+- Page extraction is CPU-bound and independent per page, so large PDFs
+  are split into contiguous page ranges and extracted in a process pool,
+  then reassembled in page order.
+- Small files (or one core, or any pool failure) use the serial path.
+- Kept free of Jarvis imports, so unpickling a task pulls in only this
+  module and PyPDF2. Under spawn (Windows, macOS) every worker also
+  re-imports the launching script: main.py's top-level imports (PyQt5,
+  the overlay, voice effects) run once per worker, while its
+  `if __name__ == "__main__"` guard keeps Jarvis itself from starting.
+  That cost is paid per pool, so the pool is shared by concurrent
+  extractions (reference-counted) and shut down as soon as the last one
+  finishes instead of keeping such workers idle.
+"""
+
+import atexit
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+try:
+    import PyPDF2
+except Exception:
+    PyPDF2 = None
+
+PARALLEL_MIN_PAGES = 48      # below this the pool overhead is not worth it
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+SHARDS_PER_WORKER = 2        # a few extra shards even out slow pages
+
+_POOL = None
+_POOL_WORKERS = 0
+_POOL_USERS = 0
+_POOL_LOCK = threading.Lock()
+
+
+def _extract_range(path: str, start: int, stop: int) -> List[str]:
+    """Worker: extract pages [start, stop) of one PDF."""
+    reader = PyPDF2.PdfReader(path)
+    out = []
+    for i in range(start, stop):
+        try:
+            out.append(reader.pages[i].extract_text() or "")
+        except Exception:
+            out.append("")
+    return out
+
+
+def _get_pool(workers: int):
+    """The shared pool; the caller must _release_pool() it."""
+    global _POOL, _POOL_WORKERS, _POOL_USERS
+    with _POOL_LOCK:
+        # a pool in use keeps its size; only an idle one is resized
+        if _POOL is not None and _POOL_WORKERS != workers and not _POOL_USERS:
+            _POOL.shutdown(wait=False)
+            _POOL = None
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=workers)
+            _POOL_WORKERS = workers
+        _POOL_USERS += 1
+        return _POOL
+
+
+def _release_pool():
+    """One extraction done; the last one shuts the workers down."""
+    global _POOL_USERS
+    with _POOL_LOCK:
+        _POOL_USERS = max(0, _POOL_USERS - 1)
+        if not _POOL_USERS:
+            _stop_locked()
+
+
+def page_count(path: str) -> int:
+    return len(PyPDF2.PdfReader(path).pages)
+
+
+def extract_pages(path: str, workers: Optional[int] = None) -> List[str]:
+    """All page texts in order; parallel for big PDFs, serial otherwise."""
+    if not PyPDF2:
+        raise RuntimeError("PyPDF2 not installed")
+    n = page_count(path)
+    workers = MAX_WORKERS if workers is None else max(1, int(workers))
+    if workers <= 1 or n < PARALLEL_MIN_PAGES:
+        return _extract_range(path, 0, n)
+
+    shards = min(n, workers * SHARDS_PER_WORKER)
+    bounds = [n * i // shards for i in range(shards + 1)]
+    pool = _get_pool(workers)
+    try:
+        futures = [
+            pool.submit(_extract_range, path, bounds[i], bounds[i + 1])
+            for i in range(shards)
+        ]
+        pages: List[str] = []
+        for f in futures:           # submission order == page order
+            pages.extend(f.result())
+        return pages
+    except Exception as e:
+        print("⚠️ parallel PDF extraction failed — using serial:", e)
+        return _extract_range(path, 0, n)
+    finally:
+        _release_pool()
+
+
+def _stop_locked():
+    global _POOL, _POOL_WORKERS
+    if _POOL is not None:
+        _POOL.shutdown(wait=False)
+        _POOL = None
+        _POOL_WORKERS = 0
+
+
+def shutdown():
+    """Stop the workers now, even mid-extraction (exit)."""
+    with _POOL_LOCK:
+        _stop_locked()
+
+
+atexit.register(shutdown)
@@ -8,11 +8,10 @@ from core.speech_engine import speak
 import core.voice_effects as fx
 from core.brain import brain
 
-# Optional emotion module
-try:
-    from core.face_emotion import FaceEmotionAnalyzer
-except:
-    FaceEmotionAnalyzer = None
+# Optional emotion module (cv2 / DeepFace load on the first wake-up)
+from core.lazy_import import lazy_import
+
+FaceEmotionAnalyzer = lazy_import("core.face_emotion", "FaceEmotionAnalyzer")
 
 
 # ---------------------------------------------------------
@@ -29,10 +28,10 @@ SLEEP_LINES = [
 SLEEP_TIMEOUT = 120  
 def _do_sleep_procedure(overlay=None):
 
-    if state.MODE == "sleep":
+    # atomic check-and-set: only one caller performs the transition
+    mode = state.MODE
+    if mode == "sleep" or not state.compare_and_set("MODE", mode, "sleep"):
         return
-    
-    state.MODE = "sleep"
     print("💤 Jarvis entering sleep mode...")
 
     # Soft friendly line
@@ -65,6 +64,14 @@ def _do_wake_procedure(overlay=None):
     print("⚡ Jarvis waking up...")
     state.MODE = "wake_transition"
 
+    # start warming the shared camera while the wake chime plays
+    if FaceEmotionAnalyzer:
+        try:
+            from core.camera_service import camera
+            camera.open(wait=False)
+        except Exception:
+            pass
+
     # wake chime
     try:
         fx.jarvis_fx.play_success()
@@ -76,7 +83,7 @@ def _do_wake_procedure(overlay=None):
 
     # Optional face-emotion
     face_mood = None
-    if FaceEmotionAnalyzer is not None:
+    if FaceEmotionAnalyzer:
         try:
             fe = FaceEmotionAnalyzer()
             face_mood = fe.capture_emotion()
@@ -111,11 +118,29 @@ def _do_wake_procedure(overlay=None):
         pass
 
     state.MODE = "active"
-    state.LAST_INTERACTION = time.time()
+    touch()
 class SleepManager:
+    """
+    Deadline-driven sleep timer.
+    The loop sleeps on a condition variable until exactly
+    LAST_INTERACTION + SLEEP_TIMEOUT. Interactions that only move the
+    deadline later need no signal: on waking the deadline is recomputed
+    and the loop goes back to sleep. Changes that start a new countdown
+    (first interaction, any MODE change) arrive through state
+    subscriptions and call notify().
+    """
+
+    # with no countdown running (asleep / no interaction yet) only a rare
+    # safety re-check happens, in case a notify() was missed
+    IDLE_RECHECK = 60.0
+
     def __init__(self):
         self.running = False
         self.overlay = None     # UI reference
+        self._cond = threading.Condition()
+        self.wakeups = 0        # loop iterations — idle CPU diagnostic
+        state.subscribe("MODE", self._on_state_change)
+        state.subscribe("LAST_INTERACTION", self._on_state_change)
 
     def attach_overlay(self, overlay):
         self.overlay = overlay
@@ -124,32 +149,47 @@ class SleepManager:
         if self.running:
             return
         self.running = True
-        threading.Thread(target=self._loop, daemon=True).start()
+        threading.Thread(target=self._loop, daemon=True, name="JarvisSleepManager").start()
 
     def stop(self):
         self.running = False
+        self.notify()
 
-    def _loop(self):
-        while self.running:
-            try:
-                last = state.LAST_INTERACTION
-                mode = state.MODE
-
-                if last is None:  # no interaction yet
-                    time.sleep(1)
-                    continue
+    def notify(self):
+        """Re-evaluate the sleep deadline now."""
+        with self._cond:
+            self._cond.notify_all()
 
-                if mode == "sleep":
-                    time.sleep(1)
-                    continue
+    def _on_state_change(self, name, old, new, _version):
+        # a later LAST_INTERACTION only pushes the deadline out — the
+        # loop picks that up when it wakes, no signal needed
+        if name == "MODE" or old is None:
+            self.notify()
 
-                idle = time.time() - last
+    def _seconds_to_deadline(self):
+        last = state.LAST_INTERACTION
+        if last is None or state.MODE == "sleep":
+            return None
+        return last + SLEEP_TIMEOUT - time.time()
 
-                if idle >= SLEEP_TIMEOUT:
+    def _loop(self):
+        while self.running:
+            try:
+                with self._cond:
+                    remaining = self._seconds_to_deadline()
+                    if remaining is None:
+                        self._cond.wait(self.IDLE_RECHECK)
+                    elif remaining > 0:
+                        self._cond.wait(remaining)
+
+                self.wakeups += 1
+                if not self.running:
+                    break
+
+                remaining = self._seconds_to_deadline()
+                if remaining is not None and remaining <= 0:
                     _do_sleep_procedure(self.overlay)
 
-                time.sleep(1)
-
             except:
                 time.sleep(1)
 
@@ -157,6 +197,11 @@ class SleepManager:
 manager = SleepManager()
 
 
+def touch():
+    """Record an interaction now (the manager reacts via its subscription)."""
+    state.LAST_INTERACTION = time.time()
+
+
 def start_manager(overlay=None):
     try:
         if overlay:
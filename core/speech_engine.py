@@ -26,6 +26,8 @@ def register_listener_hook(fn):
     """
     Listener will call register_listener_hook(self.set_speaking)
     so speech engine can mute/unmute mic properly.
+    (JarvisListener now follows state.SYSTEM_SPEAKING via state.subscribe;
+    the hook stays for external callers.)
     """
     global LISTENER_HOOK
     LISTENER_HOOK = fn
@@ -182,10 +184,14 @@ jarvis_voice = JarvisVoice()
 
 
 # ---------------- PUBLIC SPEAK FUNCTION ----------------
-def speak(text, mood="neutral", mute_ambient=True):
+def speak(text, mood=None, mute_ambient=True):
     if not text or not text.strip():
         return
 
+    # no explicit mood → use the current shared one
+    if mood is None:
+        mood = state.JARVIS_MOOD
+
     try:
         # Stop ambience during speech
         if mute_ambient:
@@ -1,51 +1,195 @@
 """
 Global runtime state for Jarvis.
-Only variables — no logic, no functions.
 Shared across all modules.
+
+Fields are still read and written as plain module attributes
+(`state.MODE = "sleep"`, `state.LAST_TOPIC`), but every write goes through
+one thread-safe store:
+- atomic, type-checked updates with a global version counter
+- subscribe(name, callback) → callback(name, old, new, version) on change
+- wait_for(name, predicate, timeout) blocks until a field matches,
+  so threads can react to changes instead of polling
 """
 
-# -------------------------------------------------------------
-# FACE AUTH
-# -------------------------------------------------------------
-FACE_VERIFIED = False
+import sys
+import threading
+import types
 
 # -------------------------------------------------------------
-# OPERATION MODES
+# FIELDS  (name → (accepted types, default))
 # -------------------------------------------------------------
-#  "active"          → fully awake, listening normally
-#  "sleep_wait"      → inactivity countdown running
-#  "sleep"           → soft-sleep mode, only wake-word allowed
-#  "wake_transition" → waking animation + dialog
-#  "processing"      → busy executing command
-MODE = "active"
+_NUMBER = (int, float)
+_OPT_STR = (str, type(None))
 
-# -------------------------------------------------------------
-# LISTENING & SPEAKING FLAGS
-# -------------------------------------------------------------
-# Public flags used across listener, command handler, speech engine
-SYSTEM_LISTENING = False        # microphone actively recording speech
-SYSTEM_SPEAKING = False         # TTS speaking (listener should pause)
+_FIELDS = {
+    # ---- FACE AUTH ----
+    "FACE_VERIFIED": (bool, False),
+
+    # ---- OPERATION MODES ----
+    #  "active"          → fully awake, listening normally
+    #  "sleep_wait"      → inactivity countdown running
+    #  "sleep"           → soft-sleep mode, only wake-word allowed
+    #  "wake_transition" → waking animation + dialog
+    #  "processing"      → busy executing command
+    "MODE": (str, "active"),
+
+    # ---- LISTENING & SPEAKING FLAGS ----
+    # Public flags used across listener, command handler, speech engine
+    "SYSTEM_LISTENING": (bool, False),      # microphone actively recording speech
+    "SYSTEM_SPEAKING": (bool, False),       # TTS speaking (listener should pause)
+    "LISTENING": (bool, False),             # alias → avoid breaking older imports
+    "WAKE_WORD_ENABLED": (bool, True),      # wake-word availability
 
-# Backward compatibility for older modules
-LISTENING = False               # alias → avoid breaking older imports
+    # ---- TIMESTAMPS ----
+    "LAST_INTERACTION": (_NUMBER + (type(None),), None),
+    "INACTIVITY_TIMEOUT": (_NUMBER, 120),   # seconds before entering sleep mode
+
+    # ---- EMOTION + CONTEXT ----
+    "USER_TONE": (str, "neutral"),          # user emotional tone detected by audio/text
+    "JARVIS_MOOD": (str, "neutral"),        # internal mood used by brain & speech_engine
+    "LAST_TOPIC": (_OPT_STR, None),         # used for topic continuation in brain
+
+    # Continuous conversation flag (Jarvis stays active)
+    "CONVERSATION_ACTIVE": (bool, False),
+}
 
-# Wake-word availability
-WAKE_WORD_ENABLED = True
 
 # -------------------------------------------------------------
-# TIMESTAMPS
+# STORE
 # -------------------------------------------------------------
-LAST_INTERACTION = None
+class StateStore:
+    """
+    Values live in `namespace` (the module dict for core.state), so reads
+    stay plain attribute lookups; writes take the lock.
+    """
+
+    def __init__(self, fields, namespace=None):
+        self._types = {k: t for k, (t, _) in fields.items()}
+        self._values = namespace if namespace is not None else {}
+        for k, (_, d) in fields.items():
+            self._values[k] = d
+        self._version = 0
+        self._cond = threading.Condition(threading.Lock())
+        self._subs = {}         # name (or "*") → list of callbacks
+
+    def __contains__(self, name):
+        return name in self._types
+
+    @property
+    def version(self):
+        return self._version
+
+    def get(self, name, default=None):
+        # single dict read — atomic, no lock needed
+        return self._values.get(name, default)
+
+    def snapshot(self):
+        """(version, copy of all fields) taken atomically."""
+        with self._cond:
+            return self._version, {k: self._values[k] for k in self._types}
+
+    def _check(self, name, value):
+        types_ = self._types.get(name)
+        if types_ is not None and not isinstance(value, types_):
+            raise TypeError(f"state.{name} expects {types_}, got {type(value).__name__}")
+
+    def set(self, name, value):
+        self._check(name, value)
+        with self._cond:
+            old = self._values.get(name)
+            if old is value or old == value:
+                return self._version
+            self._values[name] = value
+            self._version += 1
+            self._cond.notify_all()
+            version = self._version
+        self._emit(name, old, value, version)
+        return version
+
+    def update(self, **changes):
+        """Apply several fields atomically (one version bump); returns version."""
+        for name, value in changes.items():
+            self._check(name, value)
+        with self._cond:
+            diffs = []
+            for name, value in changes.items():
+                old = self._values.get(name)
+                if old is value or old == value:
+                    continue
+                self._values[name] = value
+                diffs.append((name, old, value))
+            if diffs:
+                self._version += 1
+                self._cond.notify_all()
+            version = self._version
+        # callbacks run outside the lock, in the writer's thread
+        for name, old, new in diffs:
+            self._emit(name, old, new, version)
+        return version
+
+    def compare_and_set(self, name, expected, value):
+        """Set only if the current value equals `expected`; returns bool."""
+        self._check(name, value)
+        with self._cond:
+            if self._values.get(name) != expected:
+                return False
+            if expected == value:
+                return True
+            self._values[name] = value
+            self._version += 1
+            self._cond.notify_all()
+            version = self._version
+        self._emit(name, expected, value, version)
+        return True
+
+    def wait_for(self, name, predicate, timeout=None):
+        """Block until predicate(value) is true; returns it or None on timeout."""
+        with self._cond:
+            ok = self._cond.wait_for(lambda: predicate(self._values.get(name)), timeout)
+            return self._values.get(name) if ok else None
+
+    def subscribe(self, name, callback):
+        """callback(name, old, new, version) on every change of `name` ("*" = any)."""
+        with self._cond:
+            self._subs.setdefault(name, []).append(callback)
+
+        def _unsubscribe():
+            with self._cond:
+                try:
+                    self._subs.get(name, []).remove(callback)
+                except ValueError:
+                    pass
+        return _unsubscribe
+
+    def _emit(self, name, old, new, version):
+        callbacks = self._subs.get(name, []) + self._subs.get("*", [])
+        for cb in callbacks:
+            try:
+                cb(name, old, new, version)
+            except Exception as e:
+                print(f"⚠️ state subscriber error ({name}):", e)
+
+
+store = StateStore(_FIELDS, namespace=globals())
+
+# public helpers
+get = store.get
+update = store.update
+compare_and_set = store.compare_and_set
+subscribe = store.subscribe
+wait_for = store.wait_for
+snapshot = store.snapshot
 
-# Duration (in seconds) before entering sleep mode
-INACTIVITY_TIMEOUT = 120
 
 # -------------------------------------------------------------
-# EMOTION + CONTEXT
+# MODULE ATTRIBUTE WRITES → STORE  (reads hit the module dict directly)
 # -------------------------------------------------------------
-USER_TONE = "neutral"       # user emotional tone detected by audio/text
-JARVIS_MOOD = "neutral"     # internal mood used by brain & speech_engine
-LAST_TOPIC = None           # used for topic continuation in brain
+class _StateModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        if name in store:
+            store.set(name, value)
+        else:
+            super().__setattr__(name, value)
+
 
-# Continuous conversation flag (Jarvis stays active)
-CONVERSATION_ACTIVE = False
+sys.modules[__name__].__class__ = _StateModule
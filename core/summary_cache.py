@@ -0,0 +1,148 @@
+# core/summary_cache.py
+"""
+Persistent content-hash cache for document / video processing results.
+
+- Entries are keyed on the file's content hash plus the kind of result
+  ("text", "segments", "slides", "summary") and the parameters that
+  produced it (summarizer backend, chunk size, ...), so a renamed copy
+  still hits and a different backend never does.
+- One JSON file per entry under config/summary_cache/; total size is
+  bounded and the least recently used entries are evicted first.
+- Content hashes are memoized on (path, size, mtime), so a repeat request
+  for an unchanged file does not even re-read it.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Optional
+
+_HASH_BLOCK = 1 << 20
+
+
+class SummaryCache:
+    def __init__(self, folder: Optional[str] = None, max_bytes: int = 64 * 1024 * 1024):
+        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        self.folder = folder or os.path.join(base_dir, "config", "summary_cache")
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._entries = {}      # key -> [size, last_used]
+        self._total = 0
+        self._digests = {}      # (path, size, mtime_ns) -> content hash
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            self._scan()
+        except Exception as e:
+            print("⚠️ summary cache unavailable:", e)
+
+    def _scan(self):
+        for name in os.listdir(self.folder):
+            if not name.endswith(".json"):
+                continue
+            st = os.stat(os.path.join(self.folder, name))
+            self._entries[name[:-5]] = [st.st_size, st.st_mtime]
+            self._total += st.st_size
+
+    # ---------------- hashing ----------------
+    def file_digest(self, path: str) -> str:
+        """blake2b of the file content (memoized per path/size/mtime)."""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        sig = (path, st.st_size, st.st_mtime_ns)
+        digest = self._digests.get(sig)
+        if digest is None:
+            h = hashlib.blake2b(digest_size=20)
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+                    h.update(block)
+            digest = h.hexdigest()
+            self._digests[sig] = digest
+        return digest
+
+    @staticmethod
+    def _key(kind: str, digest: str, params: Optional[dict]) -> str:
+        raw = json.dumps([kind, digest, params or {}], sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.folder, key + ".json")
+
+    # ---------------- get / put ----------------
+    def get(self, kind: str, digest: str, params: Optional[dict] = None) -> Any:
+        key = self._key(kind, digest, params)
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as f:
+                    value = json.load(f)["value"]
+            except Exception:
+                self._drop_locked(key)
+                self.misses += 1
+                return None
+            now = time.time()
+            self._entries[key][1] = now
+            try:
+                os.utime(self._path(key), (now, now))   # LRU order survives restarts
+            except Exception:
+                pass
+            self.hits += 1
+            return value
+
+    def put(self, kind: str, digest: str, params: Optional[dict], value: Any):
+        if value is None:
+            return
+        key = self._key(kind, digest, params)
+        data = json.dumps({"kind": kind, "params": params or {}, "time": time.time(), "value": value},
+                          ensure_ascii=False, default=str)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            try:
+                fd, tmp = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(data)
+                os.replace(tmp, self._path(key))
+            except Exception as e:
+                print("⚠️ summary cache write failed:", e)
+                return
+            old = self._entries.get(key)
+            if old:
+                self._total -= old[0]
+            self._entries[key] = [size, time.time()]
+            self._total += size
+            self._evict_locked()
+
+    def _drop_locked(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._total -= entry[0]
+        try:
+            os.remove(self._path(key))
+        except Exception:
+            pass
+
+    def _evict_locked(self):
+        if self._total <= self.max_bytes:
+            return
+        for key, _ in sorted(self._entries.items(), key=lambda kv: kv[1][1]):
+            self._drop_locked(key)
+            if self._total <= self.max_bytes:
+                break
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._drop_locked(key)
+
+
+# singleton
+summary_cache = SummaryCache()
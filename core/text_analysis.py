@@ -0,0 +1,314 @@
+# core/text_analysis.py
+"""
+Batch text analysis for Jarvis (emotion + sentiment + topic in one pass).
+
+- Holds the shared keyword tables and the tokenizer used by
+  brain.detect_text_emotion, JarvisConversation (sentiment, topic) and
+  JarvisMemory.update_mood_from_text, so every scorer agrees on the same
+  vocabulary.
+- sentiment() / emotion() / memory_mood() / topic() are the per-text
+  scorers behind those live paths.
+- TextAnalyzer.analyze(texts) tokenizes once, builds a (texts x terms)
+  NumPy count matrix over that vocabulary and scores the whole batch with
+  matrix products instead of per-text keyword loops.
+- Offline helpers re-analyze config/nlp_history.txt and summarize the
+  stored emotion_history:  python -m core.text_analysis
+Scoring is whole-word (unigrams + bigrams); "n't" contractions count as
+"not" for negation.
+"""
+
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+    _NUMPY = True
+except Exception:
+    np = None
+    _NUMPY = False
+
+# ------------------------------------------------------------
+# SHARED KEYWORD TABLES
+# ------------------------------------------------------------
+# JarvisConversation._estimate_sentiment
+SENTIMENT_WORDS = {
+    "sad": ["sad", "low", "down", "hurt", "upset", "empty", "broken", "depressed", "lonely", "tear"],
+    "happy": ["happy", "great", "awesome", "nice", "good", "fantastic", "amazing", "glad", "yay", "excited"],
+    "angry": ["angry", "mad", "pissed", "furious", "hate", "annoyed"],
+    "anxious": ["scared", "worried", "anxious", "panic", "stressed", "stress", "overthinking", "nervous"],
+    "bored": ["bored", "meh", "boring", "idle"],
+}
+SENTIMENT_WEIGHTS = {"sad": -2, "happy": 3, "angry": -3, "anxious": -2, "bored": -1}
+NEGATIONS = ["no", "not", "never"]
+
+# Brain.detect_text_emotion (first matching group wins, in this order)
+EMOTION_GROUPS = {
+    "serious": ["sad", "sadness", "hurt", "hurting", "empty", "broken", "lonely", "upset", "low"],
+    "alert": ["angry", "pissed", "furious", "scared", "fear", "panic", "worried", "stress", "stressed"],
+    "happy": ["happy", "great", "awesome", "nice", "amazing"],
+    "neutral": ["bored", "meh", "okay", "fine"],
+}
+
+# JarvisMemory.update_mood_from_text (first matching group wins, in this order)
+MOOD_WORDS = {
+    "serious": ["sad", "low", "depressed", "hurt", "broken"],
+    "happy": ["happy", "great", "awesome", "good", "nice"],
+    "alert": ["angry", "mad", "hate", "furious"],
+}
+
+# JarvisConversation._detect_topic (first matching topic wins, in this order)
+TOPIC_ALIASES = [
+    ("ai", ["ai", "artificial intelligence", "machine learning", "deep learning"]),
+    ("java", ["java", "jvm", "spring"]),
+    ("daa", ["daa", "dynamic programming", "algorithms", "graphs"]),
+    ("python", ["python", "py"]),
+    ("graphics", ["graphics", "opengl", "projection", "3d"]),
+    ("dbms", ["dbms", "database", "sql", "mysql", "postgres", "oracle"]),
+    ("blockchain", ["blockchain", "ethereum", "smart contract"]),
+    ("gesture", ["gesture", "hand gesture", "gesture recognition"]),
+    ("emotion", ["emotion", "mood", "feeling"]),
+    ("life", ["life", "future", "career"]),
+    ("love", ["love", "relationship", "gf", "bf", "crush"]),
+]
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_NOUNISH_RE = re.compile(r"\b([a-zA-Z]{3,20})\b")
+
+
+def terms(text: Optional[str]) -> List[str]:
+    """Lower-cased unigrams + bigrams; "n't" contractions become "not"."""
+    words = ["not" if w.endswith("n't") else w for w in _TOKEN_RE.findall((text or "").lower())]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+# ------------------------------------------------------------
+# PER-TEXT SCORERS (live paths)
+# ------------------------------------------------------------
+def _sets(groups):
+    return [(name, frozenset(words)) for name, words in groups]
+
+
+_SENTIMENT_SETS = _sets(SENTIMENT_WORDS.items())
+_EMOTION_SETS = _sets(EMOTION_GROUPS.items())
+_MOOD_SETS = _sets(MOOD_WORDS.items())
+_TOPIC_SETS = _sets(TOPIC_ALIASES)
+_NEGATION_SET = frozenset(NEGATIONS)
+
+
+def _mood_for(score: int, angry: bool) -> str:
+    if score >= 2:
+        return "happy"
+    if score <= -2:
+        # disambiguate angry vs serious
+        return "alert" if angry else "serious"
+    return "neutral"
+
+
+def _first_group(found, sets, default):
+    for name, words in sets:
+        if not found.isdisjoint(words):
+            return name
+    return default
+
+
+def sentiment(text: Optional[str]) -> Tuple[int, str]:
+    """(score, mood) of one text — JarvisConversation._estimate_sentiment."""
+    found = set(terms(text))
+    hit = {name for name, words in _SENTIMENT_SETS if not found.isdisjoint(words)}
+    score = sum(SENTIMENT_WEIGHTS[name] for name in hit)
+    # negation handling (simple): weakens happy, softens sad
+    if not found.isdisjoint(_NEGATION_SET):
+        score += -2 * ("happy" in hit) + ("sad" in hit)
+    return score, _mood_for(score, "angry" in hit)
+
+
+def emotion(text: Optional[str]) -> str:
+    """Brain emotion label of one text — Brain.detect_text_emotion."""
+    return _first_group(set(terms(text)), _EMOTION_SETS, "neutral")
+
+
+def memory_mood(text: Optional[str]) -> str:
+    """Mood label of one text — JarvisMemory.update_mood_from_text."""
+    return _first_group(set(terms(text)), _MOOD_SETS, "neutral")
+
+
+def topic(text: Optional[str]) -> Optional[str]:
+    """Topic of one text (table order, then a noun-like word) — JarvisConversation._detect_topic."""
+    if not text:
+        return None
+    key = _first_group(set(terms(text)), _TOPIC_SETS, None)
+    if key is None:
+        m = _NOUNISH_RE.search(text.lower())
+        key = m.group(1) if m else None
+    return key
+
+
+class TextAnalyzer:
+    """Vectorized emotion / sentiment / topic scorer over the shared tables."""
+
+    def __init__(self):
+        if not _NUMPY:
+            raise RuntimeError("numpy not installed")
+
+        self.vocab: Dict[str, int] = {}
+        for groups in (SENTIMENT_WORDS.values(), EMOTION_GROUPS.values(), MOOD_WORDS.values(),
+                       [a for _, a in TOPIC_ALIASES], [NEGATIONS]):
+            for words in groups:
+                for w in words:
+                    self.vocab.setdefault(w, len(self.vocab))
+
+        self.sent_names = list(SENTIMENT_WORDS)
+        self.sent_matrix = self._membership([SENTIMENT_WORDS[n] for n in self.sent_names])
+        self.sent_weights = np.array([SENTIMENT_WEIGHTS[n] for n in self.sent_names], dtype=np.int32)
+        self.emotion_names = list(EMOTION_GROUPS)
+        self.emotion_matrix = self._membership([EMOTION_GROUPS[n] for n in self.emotion_names])
+        self.mood_names = list(MOOD_WORDS)
+        self.mood_matrix = self._membership([MOOD_WORDS[n] for n in self.mood_names])
+        self.topic_names = [t for t, _ in TOPIC_ALIASES]
+        self.topic_matrix = self._membership([a for _, a in TOPIC_ALIASES])
+        self.neg_vector = self._membership([NEGATIONS])[:, 0]
+
+    def _membership(self, groups):
+        m = np.zeros((len(self.vocab), len(groups)), dtype=np.int32)
+        for j, words in enumerate(groups):
+            for w in words:
+                m[self.vocab[w], j] = 1
+        return m
+
+    # ---------------- matrix build ----------------
+    def count_matrix(self, texts: List[str]):
+        """(len(texts) x vocab) term-count matrix."""
+        rows, cols = [], []
+        vocab = self.vocab
+        for i, text in enumerate(texts):
+            for term in terms(text):
+                j = vocab.get(term)
+                if j is not None:
+                    rows.append(i)
+                    cols.append(j)
+        X = np.zeros((len(texts), len(vocab)), dtype=np.int32)
+        if rows:
+            np.add.at(X, (np.array(rows), np.array(cols)), 1)
+        return X
+
+    @staticmethod
+    def _first_hit(hits, names, default):
+        """First group (in table order) with a hit per row, else default."""
+        any_hit = hits.any(axis=1)
+        first = hits.argmax(axis=1)
+        return [names[f] if a else default for f, a in zip(first.tolist(), any_hit.tolist())]
+
+    # ---------------- scoring ----------------
+    def analyze(self, texts: Iterable[str]) -> dict:
+        """
+        Score a batch. Returns lists aligned with `texts`:
+        emotion (brain labels), score (sentiment int), mood, memory_mood
+        (update_mood_from_text labels), topic. Same results as the per-text
+        scorers above.
+        """
+        texts = [t or "" for t in texts]
+        if not texts:
+            return {"emotion": [], "score": np.zeros(0, dtype=np.int32), "mood": [],
+                    "memory_mood": [], "topic": []}
+
+        X = self.count_matrix(texts)
+        present = (X > 0).astype(np.int32)
+
+        # sentiment: weighted group presence + simple negation flip
+        groups = (present @ self.sent_matrix) > 0
+        score = groups.astype(np.int32) @ self.sent_weights
+        negated = (present @ self.neg_vector) > 0
+        happy = groups[:, self.sent_names.index("happy")]
+        sad = groups[:, self.sent_names.index("sad")]
+        angry = groups[:, self.sent_names.index("angry")]
+        score = score - 2 * (negated & happy) + 1 * (negated & sad)
+
+        mood = np.where(score >= 2, "happy",
+               np.where(score <= -2, np.where(angry, "alert", "serious"), "neutral")).tolist()
+
+        emotion = self._first_hit((present @ self.emotion_matrix) > 0, self.emotion_names, "neutral")
+        moods = self._first_hit((present @ self.mood_matrix) > 0, self.mood_names, "neutral")
+        topics = self._first_hit((present @ self.topic_matrix) > 0, self.topic_names, None)
+        for i, t in enumerate(topics):
+            if t is None:
+                m = _NOUNISH_RE.search(texts[i].lower())
+                topics[i] = m.group(1) if m else None
+
+        return {"emotion": emotion, "score": score, "mood": mood, "memory_mood": moods, "topic": topics}
+
+
+# ------------------------------------------------------------
+# OFFLINE RE-ANALYSIS
+# ------------------------------------------------------------
+_ANALYZER: Optional[TextAnalyzer] = None
+
+
+def get_analyzer() -> TextAnalyzer:
+    global _ANALYZER
+    if _ANALYZER is None:
+        _ANALYZER = TextAnalyzer()
+    return _ANALYZER
+
+
+def _tally(labels) -> Dict[str, int]:
+    values, counts = np.unique(np.array([str(x) for x in labels]), return_counts=True)
+    order = np.argsort(-counts)
+    return {str(values[i]): int(counts[i]) for i in order}
+
+
+def analyze_history(path: Optional[str] = None, batch_size: int = 20000) -> dict:
+    """Re-score every line of the NLP history file in batches."""
+    if path is None:
+        import core.nlp_engine as nlp
+        path = nlp.HISTORY_PATH
+    analyzer = get_analyzer()
+    moods, emotions, topics = [], [], []
+    total = 0
+    started = time.perf_counter()
+
+    def _flush(batch):
+        out = analyzer.analyze(batch)
+        moods.extend(out["mood"])
+        emotions.extend(out["emotion"])
+        topics.extend(t for t in out["topic"] if t)
+
+    with open(path, "r", encoding="utf-8") as f:
+        batch = []
+        for line in f:
+            if line.strip():
+                batch.append(line.strip())
+            if len(batch) >= batch_size:
+                _flush(batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            _flush(batch)
+            total += len(batch)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "lines": total,
+        "seconds": round(elapsed, 3),
+        "texts_per_sec": round(total / elapsed) if elapsed > 0 else 0,
+        "mood": _tally(moods) if moods else {},
+        "emotion": _tally(emotions) if emotions else {},
+        "top_topics": dict(list(_tally(topics).items())[:10]) if topics else {},
+    }
+
+
+def summarize_emotion_history(entries) -> dict:
+    """Mood distribution of memory's emotion_history (entries hold moods only)."""
+    moods = [e.get("mood", "neutral") for e in entries or [] if isinstance(e, dict)]
+    return _tally(moods) if moods else {}
+
+
+if __name__ == "__main__":
+    import json
+    print(json.dumps(analyze_history(), indent=2))
+    try:
+        with open("config/memory.json", "r", encoding="utf-8") as f:
+            hist = json.load(f).get("emotion_history", [])
+        print(json.dumps({"emotion_history": summarize_emotion_history(hist)}, indent=2))
+    except Exception as e:
+        print("⚠️ emotion_history unavailable:", e)
@@ -0,0 +1,290 @@
+# core/transcribe_pool.py
+"""
+Parallel transcription of speech segments for VideoReader.
+
+- whisper (CPU-bound) runs in a process pool; every worker loads the
+  model once in its initializer and reuses it for all its segments. A
+  segment whisper fails on (or hears nothing in) goes on to OpenAI /
+  Google inside the worker, like the serial path.
+- Network recognizers (OpenAI / Google) are I/O-bound and run in a
+  thread pool instead.
+- The number of whisper workers is capped by the memory left under the
+  model registry's ceiling (each worker holds its own copy of the model).
+- The pool stays warm between videos and shuts down POOL_IDLE_TIMEOUT
+  seconds after the last batch (and at exit), releasing the worker models.
+  A pool that breaks (a worker died) is rebuilt once and the unfinished
+  segments resubmitted.
+- Segments are submitted with a bounded number in flight, so a long
+  stream never piles up in memory, and results come back in time order
+  as {"start": s, "end": s, "text": str} (seconds).
+Kept free of the speech/UI stack so spawned workers import it cheaply.
+"""
+
+import atexit
+import os
+import tempfile
+import threading
+import wave
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+POOL_IDLE_TIMEOUT = 120.0     # seconds a warm pool outlives its last batch
+
+# approximate resident size of one whisper model per worker
+_WHISPER_MB = {"tiny": 150, "base": 300, "small": 950, "medium": 2900, "large": 5800}
+
+_WORKER_MODEL = None     # whisper model, one per worker process
+
+_POOL = None
+_POOL_KEY = None
+_POOL_USERS = 0
+_IDLE_TIMER = None
+_POOL_LOCK = threading.Lock()
+
+
+# ---------------- backends (run inside workers) ----------------
+def _init_whisper_worker(model_name: str):
+    global _WORKER_MODEL
+    import whisper
+    _WORKER_MODEL = whisper.load_model(model_name)
+
+
+def _whisper_segment(job):
+    index, start_ms, end_ms, raw, rate = job
+    audio = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+    if rate != 16000:
+        pos = np.arange(0, len(audio), rate / 16000.0)
+        audio = np.interp(pos, np.arange(len(audio)), audio).astype(np.float32)
+    try:
+        text = _WORKER_MODEL.transcribe(audio, language="en").get("text", "")
+    except Exception as e:
+        print("⚠️ whisper segment failed:", e)
+        text = ""
+    text = text.strip()
+    if not text:
+        # same chain as the serial path: whisper -> openai -> google
+        return _fallback_segment(job)
+    return index, start_ms, end_ms, text
+
+
+def _fallback_segment(job):
+    if os.environ.get("OPENAI_API_KEY"):
+        result = _openai_segment(job)
+        if result[3]:
+            return result
+    return _google_segment(job)
+
+
+def _google_segment(job):
+    index, start_ms, end_ms, raw, rate = job
+    try:
+        import speech_recognition as sr
+        text = sr.Recognizer().recognize_google(sr.AudioData(raw, rate, 2)) or ""
+    except Exception:
+        text = ""
+    return index, start_ms, end_ms, text.strip()
+
+
+def _openai_segment(job):
+    index, start_ms, end_ms, raw, rate = job
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+    tmp.close()
+    text = ""
+    try:
+        with wave.open(tmp.name, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(rate)
+            wf.writeframes(raw)
+        import openai
+        with open(tmp.name, "rb") as f:
+            resp = openai.Audio.transcriptions.create(file=f, model="whisper-1")
+            text = resp.get("text") or resp.get("transcript") or ""
+    except Exception as e:
+        print("⚠️ openai segment failed:", e)
+    finally:
+        try:
+            os.remove(tmp.name)
+        except Exception:
+            pass
+    return index, start_ms, end_ms, text.strip()
+
+
+# ---------------- pool driver ----------------
+def _job_fn(backend: str) -> Callable:
+    if backend.startswith("whisper"):
+        return _whisper_segment
+    return _openai_segment if backend == "openai" else _google_segment
+
+
+def whisper_workers(workers: int, model_name: str) -> int:
+    """Workers whose whisper copies fit next to the models already in the registry."""
+    try:
+        from core.model_registry import model_registry
+        free_mb = model_registry.max_mb - model_registry.loaded_mb()
+    except Exception:
+        return workers
+    per_worker = _WHISPER_MB.get(model_name.split(".")[0], _WHISPER_MB["small"])
+    return max(1, min(workers, int(free_mb // per_worker)))
+
+
+def _get_pool(backend: str, workers: int, model_name: str):
+    """The shared pool for this backend; the caller must _release_pool() it."""
+    global _POOL, _POOL_KEY, _POOL_USERS, _IDLE_TIMER
+    kind = "process" if backend.startswith("whisper") else "thread"
+    key = (kind, workers, model_name if kind == "process" else None)
+    with _POOL_LOCK:
+        if _IDLE_TIMER is not None:
+            _IDLE_TIMER.cancel()
+            _IDLE_TIMER = None
+        if _POOL is None or _POOL_KEY != key:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False)
+            if kind == "process":
+                _POOL = ProcessPoolExecutor(max_workers=workers, initializer=_init_whisper_worker,
+                                            initargs=(model_name,))
+            else:
+                _POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="JarvisSTT")
+            _POOL_KEY = key
+        _POOL_USERS += 1
+        return _POOL
+
+
+def _release_pool():
+    """One user done; the last one arms the idle shutdown."""
+    global _POOL_USERS, _IDLE_TIMER
+    with _POOL_LOCK:
+        _POOL_USERS = max(0, _POOL_USERS - 1)
+        if _POOL_USERS or _POOL is None:
+            return
+        if _IDLE_TIMER is not None:
+            _IDLE_TIMER.cancel()
+        _IDLE_TIMER = threading.Timer(POOL_IDLE_TIMEOUT, _shutdown_if_idle)
+        _IDLE_TIMER.daemon = True
+        _IDLE_TIMER.start()
+
+
+def _discard_pool(pool):
+    """Forget a broken pool so the next _get_pool() builds a fresh one."""
+    global _POOL, _POOL_KEY
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+            _POOL_KEY = None
+    try:
+        pool.shutdown(wait=False)
+    except Exception:
+        pass
+
+
+def iter_transcripts(segments: Iterable[Tuple[int, int, np.ndarray, int]], backend: str,
+                     workers: Optional[int] = None, model_name: str = "small",
+                     job_fn: Optional[Callable] = None, executor=None) -> Iterator[Dict]:
+    """
+    segments: (start_ms, end_ms, mono int16 pcm, sample_rate), in time order.
+    Yields {"start", "end", "text"} in the same order, as soon as each
+    result and all earlier ones are done.
+    job_fn / executor override the backend (custom recognizers, benchmarks).
+    """
+    workers = workers or DEFAULT_WORKERS
+    if executor is None and backend.startswith("whisper"):
+        workers = whisper_workers(workers, model_name)
+    own_pool = executor is None
+    if own_pool:
+        executor = _get_pool(backend, workers, model_name)
+    job_fn = job_fn or _job_fn(backend)
+    max_in_flight = workers * 2
+    jobs = {}               # index -> job, kept until its result is handed out
+    pending = {}
+    submitted = 0
+    rebuilt = False
+
+    def _rebuild(err):
+        # a worker died: one fresh pool, every unfinished segment resubmitted
+        nonlocal executor, rebuilt
+        if not own_pool or rebuilt:
+            raise err
+        rebuilt = True
+        print("⚠️ transcription pool broke — restarting it:", err)
+        _discard_pool(executor)
+        _release_pool()
+        executor = _get_pool(backend, workers, model_name)
+        for i in sorted(pending):
+            pending[i] = executor.submit(job_fn, jobs[i])
+
+    def _submit(i):
+        try:
+            pending[i] = executor.submit(job_fn, jobs[i])
+        except BrokenProcessPool as e:
+            pending[i] = None
+            _rebuild(e)
+
+    def _collect():
+        i = submitted - len(pending)        # oldest in flight
+        while True:
+            try:
+                result = pending[i].result()
+                break
+            except BrokenProcessPool as e:
+                _rebuild(e)
+        del pending[i], jobs[i]
+        return _as_segment(result)
+
+    try:
+        for start_ms, end_ms, pcm, rate in segments:
+            jobs[submitted] = (submitted, start_ms, end_ms, pcm.tobytes(), rate)
+            _submit(submitted)
+            submitted += 1
+            # bounded: hand out the oldest result before queuing more
+            while len(pending) >= max_in_flight:
+                yield _collect()
+        while pending:
+            yield _collect()
+    finally:
+        for f in pending.values():
+            if f is not None:
+                f.cancel()
+        if own_pool:
+            _release_pool()
+
+
+def _as_segment(result) -> Dict:
+    _, start_ms, end_ms, text = result
+    return {"start": start_ms / 1000.0, "end": end_ms / 1000.0, "text": text}
+
+
+def transcribe_segments(segments: Iterable[Tuple[int, int, np.ndarray, int]], backend: str,
+                        **kwargs) -> List[Dict]:
+    """All non-empty transcripts in time order."""
+    return [s for s in iter_transcripts(segments, backend, **kwargs) if s["text"]]
+
+
+def _stop_locked():
+    global _POOL, _POOL_KEY, _IDLE_TIMER
+    if _IDLE_TIMER is not None:
+        _IDLE_TIMER.cancel()
+        _IDLE_TIMER = None
+    if _POOL is not None:
+        _POOL.shutdown(wait=False)
+        _POOL = None
+        _POOL_KEY = None
+
+
+def _shutdown_if_idle():
+    with _POOL_LOCK:
+        # a batch may have started since the timer was armed
+        if not _POOL_USERS:
+            _stop_locked()
+
+
+def shutdown():
+    """Stop the pool now (worker processes and their models go with it)."""
+    with _POOL_LOCK:
+        _stop_locked()
+
+
+atexit.register(shutdown)
@@ -0,0 +1,238 @@
+# core/vector_memory.py
+"""
+Long-term conversational memory for Jarvis (local vector store).
+
+- Every exchange (user utterance + Jarvis answer) becomes one row in a
+  float32 matrix stored in config/vector_memory/vectors.f32 and read back
+  through numpy.memmap, so thousands of rows cost almost no RAM.
+- Embeddings are hashed bag-of-words features (unigrams + bigrams), fully
+  offline and deterministic across runs — no model download.
+- Appends are incremental (one row + one JSON line); compaction drops
+  duplicates and trims the oldest rows every `compact_every` appends.
+- search(text, k) returns the top-k most similar exchanges by cosine.
+Safe: if numpy is missing every call becomes a no-op.
+"""
+
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from typing import List, Optional
+
+try:
+    import numpy as np
+    _NUMPY = True
+except Exception:
+    np = None
+    _NUMPY = False
+
+_DIM = 512
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+_STOPWORDS = frozenset(
+    "a an the is am are was were be to of in on at for and or it this that "
+    "i me my you your we what how do does can please jarvis yash".split()
+)
+
+
+def _features(text: str):
+    words = [w for w in _TOKEN_RE.findall((text or "").lower()) if w not in _STOPWORDS]
+    feats = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    counts = {}
+    for f in feats:
+        counts[f] = counts.get(f, 0) + 1
+    return counts
+
+
+def embed(text: str):
+    """Hashed-feature embedding (signed hashing trick), L2-normalized."""
+    vec = np.zeros(_DIM, dtype=np.float32)
+    for f, c in _features(text).items():
+        h = zlib.crc32(f.encode("utf-8"))
+        sign = 1.0 if h & 0x80000000 else -1.0
+        vec[h % _DIM] += sign * (1.0 + math.log(c))
+    norm = float(np.linalg.norm(vec))
+    if norm > 0:
+        vec /= norm
+    return vec
+
+
+class VectorMemory:
+    def __init__(self, folder: Optional[str] = None, max_entries: int = 20000, compact_every: int = 500):
+        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        self.folder = folder or os.path.join(base_dir, "config", "vector_memory")
+        self.vectors_path = os.path.join(self.folder, "vectors.f32")
+        self.entries_path = os.path.join(self.folder, "entries.jsonl")
+        self.max_entries = int(max_entries)
+        self.compact_every = int(compact_every)
+
+        self._lock = threading.Lock()
+        self._entries = []          # metadata rows, aligned with matrix rows
+        self._matrix = None         # cached memmap (reopened after writes)
+        self._appends = 0
+
+        if _NUMPY:
+            try:
+                os.makedirs(self.folder, exist_ok=True)
+                self._load()
+            except Exception as e:
+                print("⚠️ vector memory load failed:", e)
+                self._entries = []
+
+    # ---------------- load / map ----------------
+    def _load(self):
+        entries = []
+        torn = False
+        if os.path.exists(self.entries_path):
+            with open(self.entries_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except Exception:
+                        torn = True     # torn last line from a crash
+                        break
+
+        size = os.path.getsize(self.vectors_path) if os.path.exists(self.vectors_path) else 0
+        rows = size // (_DIM * 4)
+
+        # crash between the two appends → keep the aligned prefix; a partial
+        # row or line is cut too, or every later append would land misaligned
+        n = min(rows, len(entries))
+        self._entries = entries[:n]
+        if torn or size != n * _DIM * 4 or len(entries) != n:
+            self._rewrite(self._read_rows(n), self._entries)
+
+    def _read_rows(self, n):
+        if n == 0:
+            return np.zeros((0, _DIM), dtype=np.float32)
+        return np.array(np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(n, _DIM)))
+
+    def _map(self):
+        n = len(self._entries)
+        if n == 0:
+            return None
+        if self._matrix is None or self._matrix.shape[0] != n:
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(n, _DIM))
+        return self._matrix
+
+    # ---------------- write ----------------
+    def add_exchange(self, user_text: str, answer: str = ""):
+        """Append one exchange. Cheap: one vector row + one JSON line."""
+        if not _NUMPY or not (user_text or "").strip():
+            return
+        entry = {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "user": user_text.strip(),
+            "jarvis": (answer or "").strip(),
+        }
+        vec = embed(f"{entry['user']} {entry['jarvis']}")
+        with self._lock:
+            vec_size = len(self._entries) * _DIM * 4
+            ent_size = os.path.getsize(self.entries_path) if os.path.exists(self.entries_path) else 0
+            try:
+                with open(self.vectors_path, "ab") as f:
+                    f.write(vec.tobytes())
+                with open(self.entries_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                self._entries.append(entry)
+                self._appends += 1
+            except Exception as e:
+                print("⚠️ vector memory append failed:", e)
+                self._truncate_locked(vec_size, ent_size)
+                return
+
+            if self._appends % self.compact_every == 0:
+                self._compact_locked()
+
+    def _truncate_locked(self, vec_size, ent_size):
+        # a half-done append must not leave a row that the next entry
+        # would be matched with
+        self._matrix = None
+        for path, size in ((self.vectors_path, vec_size), (self.entries_path, ent_size)):
+            try:
+                if os.path.exists(path) and os.path.getsize(path) > size:
+                    os.truncate(path, size)
+            except Exception as e:
+                print("⚠️ vector memory rollback failed:", e)
+
+    def compact(self):
+        """Drop duplicate exchanges (keep newest) and trim to max_entries."""
+        if not _NUMPY:
+            return
+        with self._lock:
+            self._compact_locked()
+
+    def _compact_locked(self):
+        try:
+            n = len(self._entries)
+            seen = set()
+            keep = []
+            for i in range(n - 1, -1, -1):
+                e = self._entries[i]
+                sig = (e.get("user", "").lower(), e.get("jarvis", "").lower())
+                if sig in seen:
+                    continue
+                seen.add(sig)
+                keep.append(i)
+                if len(keep) >= self.max_entries:
+                    break
+            if len(keep) == n:
+                return
+            keep.reverse()
+            rows = self._read_rows(n)[keep]
+            self._rewrite(rows, [self._entries[i] for i in keep])
+        except Exception as e:
+            print("⚠️ vector memory compaction failed:", e)
+
+    def _rewrite(self, rows, entries):
+        # release the mapping first (Windows refuses to replace mapped files)
+        self._matrix = None
+        fd, tmp_vec = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(np.ascontiguousarray(rows, dtype=np.float32).tobytes())
+        fd, tmp_ent = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for e in entries:
+                f.write(json.dumps(e, ensure_ascii=False) + "\n")
+        os.replace(tmp_vec, self.vectors_path)
+        os.replace(tmp_ent, self.entries_path)
+        self._entries = list(entries)
+
+    # ---------------- read ----------------
+    def search(self, text: str, k: int = 5, min_score: float = 0.2) -> List[dict]:
+        """Top-k past exchanges by cosine similarity (newest first on ties)."""
+        if not _NUMPY or not (text or "").strip():
+            return []
+        q = embed(text)
+        with self._lock:
+            try:
+                m = self._map()
+                if m is None:
+                    return []
+                scores = m @ q
+                entries = self._entries
+            except Exception:
+                return []
+
+        k = min(int(k), scores.shape[0])
+        if k <= 0:
+            return []
+        idx = np.argpartition(-scores, k - 1)[:k]
+        idx = idx[np.lexsort((-idx, -scores[idx]))]
+        out = []
+        for i in idx:
+            s = float(scores[i])
+            if s < min_score:
+                continue
+            out.append({**entries[i], "score": round(s, 3)})
+        return out
+
+    def count(self) -> int:
+        return len(self._entries)
+
+
+# singleton
+vector_memory = VectorMemory()
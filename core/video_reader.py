@@ -3,23 +3,40 @@
 Jarvis Ultra Video Reader & Summarizer (High Tech).
 
 Capabilities:
-- Extract audio from video robustly (moviepy / ffmpeg)
-- Voice activity detection (VAD) to split into meaningful speech segments (uses webrtcvad if available)
+- Stream audio out of the video through an ffmpeg pipe as 16 kHz mono PCM
+  (no temporary WAV, constant memory); moviepy temp WAV as fallback
+- Voice activity detection (VAD) to split into meaningful speech segments
+  (core.audio_vad: webrtcvad if available, NumPy energy detector otherwise);
+  only speech segments are transcribed
+- Segments are transcribed concurrently (core.transcribe_pool: process pool
+  with one whisper model per worker, threads for network STT) and
+  reassembled in time order with start/end timestamps
 - Transcribe segments using:
     - whisper (if installed)
     - openai whisper (if OPENAI_API_KEY available)
     - speech_recognition/google as fallback
-- Optional visual OCR for slide detection (uses pytesseract + OpenCV if available)
+- Optional visual OCR for slide detection (uses pytesseract + OpenCV if available):
+  seek-based frame sampling, thumbnail-histogram scene-change detection,
+  one OCR call per distinct slide on a worker pool, duplicate texts dropped
 - Chunk-aware summarization (uses same orchestrator as document_reader summarizer)
-- Returns structured summary: Title / Key points / Timestamps
+- Returns structured summary: {"title", "key_points", "timestamps", "summary"}
 - Reads summary via core.speech_engine.speak
+- "Follow along" live mode: rolling transcript and periodic rolling
+  summaries pushed to the overlay and TTS while the media is still being
+  decoded and transcribed
+- Transcripts, slide texts and summaries are cached on the video's content
+  hash (core.summary_cache): a repeat request skips audio extraction,
+  transcription and summarization
 """
 
 import os
+import re
 import tempfile
 import threading
 import time
-from typing import Optional, List, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, List
 
 # moviepy for audio extraction
 try:
@@ -44,12 +61,13 @@ except Exception:
 # fallback STT
 import speech_recognition as sr
 
-# optional VAD
 try:
-    import webrtcvad
-    _VAD = True
+    import numpy as np
+    from core import audio_vad, transcribe_pool
 except Exception:
-    _VAD = False
+    np = None
+    audio_vad = None
+    transcribe_pool = None
 
 # optional OCR for slides
 try:
@@ -61,12 +79,23 @@ except Exception:
 
 from core.speech_engine import speak
 import core.nlp_engine as nlp
-from core.document_reader import _summarize_text  # reuse summarizer
-from core.voice_effects import overlay_instance
+from core.document_reader import _summarize, _summarize_text, _summary_backend, _file_digest  # reuse summarizer
+from core.summary_cache import summary_cache
+from core.model_registry import model_registry
+import core.voice_effects as fx
 from core.memory_engine import JarvisMemory
 
 memory = JarvisMemory()
 
+# whisper weights load once (on first use) and are shared via the registry
+_WHISPER_MODEL = "small"
+if _WHISPER:
+    model_registry.register(
+        "whisper-" + _WHISPER_MODEL,
+        lambda: whisper.load_model(_WHISPER_MODEL),
+        size_mb=950,
+    )
+
 
 # -------------------------
 # Helpers: write audio
@@ -89,37 +118,14 @@ def _extract_audio(video_path: str, target_sample_rate=16000) -> Optional[str]:
         return None
 
 
-# -------------------------
-# VAD segmenter (optional)
-# -------------------------
-def _vad_segment_wav(wav_path: str, aggressiveness: int = 2) -> List[Tuple[int, int]]:
-    """
-    Returns list of (start_ms, end_ms) speech ranges.
-    If webrtcvad not available, return full file as single segment.
-    """
-    if not _VAD:
-        return [(0, -1)]
-    try:
-        import wave
-        vad = webrtcvad.Vad(aggressiveness)
-        wf = wave.open(wav_path, "rb")
-        sample_rate = wf.getframerate()
-        frames = wf.readframes(wf.getnframes())
-        wf.close()
-        # fallback: return single range
-        # full implementation requires framing; to keep safe, fallback to single chunk
-        return [(0, -1)]
-    except Exception:
-        return [(0, -1)]
-
-
 # -------------------------
 # Transcription dispatcher
 # -------------------------
-def _transcribe_with_whisper_local(wav_path: str) -> str:
+def _transcribe_with_whisper_local(audio) -> str:
+    # audio: WAV path or float32 samples at 16 kHz
     try:
-        model = whisper.load_model("small")
-        result = model.transcribe(wav_path, language="en")
+        with model_registry.use("whisper-" + _WHISPER_MODEL) as model:
+            result = model.transcribe(audio, language="en")
         return result.get("text", "").strip()
     except Exception as e:
         print("⚠️ whisper local failed:", e)
@@ -147,45 +153,265 @@ def _transcribe_with_google(wav_path: str) -> str:
         return ""
 
 
+def _write_wav(pcm, rate: int) -> str:
+    import wave
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+    tmp.close()
+    with wave.open(tmp.name, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(pcm.tobytes())
+    return tmp.name
+
+
+def _transcribe_pcm(pcm, rate: int) -> str:
+    """Transcribe one mono int16 speech segment (whisper -> openai -> google)."""
+    if _WHISPER:
+        audio = pcm.astype(np.float32) / 32768.0
+        if rate != 16000:
+            pos = np.arange(0, len(audio), rate / 16000.0)
+            audio = np.interp(pos, np.arange(len(audio)), audio).astype(np.float32)
+        text = _transcribe_with_whisper_local(audio)
+        if text:
+            return text
+    if _OPENAI:
+        path = _write_wav(pcm, rate)
+        try:
+            text = _transcribe_with_openai(path)
+        finally:
+            try:
+                os.remove(path)
+            except Exception:
+                pass
+        if text:
+            return text
+    try:
+        r = sr.Recognizer()
+        return r.recognize_google(sr.AudioData(pcm.tobytes(), rate, 2)) or ""
+    except Exception as e:
+        print("⚠️ google stt failed:", e)
+        return ""
+
+
 # -------------------------
 # OCR slides (optional)
 # -------------------------
-def _extract_slide_texts(video_path: str, nth_frame: int = 60) -> List[str]:
-    if not _OCR:
-        return []
+SLIDE_SAMPLE_SECONDS = 2.0    # one decoded frame per step, reached by seeking
+SLIDE_HIST_THRESHOLD = 0.2    # Bhattacharyya distance of thumbnail histograms
+SLIDE_CHANGED_FRACTION = 0.003  # share of thumbnail pixels that moved by > SLIDE_PIXEL_DELTA
+SLIDE_PIXEL_DELTA = 24
+OCR_WORKERS = 3
+
+
+def _slide_signature(frame):
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    thumb = cv2.resize(gray, (128, 72), interpolation=cv2.INTER_AREA)
+    hist = cv2.calcHist([thumb], [0], None, [32], [0, 256])
+    cv2.normalize(hist, hist)
+    return thumb, hist
+
+
+def _is_new_slide(prev, cur) -> bool:
+    if prev is None:
+        return True
+    if cv2.compareHist(prev[1], cur[1], cv2.HISTCMP_BHATTACHARYYA) > SLIDE_HIST_THRESHOLD:
+        return True
+    # same tones, different text: count changed pixels (a ticking clock or
+    # compression noise stays far below the threshold)
+    moved = cv2.absdiff(prev[0], cur[0]) > SLIDE_PIXEL_DELTA
+    return float(moved.mean()) > SLIDE_CHANGED_FRACTION
+
+
+def _iter_slide_frames(video_path: str, sample_s: float, stats: dict):
+    """Yield (t_sec, frame) once per distinct slide, after it has settled."""
+    cap = cv2.VideoCapture(video_path)
     try:
-        import cv2
-        cap = cv2.VideoCapture(video_path)
-        texts = []
-        i = 0
-        while True:
-            ret, frame = cap.read()
-            if not ret:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+        total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        step = max(1, int(round(fps * sample_s)))
+        prev = last = None
+        changed = False
+        idx = 0
+        while total <= 0 or idx < total:
+            if idx:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+            ok, frame = cap.read()
+            if not ok:
                 break
-            if i % nth_frame == 0:
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                # simple threshold
-                try:
-                    txt = pytesseract.image_to_string(gray)
-                    if txt and len(txt.strip()) > 10:
-                        texts.append(txt.strip())
-                except Exception:
-                    pass
-            i += 1
+            stats["frames"] += 1
+            last = (idx / fps, frame)
+            sig = _slide_signature(frame)
+            if _is_new_slide(prev, sig):
+                changed = True          # transition: wait for the next sample
+            elif changed:
+                changed = False
+                yield idx / fps, frame
+            prev = sig
+            idx += step
+        if changed and last is not None:
+            yield last
+    finally:
         cap.release()
-        return texts
+
+
+def _ocr_frame(frame) -> str:
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    try:
+        return (pytesseract.image_to_string(gray) or "").strip()
     except Exception:
+        return ""
+
+
+def _extract_slide_texts(video_path: str, sample_s: float = SLIDE_SAMPLE_SECONDS,
+                         stats: Optional[dict] = None) -> List[str]:
+    """
+    OCR text of each distinct slide, in order. Frames are sampled by seeking
+    every `sample_s` seconds; OCR runs once per scene change on a small
+    worker pool (tesseract is a subprocess) and repeated texts are dropped.
+    """
+    if not _OCR:
         return []
+    stats = stats if stats is not None else {}
+    stats.update(frames=0, ocr=0)
+    texts, seen = [], set()
+
+    def _collect(future):
+        txt = future.result()
+        key = " ".join(re.findall(r"[a-z0-9]+", txt.lower()))
+        if len(txt) > 10 and key not in seen:
+            seen.add(key)
+            texts.append(txt)
+
+    try:
+        with ThreadPoolExecutor(max_workers=OCR_WORKERS, thread_name_prefix="JarvisOCR") as pool:
+            pending = deque()
+            for _, frame in _iter_slide_frames(video_path, sample_s, stats):
+                pending.append(pool.submit(_ocr_frame, frame))
+                stats["ocr"] += 1
+                # bounded: full-size frames wait in the queue
+                while len(pending) >= OCR_WORKERS * 2:
+                    _collect(pending.popleft())
+            while pending:
+                _collect(pending.popleft())
+        return texts
+    except Exception as e:
+        print("⚠️ slide OCR failed:", e)
+        return texts
 
 
 # -------------------------
 # Core Summarizer pipeline
 # -------------------------
+FOLLOW_SUMMARY_EVERY_S = 120.0    # media seconds between rolling summaries
+FOLLOW_STATUS_CHARS = 90          # overlay status line length
+
+
+def _clock(seconds: float) -> str:
+    seconds = int(seconds or 0)
+    if seconds >= 3600:
+        return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
 class VideoReader:
     def __init__(self):
         self._thread = None
+        self._follow_stop = threading.Event()
+
+    @staticmethod
+    def _stt_backend() -> str:
+        if _WHISPER:
+            return "whisper-" + _WHISPER_MODEL
+        if _OPENAI:
+            return "openai"
+        return "google"
+
+    def _speak_summary(self, final: str):
+        try:
+            speak("Here is the video summary:", mood="happy")
+            # break into smaller speak calls so TTS doesn't hit limits
+            for part in final.split("\n\n"):
+                speak(part.strip(), mood="neutral")
+        except Exception:
+            pass
 
-    def _transcribe(self, wav_path: str) -> str:
+    def _speech_segments(self, media_path: str):
+        """(start_ms, end_ms, pcm, rate) per speech range, decoded as a stream."""
+        if not media_path.lower().endswith(".wav") and audio_vad.ffmpeg_exe():
+            rate, blocks = audio_vad.iter_media(media_path)
+            for start_ms, end_ms, pcm in audio_vad.iter_speech(blocks, rate):
+                yield start_ms, end_ms, pcm, rate
+            return
+        wav = media_path if media_path.lower().endswith(".wav") else _extract_audio(media_path)
+        if not wav:
+            return
+        try:
+            rate, blocks = audio_vad.iter_wav(wav)
+            for start_ms, end_ms, pcm in audio_vad.iter_speech(blocks, rate):
+                yield start_ms, end_ms, pcm, rate
+        finally:
+            if wav != media_path:
+                try:
+                    os.remove(wav)
+                except Exception:
+                    pass
+
+    def transcribe_segments(self, media_path: str, workers: Optional[int] = None) -> List[dict]:
+        """
+        Timestamped transcript of a video / audio file:
+        [{"start": s, "end": s, "text": str}, ...] in time order. Speech
+        segments only — silence is never sent to the recognizer; segments
+        run concurrently on the transcription pool while decoding continues.
+        """
+        if audio_vad is None:
+            wav = media_path if media_path.lower().endswith(".wav") else _extract_audio(media_path)
+            if not wav:
+                return []
+            try:
+                text = self._transcribe_whole(wav)
+            finally:
+                if wav != media_path:
+                    try:
+                        os.remove(wav)
+                    except Exception:
+                        pass
+            return [{"start": 0.0, "end": None, "text": text}] if text else []
+
+        return [s for s in self._iter_transcripts(media_path, workers) if s["text"]]
+
+    def _iter_transcripts(self, media_path: str, workers: Optional[int] = None) -> Iterator[dict]:
+        """
+        {"start", "end", "text"} per speech segment, in time order, as soon
+        as each is done: transcription pool first; if the pool fails, the
+        rest of the media is transcribed serially (segments already handed
+        out are skipped).
+        """
+        done_until = -1.0           # end (s) of the last segment handed out
+        stream = transcribe_pool.iter_transcripts(
+            self._speech_segments(media_path), self._stt_backend(),
+            workers=workers, model_name=_WHISPER_MODEL,
+        )
+        try:
+            for seg in stream:
+                done_until = seg["end"]
+                yield seg
+            return
+        except Exception as e:
+            print("⚠️ parallel transcription failed — using serial:", e)
+        finally:
+            stream.close()          # stops ffmpeg and cancels queued segments
+        segments = self._speech_segments(media_path)
+        try:
+            for start_ms, end_ms, pcm, rate in segments:
+                if end_ms / 1000.0 <= done_until:
+                    continue
+                yield {"start": start_ms / 1000.0, "end": end_ms / 1000.0,
+                       "text": _transcribe_pcm(pcm, rate).strip()}
+        finally:
+            segments.close()
+
+    def _transcribe_whole(self, wav_path: str) -> str:
         # priority: whisper local -> openai -> google
         text = ""
         if _WHISPER:
@@ -200,38 +426,49 @@ class VideoReader:
         text = _transcribe_with_google(wav_path)
         return text or ""
 
-    def summarize(self, video_path: str, prefer_summarizer: str = "auto", do_ocr: bool = True) -> Optional[str]:
+    def summarize(self, video_path: str, prefer_summarizer: str = "auto", do_ocr: bool = True) -> Optional[dict]:
         """
-        Synchronous summarization. Returns final summary string or None on failure.
+        Synchronous summarization. Returns a structured result or None on failure:
+        {"title", "key_points": [str], "timestamps": [{"start", "end", "text"}], "summary": str}
         For long videos, use summarize_async to avoid blocking.
         """
         if not os.path.exists(video_path):
             speak("I couldn't find that video.", mood="alert")
             return None
 
-        speak("Processing video. This may take a bit...", mood="neutral")
+        # identical content summarized before → answer from cache
+        digest = _file_digest(video_path)
+        use_ocr = bool(do_ocr and _OCR)
+        params = {"backend": _summary_backend(prefer_summarizer), "ocr": use_ocr, "structured": True}
+        result = summary_cache.get("summary", digest, params) if digest else None
+        if result is not None:
+            self._speak_summary(result["summary"])
+            return result
 
-        wav = _extract_audio(video_path)
-        if not wav:
-            speak("Couldn't extract audio from the video.", mood="alert")
-            return None
+        speak("Processing video. This may take a bit...", mood="neutral")
 
         # optional OCR to enrich context
         slide_texts = []
-        if do_ocr and _OCR:
-            try:
-                slide_texts = _extract_slide_texts(video_path)
-            except Exception:
-                slide_texts = []
-
-        # transcribe whole audio
-        transcript = self._transcribe(wav)
-        # delete wav
-        try:
-            os.remove(wav)
-        except:
-            pass
-
+        if use_ocr:
+            slide_params = {"sample_s": SLIDE_SAMPLE_SECONDS, "scene": SLIDE_HIST_THRESHOLD}
+            slide_texts = summary_cache.get("slides", digest, slide_params) if digest else None
+            if slide_texts is None:
+                try:
+                    slide_texts = _extract_slide_texts(video_path)
+                except Exception:
+                    slide_texts = []
+                if digest:
+                    summary_cache.put("slides", digest, slide_params, slide_texts)
+
+        stt_params = {"stt": self._stt_backend()}
+        segments = summary_cache.get("segments", digest, stt_params) if digest else None
+        if segments is None:
+            # audio is decoded, segmented and transcribed as one stream
+            segments = self.transcribe_segments(video_path)
+            if digest and segments:
+                summary_cache.put("segments", digest, stt_params, segments)
+
+        transcript = " ".join(s["text"] for s in segments)
         if not transcript:
             speak("I couldn't transcribe the audio reliably.", mood="alert")
             return None
@@ -241,7 +478,7 @@ class VideoReader:
             transcript = "\n".join(slide_texts[:3]) + "\n\n" + transcript
 
         # chunk + summarize
-        summary = _summarize_text(transcript, prefer=prefer_summarizer)
+        summary, used = _summarize(transcript, prefer=prefer_summarizer)
 
         # postprocess summary: create bullets if not too long
         bullets = []
@@ -249,17 +486,112 @@ class VideoReader:
             if line.strip():
                 bullets.append(line.strip())
         final = "\n".join(bullets[:8]) if bullets else summary
+        result = {
+            "title": os.path.splitext(os.path.basename(video_path))[0],
+            "key_points": bullets[:8],
+            "timestamps": segments,
+            "summary": final,
+        }
+        if digest:
+            # keyed on the backend that produced it (a fallback never
+            # answers a later lookup for the preferred backend)
+            summary_cache.put("summary", digest, dict(params, backend=used), result)
 
         # speak structured summary
+        self._speak_summary(final)
+        return result
+
+    # -------------------------
+    # Follow-along (live) mode
+    # -------------------------
+    def _push_status(self, text: str):
         try:
-            speak("Here is the video summary:", mood="happy")
-            # break into smaller speak calls so TTS doesn't hit limits
-            for part in final.split("\n\n"):
-                speak(part.strip(), mood="neutral")
+            if fx.overlay_instance:
+                fx.overlay_instance.set_status(text[:FOLLOW_STATUS_CHARS])
         except Exception:
             pass
 
-        return final
+    def follow_along(self, media_path: str, summary_every_s: float = FOLLOW_SUMMARY_EVERY_S,
+                     prefer_summarizer: str = "textrank", speak_summaries: bool = True,
+                     on_update: Optional[Callable[[str, dict], None]] = None) -> Optional[dict]:
+        """
+        Live mode for long videos / audio files. Speech is transcribed while
+        ffmpeg is still decoding; every segment updates the overlay, and every
+        `summary_every_s` seconds of media the new part of the transcript is
+        summarized (on a side thread, so transcription never waits) and spoken.
+        on_update(kind, payload): kind "segment" ({"start","end","text"}) or
+        "summary" ({"start","end","summary"}).
+        Returns {"segments", "summaries"} when the media ends or stop_follow() is called.
+        """
+        if not os.path.exists(media_path):
+            speak("I couldn't find that file.", mood="alert")
+            return None
+        if audio_vad is None:
+            speak("Live mode needs NumPy. Summarizing the whole file instead.", mood="neutral")
+            return self.summarize(media_path, prefer_summarizer)
+
+        self._follow_stop.clear()
+        segments: List[dict] = []
+        summaries: List[dict] = []
+        window: List[dict] = []
+
+        def _emit(kind, payload):
+            if on_update:
+                try:
+                    on_update(kind, payload)
+                except Exception as e:
+                    print("⚠️ follow-along callback failed:", e)
+
+        def _roll_summary(part: List[dict]):
+            text = " ".join(s["text"] for s in part)
+            try:
+                summary = _summarize_text(text, prefer=prefer_summarizer).strip()
+            except Exception as e:
+                print("⚠️ rolling summary failed:", e)
+                return
+            if not summary:
+                return
+            entry = {"start": part[0]["start"], "end": part[-1]["end"], "summary": summary}
+            summaries.append(entry)
+            _emit("summary", entry)
+            self._push_status(f"📝 {_clock(entry['start'])}–{_clock(entry['end'])} {summary}")
+            if speak_summaries and not self._follow_stop.is_set():
+                speak(f"Up to {_clock(entry['end'])}: {summary}", mood="neutral")
+
+        speak("Following along. I'll summarize as we go.", mood="neutral")
+        stream = self._iter_transcripts(media_path)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="JarvisFollow") as summarizer:
+            try:
+                for seg in stream:
+                    if self._follow_stop.is_set():
+                        break
+                    if not seg["text"]:
+                        continue
+                    segments.append(seg)
+                    window.append(seg)
+                    _emit("segment", seg)
+                    self._push_status(f"🎧 {_clock(seg['start'])} {seg['text']}")
+                    if seg["end"] - window[0]["start"] >= summary_every_s:
+                        summarizer.submit(_roll_summary, window)
+                        window = []
+            except Exception as e:
+                print("⚠️ follow-along transcription failed:", e)
+            finally:
+                stream.close()      # stops ffmpeg and cancels queued segments
+            if window and not self._follow_stop.is_set():
+                summarizer.submit(_roll_summary, window)
+
+        self._push_status("Ready")
+        return {"segments": segments, "summaries": summaries}
+
+    def follow_along_async(self, media_path: str, **kwargs):
+        t = threading.Thread(target=self.follow_along, args=(media_path,), kwargs=kwargs, daemon=True)
+        t.start()
+        self._thread = t
+        return t
+
+    def stop_follow(self):
+        self._follow_stop.set()
 
     def summarize_async(self, video_path: str, prefer_summarizer: str = "auto", do_ocr: bool = True):
         t = threading.Thread(target=self.summarize, args=(video_path, prefer_summarizer, do_ocr), daemon=True)
@@ -13,9 +13,8 @@ from PyQt5 import QtWidgets
 from core.interface import InterfaceOverlay
 from core import voice_effects  # overlay attach helper (may expose attach_overlay / overlay_instance)
 
-# TRUE shared state
+# TRUE shared state (sleep manager, speech, listener load in the boot graph)
 import core.state as state
-import core.sleep_manager as sleep_manager  # manage sleep/wake with overlay
 
 
 # ======================================================================
@@ -25,68 +24,170 @@ class FaceAuth:
     """
     Stable & cinematic face verification using fallback OpenCV histogram.
     DeepFace is optional and safely handled.
+    Reference features (embedding + histogram) are computed once, saved
+    next to the reference image and compared in memory with a camera frame.
     """
 
+    FACE_MODEL = "Facenet"
+    MAX_COSINE_DISTANCE = 0.40    # DeepFace's verify threshold for Facenet/cosine
+    MIN_HIST_CORREL = 0.55
+
     def __init__(self):
         self.reference_path = os.path.join("config", "face_data", "yash_reference.jpg")
+        self.features_path = os.path.join("config", "face_data", "yash_reference.npz")
         os.makedirs(os.path.dirname(self.reference_path), exist_ok=True)
+        self._reference = None    # {"sig", "hist", "embedding"}
         print("📸 FaceAuth loaded")
 
     # ------------------------------------------------------
     def capture_reference(self):
         import cv2
         from core.speech_engine import speak
+        from core.camera_service import camera
 
-        cap = cv2.VideoCapture(0)
-        if not cap.isOpened():
+        if not camera.open():
             speak("Camera not accessible, Yash.", mood="alert")
             return
 
+        # the camera warms up while this is spoken
         speak("Look at the camera. Capturing your reference image.", mood="serious")
-        time.sleep(1.2)
-        ret, frame = cap.read()
-        cap.release()
+        frame = camera.get_frame(max_age=0.2)
 
-        if not ret:
+        if frame is None:
             speak("Failed to capture your face clearly.", mood="alert")
             return
 
         cv2.imwrite(self.reference_path, frame)
         print("✅ Reference saved:", self.reference_path)
+        self._build_reference(frame)
         speak("Reference image captured successfully.", mood="happy")
 
     # ------------------------------------------------------
-    def _fallback_compare(self, ref_path, img2_path):
-        """OpenCV histogram fallback."""
+    # Reference features (computed once, cached on disk)
+    # ------------------------------------------------------
+    @staticmethod
+    def _histogram(frame):
         import cv2
+        img = cv2.resize(frame, (224, 224))
+        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+        hist = cv2.calcHist([hsv], [0, 1], None, [50, 60], [0, 180, 0, 256])
+        cv2.normalize(hist, hist, 0, 1, cv2.NORM_MINMAX)
+        return hist
+
+    def _embedding(self, frame):
+        """Face embedding of a BGR frame (None without DeepFace)."""
+        import numpy as np
         try:
-            ref = cv2.imread(ref_path)
-            img = cv2.imread(img2_path)
-            if ref is None or img is None:
-                return False
+            from deepface import DeepFace
+            reps = DeepFace.represent(
+                img_path=frame,
+                model_name=self.FACE_MODEL,
+                detector_backend="opencv",
+                enforce_detection=False
+            )
+            return np.asarray(reps[0]["embedding"], dtype=np.float32)
+        except Exception as e:
+            print("⚠️ DeepFace unavailable — using fallback:", e)
+            return None
 
-            ref = cv2.resize(ref, (224, 224))
-            img = cv2.resize(img, (224, 224))
+    def _reference_sig(self):
+        # features depend on the image and on the embedding model
+        st = os.stat(self.reference_path)
+        return [st.st_size, st.st_mtime_ns, self.FACE_MODEL]
 
-            ref_hsv = cv2.cvtColor(ref, cv2.COLOR_BGR2HSV)
-            img_hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+    @staticmethod
+    def _deepface_available():
+        try:
+            from deepface import DeepFace  # noqa: F401
+            return True
+        except Exception:
+            return False
 
-            h1 = cv2.calcHist([ref_hsv], [0, 1], None, [50, 60], [0, 180, 0, 256])
-            h2 = cv2.calcHist([img_hsv], [0, 1], None, [50, 60], [0, 180, 0, 256])
-            cv2.normalize(h1, h1, 0, 1, cv2.NORM_MINMAX)
-            cv2.normalize(h2, h2, 0, 1, cv2.NORM_MINMAX)
+    def _build_reference(self, frame):
+        import numpy as np
+        ref = {
+            "sig": self._reference_sig(),
+            "hist": self._histogram(frame),
+            "embedding": self._embedding(frame),
+        }
+        try:
+            arrays = {
+                "sig": np.asarray(ref["sig"][:2], dtype=np.int64),
+                "model": np.asarray(ref["sig"][2]),
+                "hist": ref["hist"],
+            }
+            if ref["embedding"] is not None:
+                arrays["embedding"] = ref["embedding"]
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.features_path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, self.features_path)
+        except Exception as e:
+            print("⚠️ Could not save reference features:", e)
+        self._reference = ref
+        return ref
+
+    def _load_reference(self):
+        """
+        Reference features: memory → .npz next to the image → recompute
+        (and rewrite the .npz) when the image or FACE_MODEL changed, or the
+        cached file lacks an embedding DeepFace could now provide.
+        """
+        import numpy as np
+        sig = self._reference_sig()
+        if self._reference is not None and self._reference["sig"] == sig:
+            return self._reference
+        try:
+            with np.load(self.features_path) as data:
+                # files from before the model was recorded have no "model" → recompute
+                cached = data["sig"].tolist() + [str(data["model"])]
+                # saved without an embedding (DeepFace was missing): recompute once it is there
+                complete = "embedding" in data or not self._deepface_available()
+                if cached == sig and complete:
+                    self._reference = {
+                        "sig": sig,
+                        "hist": data["hist"],
+                        "embedding": data["embedding"] if "embedding" in data else None,
+                    }
+                    return self._reference
+        except Exception:
+            pass
+        import cv2
+        frame = cv2.imread(self.reference_path)
+        if frame is None:
+            return None
+        return self._build_reference(frame)
 
-            score = cv2.compareHist(h1, h2, cv2.HISTCMP_CORREL)
-            return score >= 0.55
+    # ------------------------------------------------------
+    def _fallback_compare(self, ref_hist, frame):
+        """OpenCV histogram fallback."""
+        import cv2
+        try:
+            score = cv2.compareHist(ref_hist, self._histogram(frame), cv2.HISTCMP_CORREL)
+            return score >= self.MIN_HIST_CORREL
 
         except Exception as e:
             print("⚠️ Fallback compare error:", e)
             return False
 
+    def _matches(self, frame):
+        """In-memory verification of a BGR frame against the cached reference."""
+        import numpy as np
+        ref = self._load_reference()
+        if ref is None:
+            return False
+        if ref["embedding"] is not None:
+            emb = self._embedding(frame)
+            if emb is not None:
+                a = ref["embedding"]
+                norm = float(np.linalg.norm(a) * np.linalg.norm(emb)) or 1.0
+                return 1.0 - float(a @ emb) / norm <= self.MAX_COSINE_DISTANCE
+        return self._fallback_compare(ref["hist"], frame)
+
     # ------------------------------------------------------
     def verify_user(self):
-        import cv2
         from core.speech_engine import speak, jarvis_fx
+        from core.camera_service import camera
 
         # Ensure reference exists
         if not os.path.exists(self.reference_path):
@@ -95,8 +196,7 @@ class FaceAuth:
             if not os.path.exists(self.reference_path):
                 return False
 
-        cap = cv2.VideoCapture(0)
-        if not cap.isOpened():
+        if not camera.open():
             speak("Camera not accessible for verification.", mood="alert")
             return False
 
@@ -130,12 +230,10 @@ class FaceAuth:
 
         threading.Thread(target=scan_anim, daemon=True).start()
 
-        time.sleep(1.4)
-
-        ret, frame = cap.read()
-        cap.release()
+        # warm capture (opened during boot) → the newest frame, no warm-up wait
+        frame = camera.get_frame(max_age=0.2)
 
-        if not ret:
+        if frame is None:
             speak("Couldn't capture a clear image.", mood="alert")
             try:
                 jarvis_fx.fade_out_ambient(800)
@@ -143,33 +241,10 @@ class FaceAuth:
                 pass
             return False
 
-        # Save temp scan image
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as tmp:
-            scan_path = tmp.name
-        import cv2
-        cv2.imwrite(scan_path, frame)
-
-        # Try DeepFace first
-        verified = False
-        try:
-            from deepface import DeepFace
-            result = DeepFace.verify(
-                img1_path=self.reference_path,
-                img2_path=scan_path,
-                model_name="Facenet",
-                detector_backend="opencv",
-                enforce_detection=False
-            )
-            verified = bool(result.get("verified", False))
-        except Exception as e:
-            print("⚠️ DeepFace unavailable — using fallback:", e)
-            verified = self._fallback_compare(self.reference_path, scan_path)
-
-        # Remove temp
-        try:
-            os.remove(scan_path)
-        except:
-            pass
+        # compare in memory against the cached reference features
+        started = time.perf_counter()
+        verified = self._matches(frame)
+        print(f"🔐 Face check {(time.perf_counter() - started) * 1000:.0f} ms")
 
         # Stop ambient
         try:
@@ -198,122 +273,144 @@ def _time_greeting():
 
 def jarvis_startup(overlay):
     print("\n🤖 Booting Yash’s JARVIS…\n")
-    import core.state as state
-    from core.speech_engine import speak, jarvis_fx
-    from core.memory_engine import JarvisMemory
-    from core.command_handler import JarvisCommandHandler
-    from core.listener import JarvisListener
+    from core.boot import BootOrchestrator
 
-    memory = JarvisMemory()
-    handler = JarvisCommandHandler()
+    boot = BootOrchestrator()
 
-    # Link overlay to effects (preferred API: attach_overlay)
-    try:
+    # ----------------------- INDEPENDENT SUBSYSTEMS ------------------------
+    @boot.step("overlay")
+    def _attach_overlay():
+        # Link overlay to effects (preferred API: attach_overlay)
         if hasattr(voice_effects, "attach_overlay"):
             voice_effects.attach_overlay(overlay)
         else:
             # fallback: set attribute directly
             voice_effects.overlay_instance = overlay
+        try:
+            overlay.set_status("Booting systems…")
+        except:
+            pass
         print("🌀 Overlay attached.")
-    except Exception as e:
-        print("⚠️ Overlay attach failed:", e)
 
-    # Start sleep manager with overlay so it can dim/wake the UI
-    try:
-        sleep_manager.start_manager(overlay)
-    except Exception:
+    @boot.step("speech")
+    def _load_speech():
+        import core.speech_engine as speech_engine   # pygame mixer + TTS engines
+        return speech_engine
+
+    @boot.step("listener_module")
+    def _load_listener_module():
+        import core.listener as listener_module
+        return listener_module
+
+    @boot.step("camera_prefetch")
+    def _prefetch_camera():
+        # open the shared camera and load the face model (DeepFace keeps it
+        # resident) while audio boots
+        from core.camera_service import camera
+        camera.open(wait=False)
         try:
+            from deepface import DeepFace
+            DeepFace.build_model(FaceAuth.FACE_MODEL)
+        except Exception:
+            pass
+        return camera
+
+    @boot.step("memory", lazy=True)
+    def _load_memory():
+        from core.memory_engine import JarvisMemory
+        return JarvisMemory()
+
+    # ----------------------- DEPENDENT SUBSYSTEMS ------------------------
+    @boot.step("sleep_manager", deps=("overlay", "speech"))
+    def _start_sleep_manager():
+        import core.sleep_manager as sleep_manager  # manage sleep/wake with overlay
+        # Start sleep manager with overlay so it can dim/wake the UI
+        try:
+            sleep_manager.start_manager(overlay)
+        except Exception:
             # fallback: start without overlay
             sleep_manager.start_manager()
+        # Initialize LAST_INTERACTION so sleep manager has a baseline
+        sleep_manager.touch()
+        return sleep_manager
+
+    @boot.step("listener", deps=("listener_module", "sleep_manager"))
+    def _start_listener():
+        # instantiate listener (it starts its own continuous thread);
+        # it runs in limited mode until face verification sets FACE_VERIFIED
+        listener = boot.get("listener_module").JarvisListener()
+        boot.mark("listener ready")
+        print("\n🎤 Listener online — say: Hey Jarvis\n")
+        return listener
+
+    @boot.step("boot_fx", deps=("overlay", "speech"))
+    def _boot_fx():
+        jarvis_fx = boot.get("speech").jarvis_fx
+        # Startup sound (its own overlay animation paces the sequence)
+        try:
+            jarvis_fx.play_startup()
         except Exception as e:
-            print("⚠️ Sleep manager failed to start:", e)
-
-    try:
-        overlay.set_status("Booting systems…")
-    except:
-        pass
+            print("⚠️ Startup sound:", e)
+        boot.get("speech").speak(
+            "System booting up. Initializing cognition and neural modules.", mute_ambient=True
+        )
 
-    # Boot animation
-    for _ in range(3):
-        try:
-            overlay.react_to_audio(1.2)
-            time.sleep(0.28)
-            overlay.react_to_audio(0.2)
-            time.sleep(0.28)
-        except:
-            time.sleep(0.5)
+    # ----------------------- FACE VERIFICATION ------------------------
+    @boot.step("face", deps=("boot_fx", "camera_prefetch"))
+    def _verify_face():
+        face = FaceAuth()
+        verified = face.verify_user()
 
-    # Startup sound
-    try:
-        jarvis_fx.play_startup()
-    except Exception as e:
-        print("⚠️ Startup sound:", e)
-    time.sleep(5)
+        # Sync to global state
+        state.FACE_VERIFIED = bool(verified)
+        return verified
 
-    speak("System booting up. Initializing cognition and neural modules.", mute_ambient=True)
-    time.sleep(0.6)
+    # ----------------------- GREETING ------------------------
+    @boot.step("greeting", deps=("face",))
+    def _greet():
+        from core.speech_engine import speak, jarvis_fx
+        verified = boot.get("face")
 
-    # ----------------------- FACE VERIFICATION ------------------------
-    face = FaceAuth()
-    verified = face.verify_user()
+        # SUCCESS / FAILURE SOUNDS
+        if verified:
+            try:
+                jarvis_fx.play_success()
+            except:
+                pass
+            try:
+                overlay.set_status("Identity verified ✅")
+                overlay.set_mood("happy")
+                overlay.react_to_audio(1.3)
+            except:
+                pass
+            speak("Identity verified. Welcome back, Yash.", mood="happy", mute_ambient=True)
+        else:
+            try:
+                jarvis_fx.play_alert()
+            except:
+                pass
+            try:
+                overlay.set_status("Identity not recognized ❌")
+                overlay.set_mood("alert")
+                overlay.react_to_audio(0.6)
+            except:
+                pass
+            speak("I couldn't recognize you. Limited mode enabled.", mood="alert", mute_ambient=True)
 
-    # Sync to global state
-    state.FACE_VERIFIED = bool(verified)
+        greet = _time_greeting()
+        memory = boot.get("memory")
+        mood = memory.get_mood() if memory else "neutral"
 
-    # SUCCESS / FAILURE SOUNDS
-    from core.speech_engine import speak, jarvis_fx
+        speak(f"{greet}, Yash.", mood=mood, mute_ambient=True)
+        speak("Say 'Hey Jarvis' when you're ready.", mute_ambient=True)
 
-    if verified:
-        try:
-            jarvis_fx.play_success()
-        except:
-            pass
-        try:
-            overlay.set_status("Identity verified ✅")
-            overlay.set_mood("happy")
-            overlay.react_to_audio(1.3)
-        except:
-            pass
-        speak("Identity verified. Welcome back, Yash.", mood="happy", mute_ambient=True)
-    else:
         try:
-            jarvis_fx.play_alert()
+            overlay.set_status("Listening…")
         except:
             pass
-        try:
-            overlay.set_status("Identity not recognized ❌")
-            overlay.set_mood("alert")
-            overlay.react_to_audio(0.6)
-        except:
-            pass
-        speak("I couldn't recognize you. Limited mode enabled.", mood="alert", mute_ambient=True)
-
-    # ----------------------- GREETING ------------------------
-    greet = _time_greeting()
-    mood = memory.get_mood()
-
-    speak(f"{greet}, Yash.", mute_ambient=True)
-    time.sleep(0.3)
-    speak("Say 'Hey Jarvis' when you're ready.", mute_ambient=True)
 
-    # ----------------------- LISTENER ------------------------
-    try:
-        overlay.set_status("Listening…")
-    except:
-        pass
-
-    # Initialize LAST_INTERACTION so sleep manager has a baseline
-    try:
-        state.LAST_INTERACTION = time.time()
-    except:
-        pass
-
-    print("\n🎤 Listener online — say: Hey Jarvis\n")
-    try:
-        # instantiate listener (it starts its own continuous thread)
-        JarvisListener()
-    except Exception as e:
-        print("⚠️ Listener failed:", e)
+    boot.run()
+    boot.timeline()
 
     # main thread keeps running to keep Qt app alive and threads working
     while True:
@@ -0,0 +1,62 @@
+# tests/conftest.py
+"""
+Shared test setup.
+
+- Runs from the repo root so `core.*` imports resolve.
+- core.speech_engine needs pygame / edge-tts and an audio device; when it
+  cannot be imported, a silent `speak` stands in so engine modules that
+  import it at module level can still be tested.
+- Tracked files under config/ are restored after the session (importing
+  the memory engine re-saves config/memory.json).
+- `mem` points the JarvisMemory singleton (and its fact index) at a
+  temporary file.
+"""
+
+import os
+import sys
+import types
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+try:
+    import core.speech_engine  # noqa: F401
+except Exception:
+    _speech = types.ModuleType("core.speech_engine")
+    _speech.speak = lambda *a, **k: None
+    _speech.jarvis_fx = None
+    sys.modules["core.speech_engine"] = _speech
+
+_TRACKED_CONFIG = ["memory.json", "nlp_history.txt", "settings.json"]
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _keep_config_files():
+    paths = [os.path.join(ROOT, "config", name) for name in _TRACKED_CONFIG]
+    saved = {}
+    for p in paths:
+        if os.path.exists(p):
+            with open(p, "rb") as f:
+                saved[p] = f.read()
+    yield
+    for p, data in saved.items():
+        with open(p, "wb") as f:
+            f.write(data)
+
+
+@pytest.fixture
+def mem(tmp_path):
+    from core import memory_engine
+    m = memory_engine.memory
+    m.flush()
+    saved_path, saved_snapshot = m.file_path, m._snapshot
+    m.file_path = str(tmp_path / "memory.json")
+    m._snapshot = memory_engine._default_memory()
+    m._facts_index.rebuild({})
+    yield m
+    m.flush()
+    m.file_path, m._snapshot = saved_path, saved_snapshot
+    m._facts_index.rebuild(saved_snapshot.get("facts", {}))
@@ -0,0 +1,30 @@
+# tests/test_audio_vad.py
+import numpy as np
+
+from core.audio_vad import VadSegmenter
+
+
+def _segments(speech, rate=16000, **kwargs):
+    """Ranges for a speech / silence pattern [(seconds, is_speech), ...]."""
+    seg = VadSegmenter(rate, use_webrtc=False, **kwargs)
+    seg._is_speech = lambda frame: bool(frame.any())
+    out = []
+    for seconds, on in speech:
+        pcm = np.full(int(seconds * rate), 1000 if on else 0, dtype=np.int16)
+        out.extend(seg.feed(pcm))
+    out.extend(seg.finish())
+    return out
+
+
+def test_forced_cut_pieces_do_not_overlap():
+    ranges = _segments([(0.9, False), (69.9, True), (2.1, False)], max_segment_ms=30000, padding_ms=300)
+    assert len(ranges) == 3
+    assert ranges[0][0] == 600 and ranges[-1][1] == 71100
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert start == end
+    assert all(end - start <= 30000 for start, end in ranges)
+
+
+def test_separate_utterances_are_padded_both_sides():
+    ranges = _segments([(0.9, False), (2.1, True), (3.0, False), (2.1, True), (2.1, False)], padding_ms=300)
+    assert ranges == [(600, 3300), (5700, 8400)]
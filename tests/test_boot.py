@@ -0,0 +1,94 @@
+# tests/test_boot.py
+import threading
+import time
+
+import pytest
+
+from core.boot import BootOrchestrator
+
+
+def test_steps_wait_for_their_dependencies_only():
+    boot = BootOrchestrator()
+    order = []
+    lock = threading.Lock()
+    both_running = threading.Barrier(2, timeout=2)
+
+    def _step(name, result, overlap=False):
+        def _fn():
+            if overlap:
+                both_running.wait()      # independent steps run at the same time
+            with lock:
+                order.append(name)
+            return result
+        return _fn
+
+    boot.add("mixer", _step("mixer", 1, overlap=True))
+    boot.add("camera", _step("camera", 2, overlap=True))
+    boot.add("speech", _step("speech", 3), deps=("mixer",))
+    boot.add("sleep", lambda: boot.get("speech") + boot.get("camera"), deps=("speech", "camera"))
+    boot.run()
+
+    assert order.index("mixer") < order.index("speech")
+    assert boot.get("sleep") == 5
+    steps = boot._steps
+    assert steps["speech"].started >= steps["mixer"].finished
+    assert steps["sleep"].started >= max(steps["speech"].finished, steps["camera"].finished)
+
+
+def test_lazy_step_starts_on_first_get_only():
+    boot = BootOrchestrator()
+    calls = []
+    boot.add("config", lambda: calls.append("config") or {"volume": 3}, lazy=True)
+    boot.add("memory", lambda: calls.append("memory") or boot.get("config")["volume"],
+             deps=("config",), lazy=True)
+    boot.add("overlay", lambda: calls.append("overlay"))
+    boot.run()
+    assert calls == ["overlay"]
+
+    assert boot.get("memory") == 3
+    assert boot.get("memory") == 3
+    assert calls == ["overlay", "config", "memory"]     # dependencies first, once each
+
+
+def test_failed_step_does_not_stop_boot():
+    boot = BootOrchestrator()
+    boot.add("camera", lambda: 1 / 0)
+    boot.add("face", lambda: "skipped" if boot.get("camera") is None else "ok", deps=("camera",))
+    boot.run()
+    assert isinstance(boot._steps["camera"].error, ZeroDivisionError)
+    assert boot.get("face") == "skipped"
+
+
+def test_unknown_dependency_is_rejected():
+    boot = BootOrchestrator()
+    ran = []
+    boot.add("listener", lambda: ran.append(1), deps=("microphone",))
+    with pytest.raises(ValueError, match="unknown step microphone"):
+        boot.run()
+    assert ran == []
+
+
+@pytest.mark.parametrize("deps, cycle", [
+    ({"a": ("b",), "b": ("a",)}, "a → b → a"),
+    ({"a": ("a",)}, "a → a"),
+    ({"root": ("a",), "a": ("b",), "b": ("c",), "c": ("a",)}, "a → b → c → a"),
+])
+def test_dependency_cycle_is_rejected(deps, cycle):
+    boot = BootOrchestrator()
+    for name, d in deps.items():
+        boot.add(name, lambda: None, deps=d)
+    started = time.perf_counter()
+    with pytest.raises(ValueError, match=cycle):
+        boot.run()
+    # lazy access takes the same check instead of blocking forever
+    with pytest.raises(ValueError):
+        boot.get("a", timeout=5)
+    assert time.perf_counter() - started < 1
+    assert all(s.thread is None for s in boot._steps.values())
+
+
+def test_duplicate_step_is_rejected():
+    boot = BootOrchestrator()
+    boot.add("speech", lambda: None)
+    with pytest.raises(ValueError):
+        boot.add("speech", lambda: None)
@@ -0,0 +1,55 @@
+# tests/test_camera_service.py
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from core import camera_service  # noqa: E402
+from core.camera_service import CameraService  # noqa: E402
+
+
+class _FakeCapture:
+    def __init__(self, opened=True, frames=True):
+        self._opened, self._frames = opened, frames
+
+    def isOpened(self):
+        return self._opened
+
+    def read(self):
+        if self._frames:
+            return True, np.zeros((4, 4, 3), dtype=np.uint8)
+        return False, None
+
+    def release(self):
+        pass
+
+
+@pytest.fixture
+def capture(monkeypatch):
+    def _use(**kwargs):
+        monkeypatch.setattr(camera_service.cv2, "VideoCapture", lambda index: _FakeCapture(**kwargs))
+        cam = CameraService(warmup_s=0.0)
+        cams.append(cam)
+        return cam
+
+    cams = []
+    yield _use
+    for cam in cams:
+        cam.close()
+
+
+def test_open_waits_for_first_frame(capture):
+    cam = capture()
+    assert cam.open(timeout=2.0)
+    assert cam.frames_read >= 1
+    assert cam.get_frame() is not None
+
+
+def test_open_fails_without_device(capture):
+    assert not capture(opened=False).open(timeout=2.0)
+
+
+def test_open_times_out_when_no_frame_arrives(capture):
+    cam = capture(frames=False)
+    assert not cam.open(timeout=0.2)
+    assert cam.open(wait=False)      # still warming in the background
@@ -0,0 +1,15 @@
+# tests/test_conversation_core.py
+import pytest
+
+from core.conversation_core import JarvisConversation
+
+
+@pytest.fixture(scope="module")
+def conv():
+    return JarvisConversation()
+
+
+def test_contraction_flips_positive_sentiment(conv):
+    assert conv._estimate_sentiment("I feel good") == "happy"
+    assert conv._estimate_sentiment("I don't feel good") == conv._estimate_sentiment("I do not feel good")
+    assert conv._estimate_sentiment("I don't feel good") != "happy"
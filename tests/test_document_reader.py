@@ -0,0 +1,128 @@
+# tests/test_document_reader.py
+import threading
+import time
+import types
+
+import pytest
+
+from core import document_reader as dr
+
+
+class _StubLLM:
+    """prompt -> text; records peak concurrency, slower for early chunks."""
+
+    def __init__(self, n):
+        self.n = n
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.calls = 0
+
+    def __call__(self, prompt):
+        chunk = prompt[len(dr._LLM_PROMPT):]
+        index = int(chunk.split()[0][len("chunk"):])
+        with self.lock:
+            self.running += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            # early chunks finish last, so completion order != chunk order
+            time.sleep(0.005 * (self.n - index))
+            return f"summary {index}"
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def _document(n, words=20):
+    return " ".join(f"chunk{i} " + " ".join(["word"] * (words - 1)) for i in range(n))
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 3, 8])
+def test_llm_map_keeps_order_and_bounds_concurrency(max_in_flight):
+    n = 12
+    stub = _StubLLM(n)
+    summary, backend = dr._summarize(_document(n), max_words_chunk=20, llm=stub,
+                                     max_in_flight=max_in_flight)
+    assert backend == "llm"
+    assert summary.split("\n\n") == [f"summary {i}" for i in range(n)]
+    assert stub.calls == n
+    assert stub.peak <= max_in_flight
+    if max_in_flight > 1:
+        assert stub.peak > 1
+
+
+def test_openai_model_discovery_runs_once(monkeypatch):
+    n = 10
+    stub = _StubLLM(n)
+    listed = []
+
+    def _create(model, messages, **kwargs):
+        assert model == "gpt-4o-mini"
+        text = stub(messages[0]["content"])
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(
+            message=types.SimpleNamespace(content=text))])
+
+    fake = types.SimpleNamespace(
+        Model=types.SimpleNamespace(list=lambda: listed.append(1) or {"data": [{"id": "gpt-4o-mini"}]}),
+        ChatCompletion=types.SimpleNamespace(create=_create),
+    )
+    monkeypatch.setattr(dr, "openai", fake, raising=False)
+    monkeypatch.setattr(dr, "_OPENAI_AVAILABLE", True)
+    dr._openai_model.cache_clear()
+    try:
+        summary, backend = dr._summarize(_document(n), max_words_chunk=20, prefer="openai",
+                                         max_in_flight=4)
+    finally:
+        dr._openai_model.cache_clear()
+    assert backend == "openai"
+    assert summary.split("\n\n") == [f"summary {i}" for i in range(n)]
+    assert stub.peak <= 4
+    assert len(listed) == 1
+
+
+# ---------------- TextRank ----------------
+_ARTICLE = [
+    "Solar panels convert sunlight into electricity for the home.",
+    "My cat likes sleeping on the warm windowsill.",
+    "Modern solar panels reach high efficiency in direct sunlight.",
+    "The bakery down the street sells fresh bread.",
+    "Electricity from solar panels can charge a home battery.",
+    "Football practice was cancelled because of rain.",
+    "A home battery stores solar electricity for the night.",
+]
+
+
+def test_textrank_picks_central_sentences_in_source_order():
+    text = " ".join(_ARTICLE)
+    summary = dr._textrank_summarize(text, max_sentences=3)
+    picked = [s for s in _ARTICLE if s in summary]
+    assert len(picked) == 3
+    # the off-topic sentences share no terms with the rest
+    assert not set(picked) & {_ARTICLE[1], _ARTICLE[3], _ARTICLE[5]}
+    # selected sentences come out in the order they appear in the text
+    assert summary == " ".join(picked)
+    assert dr._textrank_summarize(text, max_sentences=3) == summary      # deterministic
+
+
+def test_textrank_ranks_connected_sentences_first():
+    scores = dr._textrank_scores(_ARTICLE)
+    assert scores.shape == (len(_ARTICLE),)
+    assert scores[[0, 2, 4, 6]].min() > scores[[1, 3, 5]].max()
+
+
+def test_textrank_ties_keep_source_order():
+    # only stopwords: every score ties, the first sentences win
+    sentences = [f"It is what it was {i}." for i in range(8)]
+    summary = dr._textrank_summarize(" ".join(sentences), max_sentences=3)
+    assert summary == " ".join(sentences[:3])
+
+
+@pytest.mark.parametrize("text", ["", "   ", "Just one sentence here."])
+def test_textrank_short_input_is_returned_as_is(text):
+    assert dr._textrank_summarize(text, max_sentences=3) == text
+
+
+def test_textrank_scores_handle_one_and_no_sentences():
+    assert dr._textrank_scores([]).shape == (0,)
+    assert dr._textrank_scores(["Only one sentence here."]).tolist() == pytest.approx([0.15])
@@ -0,0 +1,18 @@
+# tests/test_lazy_import.py
+from core.lazy_import import lazy_import
+
+
+def test_truth_test_imports_and_caches():
+    proxy = lazy_import("json", "dumps")
+    assert not proxy.loaded
+    assert proxy
+    assert proxy.loaded
+    assert proxy({"a": 1}) == '{"a": 1}'
+
+
+def test_failed_import_is_false():
+    # found on disk but fails while importing: find_spec alone said True
+    proxy = lazy_import("json", "no_such_name")
+    assert not proxy
+    assert not proxy
+    assert not lazy_import("no_such_module_for_jarvis")
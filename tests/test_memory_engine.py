@@ -0,0 +1,88 @@
+# tests/test_memory_engine.py
+import threading
+
+import pytest
+
+
+def test_concurrent_mutations_lose_no_updates(mem):
+    threads, per_thread = 16, 200
+    mem.mutate(lambda d: d.update(counter=0, log=()))
+
+    def _bump(d, tid):
+        d["counter"] = d["counter"] + 1
+        d["log"] = d["log"] + (tid,)       # replaced, never mutated in place
+
+    def _worker(tid):
+        for i in range(per_thread):
+            # mix blocking and fire-and-forget writers
+            mem.mutate(lambda d: _bump(d, tid), wait=bool(i % 2))
+
+    seen = []
+    stop = threading.Event()
+
+    def _reader():
+        while not stop.is_set():
+            snap = mem.snapshot()
+            seen.append((snap.get("counter"), len(snap.get("log", ()))))
+
+    reader = threading.Thread(target=_reader)
+    reader.start()
+    workers = [threading.Thread(target=_worker, args=(t,)) for t in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    mem.flush()
+    stop.set()
+    reader.join()
+
+    snap = mem.snapshot()
+    assert snap["counter"] == threads * per_thread
+    assert len(snap["log"]) == threads * per_thread
+    assert all(snap["log"].count(t) == per_thread for t in range(threads))
+    # every snapshot a reader saw was internally consistent
+    assert all(c is None or c == n for c, n in seen)
+
+
+def test_failed_mutation_is_not_published(mem):
+    mem.mutate(lambda d: d.update(counter=1))
+
+    def _boom(d):
+        d["counter"] = 99
+        raise ValueError("nope")
+
+    with pytest.raises(ValueError):
+        mem.mutate(_boom)
+    assert mem.snapshot()["counter"] == 1
+
+
+@pytest.fixture
+def facts(mem):
+    for k, v in [("phone", "555 0101"), ("my laptop", "a grey thinkpad"),
+                 ("wifi password", "hunter2"), ("dentist", "tuesday at five")]:
+        mem.remember_fact(k, v)
+    return mem
+
+
+@pytest.mark.parametrize("query, key", [
+    ("my laptop", "my laptop"),
+    ("what is my laptop", "my laptop"),
+    ("laptop", "my laptop"),
+    ("wifi", "wifi password"),
+    ("thinkpad", "my laptop"),          # value token
+    ("what's the wiifi pasword", "wifi password"),   # typos
+])
+def test_find_fact_matches(facts, query, key):
+    assert facts.find_fact(query)[0] == key
+
+
+@pytest.mark.parametrize("query", [
+    "mom phone",          # a key hit must not stand in for an unmatched token
+    "laptop color",
+    "phone number",
+    "dentist wifi",       # tokens split across two facts
+    "mum phones",         # fuzzy path: "phones" snaps to "phone", "mum" to nothing
+])
+def test_find_fact_rejects_partial_matches(facts, query):
+    assert facts.find_fact(query) is None
+    assert facts.recall_fact(query) is None
@@ -0,0 +1,42 @@
+# tests/test_model_registry.py
+import pytest
+
+from core.model_registry import ModelRegistry
+
+
+def test_failed_load_is_not_retried_within_window():
+    calls = []
+
+    def _broken():
+        calls.append(1)
+        raise OSError("hub unreachable")
+
+    reg = ModelRegistry(retry_after=60)
+    reg.register("m", _broken)
+    for _ in range(3):
+        with pytest.raises(Exception):
+            reg.acquire("m")
+    assert len(calls) == 1
+    assert reg.stats()["m"]["failed"] and reg.stats()["m"]["refs"] == 0
+
+    # a new loader gets a fresh attempt
+    reg.register("m", lambda: "model")
+    with reg.use("m") as model:
+        assert model == "model"
+    assert not reg.stats()["m"]["failed"]
+
+
+def test_failed_load_retried_after_window():
+    calls = []
+
+    def _flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise OSError("first try fails")
+        return "model"
+
+    reg = ModelRegistry(retry_after=0)
+    reg.register("m", _flaky)
+    with pytest.raises(OSError):
+        reg.acquire("m")
+    assert reg.acquire("m") == "model"
@@ -0,0 +1,172 @@
+# tests/test_nlp_engine.py
+import json
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+import core.nlp_engine as nlp
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def test_queued_phrases_are_written_on_normal_exit(tmp_path):
+    # paths are relative to the working directory → run in a scratch dir
+    code = (
+        "import core.nlp_engine as nlp\n"
+        "for i in range(500):\n"
+        "    nlp.learn(f'phrase number {i} for the history')\n"
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, check=True, timeout=60)
+
+    with open(tmp_path / "config" / "nlp_history.txt", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 500
+    assert lines[-1] == "phrase number 499 for the history"
+
+
+# ---------------- Markov table ----------------
+def test_markov_counts_are_weighted():
+    m = nlp._MarkovModel()
+    for line in ["open the door", "open the door", "open the window", "open 42 files"]:
+        m.add_line(line)
+    open_id, the_id = m.vocab["open"], m.vocab["the"]
+    # one entry per distinct pair, not per occurrence; non-words skipped
+    assert m.counts[open_id] == {the_id: 3}
+    assert m.counts[the_id] == {m.vocab["door"]: 2, m.vocab["window"]: 1}
+    assert "open" in m and "door" not in m and "42" not in m.vocab
+
+    random.seed(3)
+    draws = [m.next_word("the") for _ in range(3000)]
+    assert 0.6 < draws.count("door") / len(draws) < 0.73      # ≈ 2/3
+    assert m.next_word("door") is None and m.next_word("missing") is None
+
+    # a later pair invalidates the cached cumulative table for its state
+    for _ in range(20):
+        m.add_pair("the", "roof")
+    assert "roof" in {m.next_word("the") for _ in range(200)}
+    assert m.random_word() in ("open", "the")
+
+
+def test_markov_state_round_trip():
+    m = nlp._build_markov(["jarvis open the door", "jarvis play the music", "the door opens"])
+    back = nlp._MarkovModel.from_state(json.loads(json.dumps(m.to_state())))
+    assert back.words == m.words and back.counts == m.counts
+    assert sorted(back._starts) == sorted(m._starts)
+    assert nlp._MarkovModel.from_state(nlp._MarkovModel().to_state()).counts == []
+
+
+# ---------------- writer / snapshot ----------------
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    nlp.flush()
+    monkeypatch.setattr(nlp, "HISTORY_PATH", str(tmp_path / "nlp_history.txt"))
+    monkeypatch.setattr(nlp, "SNAPSHOT_PATH", str(tmp_path / "nlp_model.json"))
+    monkeypatch.setattr(nlp, "_MARKOV", nlp._MarkovModel())
+    yield tmp_path
+    nlp.flush()
+
+
+def _write_history(lines, mode="w"):
+    with open(nlp.HISTORY_PATH, mode, encoding="utf-8") as f:
+        f.write("".join(line + "\n" for line in lines))
+
+
+@pytest.fixture
+def rebuilds(monkeypatch):
+    calls = []
+    real = nlp._build_markov
+
+    def _counting(history):
+        calls.append(1)
+        return real(history)
+    monkeypatch.setattr(nlp, "_build_markov", _counting)
+    return calls
+
+
+def test_writer_batches_appends_and_updates_model(files):
+    for i in range(300):
+        nlp.learn(f"please open window {i}")
+    nlp.learn("   ")                 # ignored
+    nlp.flush()
+    with open(nlp.HISTORY_PATH, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 300 and lines[0] == "please open window 0"
+    m = nlp._MARKOV
+    assert m.counts[m.vocab["please"]] == {m.vocab["open"]: 300}
+    assert nlp._markov_generate("please", length=3) == "Please open window"
+
+
+def test_snapshot_reused_and_tail_replayed(files, rebuilds):
+    _write_history(["the quick brown fox"] * 20)       # > 256 bytes
+    nlp._save_snapshot(nlp._build_markov(["the quick brown fox"] * 20))
+    rebuilds.clear()
+    _write_history(["the quick red fox"], mode="a")
+
+    m = nlp._load_model()
+    assert rebuilds == []
+    assert m.counts[m.vocab["quick"]] == {m.vocab["brown"]: 20, m.vocab["red"]: 1}
+
+
+def test_snapshot_of_short_history_survives_growth(files, rebuilds):
+    # snapshot taken while the file is under the 256-byte head: its hash
+    # covers the whole (short) file, and later appends change the first
+    # 256 bytes; that alone must not force a full rebuild
+    _write_history(["hello there jarvis"])
+    nlp._save_snapshot(nlp._build_markov(["hello there jarvis"]))
+    rebuilds.clear()
+    _write_history(["good morning jarvis"] * 30, mode="a")
+    assert os.path.getsize(nlp.HISTORY_PATH) > 256
+
+    m = nlp._load_model()
+    assert rebuilds == []
+    assert m.counts[m.vocab["hello"]] == {m.vocab["there"]: 1}
+    assert m.counts[m.vocab["morning"]] == {m.vocab["jarvis"]: 30}
+
+
+@pytest.mark.parametrize("history", [
+    ["a rotated history file"] * 20,        # head changed, file longer
+    ["short"],                              # file shrank below the snapshot
+])
+def test_rotated_history_forces_full_rebuild(files, rebuilds, history):
+    _write_history(["the quick brown fox"] * 20)
+    nlp._save_snapshot(nlp._build_markov(["the quick brown fox"] * 20))
+    rebuilds.clear()
+    _write_history(history)
+
+    m = nlp._load_model()
+    assert rebuilds == [1]
+    assert "quick" not in m
+    # the rebuild is persisted: the next start reuses it
+    rebuilds.clear()
+    nlp._load_model()
+    assert rebuilds == []
+
+
+def test_corrupt_snapshot_forces_full_rebuild(files, rebuilds):
+    _write_history(["open the door"])
+    with open(nlp.SNAPSHOT_PATH, "w", encoding="utf-8") as f:
+        f.write('{"version": 1, "words": [')
+    m = nlp._load_model()
+    assert rebuilds == [1] and "open" in m
+
+
+def test_history_rotation_keeps_learned_counts(files, monkeypatch, rebuilds):
+    monkeypatch.setattr(nlp, "HISTORY_MAX_BYTES", 4096)
+    for i in range(400):
+        nlp.learn(f"turn the volume up number {i}")
+    nlp.flush()
+    size = os.path.getsize(nlp.HISTORY_PATH)
+    assert size <= 4096
+    m = nlp._MARKOV
+    assert m.counts[m.vocab["turn"]] == {m.vocab["the"]: 400}
+
+    # rotation wrote a fresh snapshot: startup needs no rebuild and keeps
+    # the counts of lines that are no longer in the file
+    rebuilds.clear()
+    loaded = nlp._load_model()
+    assert rebuilds == []
+    assert loaded.counts[loaded.vocab["turn"]] == {loaded.vocab["the"]: 400}
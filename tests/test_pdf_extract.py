@@ -0,0 +1,92 @@
+# tests/test_pdf_extract.py
+import threading
+
+import pytest
+
+from core import pdf_extract
+
+
+def _write_pdf(path, page_texts):
+    """Minimal PDF, one Helvetica text line per page."""
+    n = len(page_texts)
+    objs = [b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [%s] /Count %d >>"
+            % (b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(n)), n),
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    for i, text in enumerate(page_texts):
+        stream = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode("latin-1")
+        objs.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                    b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i))
+        objs.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objs, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objs) + 1)
+    out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objs) + 1, xref)
+    with open(path, "wb") as f:
+        f.write(bytes(out))
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    def _make(pages):
+        path = str(tmp_path / f"doc{pages}.pdf")
+        _write_pdf(path, [f"page {i}" for i in range(pages)])
+        return path
+    yield _make
+    pdf_extract.shutdown()
+
+
+def test_parallel_extraction_keeps_page_order(pdf, monkeypatch):
+    monkeypatch.setattr(pdf_extract, "PARALLEL_MIN_PAGES", 4)
+    path = pdf(23)       # 23 pages over 6 uneven shards
+    pages = pdf_extract.extract_pages(path, workers=3)
+    assert [p.strip() for p in pages] == [f"page {i}" for i in range(23)]
+    # the last extraction released the shared pool
+    assert pdf_extract._POOL is None and pdf_extract._POOL_USERS == 0
+
+
+def test_small_file_stays_serial(pdf, monkeypatch):
+    def _no_pool(workers):
+        raise AssertionError("small PDFs must not start a pool")
+    monkeypatch.setattr(pdf_extract, "_get_pool", _no_pool)
+    path = pdf(5)
+    assert [p.strip() for p in pdf_extract.extract_pages(path, workers=4)] == [f"page {i}" for i in range(5)]
+    assert len(pdf_extract.extract_pages(pdf(pdf_extract.PARALLEL_MIN_PAGES + 1), workers=1)) == \
+        pdf_extract.PARALLEL_MIN_PAGES + 1
+
+
+def test_pool_failure_falls_back_to_serial(pdf, monkeypatch):
+    monkeypatch.setattr(pdf_extract, "PARALLEL_MIN_PAGES", 4)
+
+    class _Broken:
+        def submit(self, *a, **k):
+            raise RuntimeError("pool gone")
+
+    monkeypatch.setattr(pdf_extract, "_get_pool", lambda workers: _Broken())
+    monkeypatch.setattr(pdf_extract, "_release_pool", lambda: None)
+    path = pdf(8)
+    assert [p.strip() for p in pdf_extract.extract_pages(path, workers=2)] == [f"page {i}" for i in range(8)]
+
+
+def test_shared_pool_outlives_all_but_its_last_user(pdf, monkeypatch):
+    monkeypatch.setattr(pdf_extract, "PARALLEL_MIN_PAGES", 4)
+    first = pdf_extract._get_pool(2)
+    try:
+        # a concurrent document reuses the pool and leaves it running
+        results = []
+        t = threading.Thread(target=lambda: results.append(pdf_extract.extract_pages(pdf(12), workers=2)))
+        t.start()
+        t.join()
+        assert len(results[0]) == 12
+        assert pdf_extract._POOL is first and pdf_extract._POOL_USERS == 1
+        # a busy pool is not resized under its user
+        assert pdf_extract._get_pool(3) is first
+        pdf_extract._release_pool()
+    finally:
+        pdf_extract._release_pool()
+    assert pdf_extract._POOL is None
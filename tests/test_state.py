@@ -0,0 +1,100 @@
+# tests/test_state.py
+import threading
+
+import pytest
+
+from core import state
+from core.state import StateStore
+
+
+@pytest.fixture
+def store():
+    return StateStore({"MODE": (str, "active"), "COUNTER": (int, 0),
+                       "LAST_TOPIC": ((str, type(None)), None)})
+
+
+def test_writes_are_type_checked(store):
+    with pytest.raises(TypeError):
+        store.set("MODE", 1)
+    with pytest.raises(TypeError):
+        store.update(MODE="sleep", COUNTER="two")
+    with pytest.raises(TypeError):
+        store.compare_and_set("COUNTER", 0, None)
+    # a rejected update applies none of its fields
+    assert store.get("MODE") == "active" and store.version == 0
+    store.set("LAST_TOPIC", None)
+    store.set("LAST_TOPIC", "music")
+
+
+def test_module_attribute_writes_go_through_the_store():
+    with pytest.raises(TypeError):
+        state.MODE = 42
+    assert isinstance(state.MODE, str)
+    saved = state.LAST_TOPIC
+    before = state.store.version
+    try:
+        state.LAST_TOPIC = "test-topic"
+        assert state.get("LAST_TOPIC") == "test-topic"
+        assert state.store.version == before + 1
+    finally:
+        state.LAST_TOPIC = saved
+
+
+def test_version_bumps(store):
+    assert store.set("MODE", "sleep") == 1
+    assert store.set("MODE", "sleep") == 1          # no change, no bump
+    assert store.update(MODE="active", COUNTER=3) == 2   # one bump per update
+    assert store.update(MODE="active") == 2
+    assert store.compare_and_set("COUNTER", 3, 4) and store.version == 3
+    assert not store.compare_and_set("COUNTER", 3, 5) and store.version == 3
+    assert store.snapshot() == (3, {"MODE": "active", "COUNTER": 4, "LAST_TOPIC": None})
+
+
+def test_exactly_one_cas_winner(store):
+    threads = 16
+    barrier = threading.Barrier(threads)
+    winners = []
+
+    def _race(tid):
+        barrier.wait()
+        if store.compare_and_set("COUNTER", 0, tid + 1):
+            winners.append(tid)
+
+    workers = [threading.Thread(target=_race, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert len(winners) == 1
+    assert store.get("COUNTER") == winners[0] + 1
+    assert store.version == 1
+
+
+def test_subscribers_and_unsubscribe(store):
+    seen, any_seen = [], []
+    unsubscribe = store.subscribe("MODE", lambda *a: seen.append(a))
+    store.subscribe("*", lambda name, old, new, version: any_seen.append(name))
+    store.subscribe("MODE", lambda *a: 1 / 0)        # a failing callback is isolated
+
+    store.set("MODE", "sleep")
+    store.set("MODE", "sleep")                       # unchanged: not delivered
+    store.update(MODE="active", COUNTER=1)
+    store.compare_and_set("MODE", "active", "processing")
+    assert seen == [("MODE", "active", "sleep", 1), ("MODE", "sleep", "active", 2),
+                    ("MODE", "active", "processing", 3)]
+    assert any_seen == ["MODE", "MODE", "COUNTER", "MODE"]
+
+    unsubscribe()
+    unsubscribe()                                    # idempotent
+    store.set("MODE", "sleep")
+    assert len(seen) == 3 and len(any_seen) == 5
+
+
+def test_wait_for_wakes_on_change(store):
+    result = []
+    t = threading.Thread(target=lambda: result.append(store.wait_for("MODE", lambda m: m == "sleep", 5)))
+    t.start()
+    store.set("MODE", "sleep")
+    t.join(5)
+    assert result == ["sleep"]
+    assert store.wait_for("MODE", lambda m: m == "active", 0.01) is None
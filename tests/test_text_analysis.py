@@ -0,0 +1,62 @@
+# tests/test_text_analysis.py
+import pytest
+
+import core.text_analysis as text_analysis
+from core.brain import brain
+from core.conversation_core import JarvisConversation
+
+PHRASES = [
+    "I don't feel good",
+    "I do not feel good",
+    "I don't like it",
+    "not happy at all",
+    "i can't stop being sad",
+    "stressed out",
+    "I am so stressed about exams",
+    "machine learning is great",
+    "tell me about smart contract security",
+    "hand gesture recognition project",
+    "I hate deep learning",
+    "feeling low and lonely",
+    "the slow follow below",
+    "goodbye jarvis",
+    "",
+]
+
+
+@pytest.fixture(scope="module")
+def batch():
+    return text_analysis.TextAnalyzer().analyze(PHRASES)
+
+
+@pytest.mark.parametrize("text", ["I don't like it", "i can't do this", "that is not it", "never again", "no"])
+def test_negation_includes_contractions(text):
+    assert set(text_analysis.terms(text)) & set(text_analysis.NEGATIONS)
+
+
+@pytest.mark.parametrize("text", ["I know it", "nothing new", "the notes"])
+def test_negation_ignores_lookalikes(text):
+    assert not set(text_analysis.terms(text)) & set(text_analysis.NEGATIONS)
+
+
+def test_batch_matches_live_scorers(batch, mem):
+    conv = JarvisConversation()
+    for i, text in enumerate(PHRASES):
+        assert batch["mood"][i] == conv._estimate_sentiment(text), text
+        assert batch["emotion"][i] == brain.detect_text_emotion(text), text
+        assert batch["topic"][i] == conv._detect_topic(text), text
+        if text:
+            mem.update_mood_from_text(text)
+            mem.flush()
+            assert batch["memory_mood"][i] == mem.get_mood(), text
+
+
+def test_negation_and_phrases(batch):
+    out = dict(zip(PHRASES, zip(batch["mood"], batch["emotion"], batch["topic"])))
+    assert out["I don't feel good"][0] == out["I do not feel good"][0] == "neutral"
+    assert out["stressed out"][1] == "alert"
+    assert out["machine learning is great"][2] == "ai"
+    assert out["tell me about smart contract security"][2] == "blockchain"
+    # whole words only: "low" in "slow"/"below", "good" in "goodbye"
+    assert out["the slow follow below"][1] == "neutral"
+    assert batch["memory_mood"][PHRASES.index("goodbye jarvis")] == "neutral"
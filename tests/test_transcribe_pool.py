@@ -0,0 +1,81 @@
+# tests/test_transcribe_pool.py
+import os
+import time
+
+import numpy as np
+import pytest
+
+from core import transcribe_pool as tp
+from core.model_registry import model_registry
+
+
+def _segments(n):
+    return [(i * 1000, i * 1000 + 500, np.zeros(160, dtype=np.int16), 16000) for i in range(n)]
+
+
+def _no_model(model_name):
+    pass
+
+
+def _die_once(job):
+    # the first call kills its worker process; the rebuilt pool succeeds
+    marker = os.environ["JARVIS_TEST_MARKER"]
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    index, start_ms, end_ms, _, _ = job
+    return index, start_ms, end_ms, f"seg{index}"
+
+
+def _always_die(job):
+    os._exit(1)
+
+
+def _echo(job):
+    index, start_ms, end_ms, _, _ = job
+    return index, start_ms, end_ms, f"seg{index}"
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(tp, "_init_whisper_worker", _no_model)
+    tp.shutdown()
+    yield tp
+    tp.shutdown()
+
+
+def test_broken_pool_is_rebuilt_once(pool, monkeypatch, tmp_path):
+    monkeypatch.setenv("JARVIS_TEST_MARKER", str(tmp_path / "died"))
+    out = pool.transcribe_segments(_segments(6), "whisper-test", workers=2, job_fn=_die_once)
+    assert [s["text"] for s in out] == [f"seg{i}" for i in range(6)]
+
+
+def test_pool_that_keeps_breaking_raises(pool):
+    with pytest.raises(tp.BrokenProcessPool):
+        pool.transcribe_segments(_segments(3), "whisper-test", workers=1, job_fn=_always_die)
+
+
+def test_whisper_failure_falls_back_to_network_stt(monkeypatch):
+    class _Broken:
+        def transcribe(self, audio, language=None):
+            raise RuntimeError("no model")
+
+    monkeypatch.setattr(tp, "_WORKER_MODEL", _Broken())
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(tp, "_google_segment", lambda job: (job[0], job[1], job[2], "from google"))
+    assert tp._whisper_segment((0, 0, 500, b"\0\0" * 160, 16000))[3] == "from google"
+
+
+def test_idle_pool_shuts_down(pool, monkeypatch):
+    monkeypatch.setattr(tp, "POOL_IDLE_TIMEOUT", 0.1)
+    out = pool.transcribe_segments(_segments(3), "google", workers=2, job_fn=_echo)
+    assert len(out) == 3 and tp._POOL is not None
+    time.sleep(0.4)
+    assert tp._POOL is None
+
+
+def test_whisper_workers_capped_by_registry(monkeypatch):
+    monkeypatch.setattr(model_registry, "max_mb", 2000.0)
+    assert tp.whisper_workers(4, "small") == 2
+    assert tp.whisper_workers(4, "large") == 1
+    assert tp.whisper_workers(2, "tiny") == 2
@@ -0,0 +1,105 @@
+# tests/test_vector_memory.py
+import builtins
+import os
+
+import pytest
+
+from core import vector_memory as vm
+from core.vector_memory import VectorMemory
+
+ROW = vm._DIM * 4
+
+
+@pytest.fixture
+def store(tmp_path):
+    return VectorMemory(folder=str(tmp_path / "vm"), compact_every=1000)
+
+
+def _fill(store):
+    store.add_exchange("what is the capital of france", "Paris")
+    store.add_exchange("play some relaxing jazz music", "Playing jazz")
+    store.add_exchange("remind me to call the dentist tomorrow", "Reminder set")
+
+
+def test_add_and_search_round_trip(store):
+    _fill(store)
+    hits = store.search("play jazz", k=2)
+    assert hits[0]["user"] == "play some relaxing jazz music"
+    assert hits[0]["jarvis"] == "Playing jazz"
+    assert hits[0]["score"] >= max(h["score"] for h in hits)
+    assert store.search("quantum chromodynamics") == []
+
+    # reloaded from disk: same rows, same answers
+    again = VectorMemory(folder=store.folder)
+    assert again.count() == 3
+    assert again.search("dentist", k=1)[0]["user"] == "remind me to call the dentist tomorrow"
+    assert os.path.getsize(store.vectors_path) == 3 * ROW
+
+
+def test_compaction_drops_duplicates_and_trims(tmp_path):
+    store = VectorMemory(folder=str(tmp_path / "vm"), max_entries=3, compact_every=1000)
+    store.add_exchange("play jazz", "ok")
+    store.add_exchange("what time is it", "noon")
+    store.add_exchange("Play Jazz", "OK")           # duplicate (case-insensitive)
+    store.add_exchange("open notepad", "opening")
+    store.add_exchange("weather in delhi", "sunny")
+    store.compact()
+    users = [e["user"] for e in store._entries]
+    # newest copy of the duplicate kept, oldest rows trimmed to max_entries
+    assert users == ["Play Jazz", "open notepad", "weather in delhi"]
+    assert os.path.getsize(store.vectors_path) == 3 * ROW
+    # rows still line up with their entries after the rewrite
+    assert store.search("weather delhi", k=1)[0]["user"] == "weather in delhi"
+    assert store.search("jazz", k=1)[0]["user"] == "Play Jazz"
+
+
+def test_compaction_runs_every_n_appends(tmp_path):
+    store = VectorMemory(folder=str(tmp_path / "vm"), compact_every=4)
+    for _ in range(4):
+        store.add_exchange("same question", "same answer")
+    assert store.count() == 1
+
+
+def test_torn_tail_is_repaired_on_load(store):
+    _fill(store)
+    # crash mid-append: half a vector row and a torn JSON line
+    with open(store.vectors_path, "ab") as f:
+        f.write(b"\0" * (ROW // 2))
+    with open(store.entries_path, "a", encoding="utf-8") as f:
+        f.write('{"user": "half wri')
+    again = VectorMemory(folder=store.folder)
+    assert again.count() == 3
+    assert os.path.getsize(again.vectors_path) == 3 * ROW
+    assert again.search("capital france", k=1)[0]["jarvis"] == "Paris"
+    # appends after the repair stay row-aligned
+    again.add_exchange("set a timer for ten minutes", "Timer set")
+    assert again.search("timer ten minutes", k=1)[0]["jarvis"] == "Timer set"
+    assert VectorMemory(folder=store.folder).count() == 4
+    store = again
+
+    # a whole extra row without its entry is dropped too
+    with open(store.vectors_path, "ab") as f:
+        f.write(b"\0" * ROW)
+    assert VectorMemory(folder=store.folder).count() == 4
+    assert os.path.getsize(store.vectors_path) == 4 * ROW
+
+
+def test_failed_append_leaves_no_orphan_row(store, monkeypatch):
+    _fill(store)
+    real_open = builtins.open
+
+    def _fail_entries(path, *args, **kwargs):
+        if path == store.entries_path and "a" in (args[0] if args else kwargs.get("mode", "r")):
+            raise OSError("disk full")
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", _fail_entries)
+    store.add_exchange("how tall is mount everest", "8849 metres")
+    monkeypatch.setattr(builtins, "open", real_open)
+
+    assert store.count() == 3
+    assert os.path.getsize(store.vectors_path) == 3 * ROW
+    # the next exchange maps onto its own vector, not the failed one
+    store.add_exchange("turn the volume down", "Volume lowered")
+    assert store.search("volume down", k=1)[0]["user"] == "turn the volume down"
+    assert store.search("everest") == []